@@ -0,0 +1,127 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from labtiming import measure_ms
+from Matrix import matrix_multiply_numpy
+
+INT64_LIMIT = 2**63
+
+
+def needs_exact(A, B):
+    """True if a product of A and B could leave the int64 range"""
+    if A.dtype == object or B.dtype == object:
+        return True
+    if not (np.issubdtype(A.dtype, np.integer) and np.issubdtype(B.dtype, np.integer)):
+        return False
+    if A.size == 0 or B.size == 0:
+        return False
+    max_a = max(abs(int(A.min())), abs(int(A.max())))
+    max_b = max(abs(int(B.min())), abs(int(B.max())))
+    return A.shape[-1] * max_a * max_b >= INT64_LIMIT
+
+
+def matrix_multiply_batched(A, B):
+    """
+    Multiply two (batch, n, n) stacks pairwise with a single vectorized np.matmul.
+    Integer stacks whose products could overflow int64 go through object arrays,
+    which keeps Python's exact big integers.
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    if needs_exact(A, B):
+        return np.matmul(A.astype(object), B.astype(object))
+    return np.matmul(A, B)
+
+
+def matrix_multiply_batched_einsum(A, B):
+    """Same as matrix_multiply_batched for fixed-width dtypes, through einsum"""
+    return np.einsum("bij,bjk->bik", A, B)
+
+
+def fibonacci_q_powers(exponents):
+    """
+    Stack of Q^k = [[F(k+1), F(k)], [F(k), F(k-1)]] for every k in exponents,
+    computed by batched square-and-multiply. Switches to exact integers before F(k) leaves int64.
+    Raises ValueError on a negative exponent.
+    """
+    exponents = np.asarray(exponents, dtype=np.int64)
+    batch = len(exponents)
+    if batch > 0 and int(exponents.min()) < 0:
+        raise ValueError("exponents must be non-negative")
+    exact = batch > 0 and int(exponents.max()) > 90
+    dtype = object if exact else np.int64
+
+    result = np.zeros((batch, 2, 2), dtype=dtype)
+    result[:, 0, 0] = 1
+    result[:, 1, 1] = 1
+    base = np.empty((batch, 2, 2), dtype=dtype)
+    base[:] = [[1, 1], [1, 0]]
+
+    remaining = exponents.copy()
+    while remaining.any():
+        odd = (remaining & 1).astype(bool)
+        if odd.any():
+            result[odd] = np.matmul(result[odd], base[odd])
+        remaining >>= 1
+        active = remaining > 0
+        base[active] = np.matmul(base[active], base[active])
+    return result
+
+
+def multiply_pairs_loop(A, B):
+    return [matrix_multiply_numpy(A[b], B[b]) for b in range(len(A))]
+
+
+def performance():
+    matrix_sizes = [2, 8, 32]
+    batch_sizes = [1, 10, 100, 1000, 5000]
+    loop_times = {n: [] for n in matrix_sizes}
+    batched_times = {n: [] for n in matrix_sizes}
+    einsum_times = {n: [] for n in matrix_sizes}
+    header = "n   batch   loop(ms)  matmul(ms)  einsum(ms)  speedup"
+    print("\n=== BATCHED SMALL-MATRIX MULTIPLICATION (median per call) ===")
+    print(header)
+    print("-" * len(header))
+
+    for n in matrix_sizes:
+        for batch in batch_sizes:
+            A = np.random.randint(1, 10, size=(batch, n, n))
+            B = np.random.randint(1, 10, size=(batch, n, n))
+            loop_ms = measure_ms(multiply_pairs_loop, lambda: (A, B))
+            batched_ms = measure_ms(matrix_multiply_batched, lambda: (A, B))
+            einsum_ms = measure_ms(matrix_multiply_batched_einsum, lambda: (A, B))
+            print(f"{n:<3} {batch:<6} {loop_ms:>9.3f}  {batched_ms:>10.3f}  {einsum_ms:>10.3f}"
+                  f"  {loop_ms / batched_ms:>6.1f}x")
+            loop_times[n].append(loop_ms)
+            batched_times[n].append(batched_ms)
+            einsum_times[n].append(einsum_ms)
+
+    print("\n=== FIBONACCI Q-MATRIX POWER STACKS ===")
+    for count, top in [(1000, 90), (1000, 1000)]:
+        exponents = np.random.randint(1, top + 1, size=count)
+        powers = fibonacci_q_powers(exponents)
+        elapsed = measure_ms(fibonacci_q_powers, lambda: (exponents,))
+        print(f"{count} powers with k <= {top:<5} {elapsed:>8.3f} ms"
+              f"  (F({exponents[0]}) = {powers[0, 0, 1]})")
+
+    fig, axes = plt.subplots(1, len(matrix_sizes), figsize=(15, 5))
+    for ax, n in zip(axes, matrix_sizes):
+        ax.plot(batch_sizes, loop_times[n], marker="o", linestyle="-", color="r",
+            label="Per-pair matrix_multiply_numpy")
+        ax.plot(batch_sizes, batched_times[n], marker="s", linestyle="-", color="g",
+            label="Batched np.matmul")
+        ax.plot(batch_sizes, einsum_times[n], marker="^", linestyle="--", color="b",
+            label="Batched einsum")
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_title(f"{n}x{n} matrices")
+        ax.set_xlabel("Batch size")
+        ax.set_ylabel("Execution Time (ms) - Log Scale")
+        ax.legend()
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
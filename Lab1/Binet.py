@@ -1,6 +1,6 @@
-import time
 import matplotlib.pyplot as plt
 import math
+from labtiming import measure, STATS_HEADER, format_stats
 
 def fibonacci_binet(n):
     phi = (1 + math.sqrt(5)) / 2
@@ -8,26 +8,16 @@ def fibonacci_binet(n):
     return round((phi**n - phi1**n) / math.sqrt(5))
 def performance():
     test_numbers = [5, 10, 15, 20, 25, 30, 35, 40, 50, 100, 500, 1000]
-    repeats = 3
     binet_times = []
-    header = "n  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
+    header = "n     " + STATS_HEADER
     print("\n=== BINET FORMULA METHOD ===")
     print(header)
     print("-" * len(header))
     
     for number in test_numbers:
-        binet_execs = []
-        
-        for _ in range(repeats):
-            start = time.perf_counter()
-            fibonacci_binet(number)
-            end = time.perf_counter()
-            binet_execs.append((end - start) * 1000)
-        
-        avg_time = sum(binet_execs) / repeats
-        row = f"{number:<5} " + "  ".join(f"{t:>8.3f}" for t in binet_execs) + f"  {avg_time:>8.3f}"
-        print(row)
-        binet_times.append(avg_time)
+        stats = measure(fibonacci_binet, lambda: (number,))
+        print(f"{number:<5} " + format_stats(stats))
+        binet_times.append(stats["median"])
     
     # Create plots
     fig, ax = plt.subplots(figsize=(10, 6))
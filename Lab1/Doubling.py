@@ -1,5 +1,5 @@
-import time
 import matplotlib.pyplot as plt
+from labtiming import measure, STATS_HEADER, format_stats
 
 def fibonacci_fast_doubling(n):
     if n == 0:
@@ -36,48 +36,28 @@ def fibonacci_iterative(n):
 
 def performance():
     test_numbers = [10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
-    repeats = 3
-    
     fast_doubling_times = []
     iterative_times = []
     
-    header = "n     " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
+    header = "n      " + STATS_HEADER
     
     print("Fast Doubling O(log n)")
     print(header)
     print("-" * len(header))
     
     for number in test_numbers:
-        execs = []
-        
-        for _ in range(repeats):
-            start = time.perf_counter()
-            fibonacci_fast_doubling(number)
-            end = time.perf_counter()
-            execs.append((end - start) * 1000)
-        
-        avg_time = sum(execs) / repeats
-        row = f"{number:<6} " + "  ".join(f"{t:>8.3f}" for t in execs) + f"  {avg_time:>8.3f}"
-        print(row)
-        fast_doubling_times.append(avg_time)
+        stats = measure(fibonacci_fast_doubling, lambda: (number,))
+        print(f"{number:<6} " + format_stats(stats))
+        fast_doubling_times.append(stats["median"])
     
     print("\nIterative O(n)")
     print(header)
     print("-" * len(header))
     
     for number in test_numbers:
-        execs = []
-        
-        for _ in range(repeats):
-            start = time.perf_counter()
-            fibonacci_iterative(number)
-            end = time.perf_counter()
-            execs.append((end - start) * 1000)
-        
-        avg_time = sum(execs) / repeats
-        row = f"{number:<6} " + "  ".join(f"{t:>8.3f}" for t in execs) + f"  {avg_time:>8.3f}"
-        print(row)
-        iterative_times.append(avg_time)
+        stats = measure(fibonacci_iterative, lambda: (number,))
+        print(f"{number:<6} " + format_stats(stats))
+        iterative_times.append(stats["median"])
     
     plt.figure(figsize=(10, 6))
     
@@ -97,7 +77,7 @@ def performance():
         color="b",
         label="Iterative O(n)",
     )
-    plt.title("Fibonacci Performance Comparison (Average of 3 runs)")
+    plt.title("Fibonacci Performance Comparison (median)")
     plt.xlabel("n")
     plt.ylabel("Execution Time (ms)")
     plt.legend()
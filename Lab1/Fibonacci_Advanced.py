@@ -1,5 +1,5 @@
-import time
 import matplotlib.pyplot as plt
+from labtiming import measure, STATS_HEADER, format_stats
 
 
 def fibonacci_fib11(n):
@@ -96,66 +96,24 @@ def fibonacci_fast_doubling(n):
 
 def performance():
     test_numbers = [5, 10, 15, 20, 25, 30, 50, 100, 500, 1000, 5000, 10000]
-    repeats = 3
-    
     fib11_times = []
     fast_doubling_times = []
     iterative_times = []
     
-    header = "n  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
-    print("\n=== FIB11 (FAST RECURSIVE FORMULA) O(log n) ===")
-    print(header)
-    print("-" * len(header))
-    
-    for number in test_numbers:
-        fib11_execs = []
-        
-        for _ in range(repeats):
-            start = time.perf_counter()
-            fibonacci_fib11(number)
-            end = time.perf_counter()
-            fib11_execs.append((end - start) * 1000)
-        
-        avg_time = sum(fib11_execs) / repeats
-        row = f"{number:<5} " + "  ".join(f"{t:>8.3f}" for t in fib11_execs) + f"  {avg_time:>8.3f}"
-        print(row)
-        fib11_times.append(avg_time)
-    
-    print("\n=== FAST DOUBLING O(log n) ===")
-    print(header)
-    print("-" * len(header))
-    
-    for number in test_numbers:
-        fast_doubling_execs = []
-        
-        for _ in range(repeats):
-            start = time.perf_counter()
-            fibonacci_fast_doubling(number)
-            end = time.perf_counter()
-            fast_doubling_execs.append((end - start) * 1000)
-        
-        avg_time = sum(fast_doubling_execs) / repeats
-        row = f"{number:<5} " + "  ".join(f"{t:>8.3f}" for t in fast_doubling_execs) + f"  {avg_time:>8.3f}"
-        print(row)
-        fast_doubling_times.append(avg_time)
-    
-    print("\n=== ITERATIVE FIBONACCI O(n) ===")
-    print(header)
-    print("-" * len(header))
-    
-    for number in test_numbers:
-        iterative_execs = []
-        
-        for _ in range(repeats):
-            start = time.perf_counter()
-            fibonacci_iterative(number)
-            end = time.perf_counter()
-            iterative_execs.append((end - start) * 1000)
-        
-        avg_time = sum(iterative_execs) / repeats
-        row = f"{number:<5} " + "  ".join(f"{t:>8.3f}" for t in iterative_execs) + f"  {avg_time:>8.3f}"
-        print(row)
-        iterative_times.append(avg_time)
+    header = "n     " + STATS_HEADER
+    methods = [
+        ("FIB11 (FAST RECURSIVE FORMULA) O(log n)", fibonacci_fib11, fib11_times),
+        ("FAST DOUBLING O(log n)", fibonacci_fast_doubling, fast_doubling_times),
+        ("ITERATIVE FIBONACCI O(n)", fibonacci_iterative, iterative_times),
+    ]
+    for title, func, times in methods:
+        print(f"\n=== {title} ===")
+        print(header)
+        print("-" * len(header))
+        for number in test_numbers:
+            stats = measure(func, lambda: (number,))
+            print(f"{number:<5} " + format_stats(stats))
+            times.append(stats["median"])
     
     # Create plots
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
@@ -0,0 +1,194 @@
+import math
+import matplotlib.pyplot as plt
+import numpy as np
+from labtiming import measure, STATS_HEADER, format_stats
+from Matrix import matrix_multiply_numpy, generate_random_matrix
+
+
+def generate_random_boolean_matrix(n, density=0.5):
+    return [[1 if np.random.random() < density else 0 for _ in range(n)] for _ in range(n)]
+
+
+def pack_rows(M):
+    """Pack each 0/1 row into a Python int (bit j = column j)"""
+    packed = []
+    for row in M:
+        bits = 0
+        for j, v in enumerate(row):
+            if v:
+                bits |= 1 << j
+        packed.append(bits)
+    return packed
+
+
+def unpack_rows(packed, n_cols):
+    return [[(bits >> j) & 1 for j in range(n_cols)] for bits in packed]
+
+
+def four_russians_packed(A_rows, B_rows, t):
+    """
+    Method of Four Russians on rows packed into Python ints.
+    B's rows are taken t at a time; for every group a table holding the OR of
+    all 2^t row combinations is built, so each row of C needs one lookup per group.
+    """
+    m = len(B_rows)
+    C = [0] * len(A_rows)
+    for g in range(0, m, t):
+        width = min(t, m - g)
+        mask = (1 << width) - 1
+        table = [0] * (1 << width)
+        for k in range(1, 1 << width):
+            low = k & -k
+            table[k] = table[k ^ low] | B_rows[g + low.bit_length() - 1]
+        for i, a in enumerate(A_rows):
+            idx = (a >> g) & mask
+            if idx:
+                C[i] |= table[idx]
+    return C
+
+
+def boolean_multiply_four_russians(A, B, t=None):
+    """Boolean product A*B (OR of ANDs) using Python int bit rows - O(n^3 / log n)"""
+    m = len(B)
+    if t is None:
+        t = max(1, min(8, int(math.log2(m)) if m > 1 else 1))
+    C = four_russians_packed(pack_rows(A), pack_rows(B), t)
+    return unpack_rows(C, len(B[0]) if B else 0)
+
+
+def boolean_multiply_four_russians_numpy(A, B, t=8):
+    """Boolean product A*B with rows packed into uint64 words and vectorized table lookups"""
+    A = np.asarray(A, dtype=bool)
+    B = np.asarray(B, dtype=bool)
+    n, m = A.shape
+    p = B.shape[1]
+    words = (p + 63) // 64
+
+    packed = np.packbits(B, axis=1, bitorder="little")
+    B_words = np.zeros((m, words * 8), dtype=np.uint8)
+    B_words[:, :packed.shape[1]] = packed
+    B_words = B_words.view("<u8")
+
+    # table indices for every (row of A, group of t columns) at once
+    groups = (m + t - 1) // t
+    A_pad = np.zeros((n, groups * t), dtype=np.intp)
+    A_pad[:, :m] = A
+    weights = 1 << np.arange(t, dtype=np.intp)
+    indices = A_pad.reshape(n, groups, t) @ weights
+
+    C = np.zeros((n, words), dtype="<u8")
+    for g in range(groups):
+        start = g * t
+        width = min(t, m - start)
+        table = np.zeros((1 << width, words), dtype="<u8")
+        for b in range(width):
+            step = 1 << b
+            table[step:2 * step] = table[:step] | B_words[start + b]
+        C |= table[indices[:, g]]
+
+    return np.unpackbits(C.view(np.uint8), axis=1, bitorder="little", count=p).astype(bool)
+
+
+def pack_small_int(M):
+    """Store an integer matrix in the narrowest of int8/int16 that holds it (int64 otherwise)"""
+    M = np.asarray(M)
+    lo, hi = (int(M.min()), int(M.max())) if M.size else (0, 0)
+    for dtype in (np.int8, np.int16):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return M.astype(dtype)
+    return M.astype(np.int64)
+
+
+def small_int_multiply(A, B):
+    """
+    Integer product of small-valued matrices stored as int8/int16.
+    The accumulator is chosen from the worst-case bound n * max|a| * max|b|:
+    float BLAS is exact while every partial sum stays below 2^24 (float32) or 2^53 (float64),
+    wider bounds fall back to int64 and finally to exact Python ints.
+    """
+    A_small = pack_small_int(A)
+    B_small = pack_small_int(B)
+    inner = A_small.shape[1]
+    max_a = int(np.abs(A_small.astype(np.int64)).max()) if A_small.size else 0
+    max_b = int(np.abs(B_small.astype(np.int64)).max()) if B_small.size else 0
+    bound = inner * max_a * max_b
+    out_dtype = np.int32 if bound < 2**31 else np.int64
+
+    if bound < 2**24:
+        return np.matmul(A_small.astype(np.float32), B_small.astype(np.float32)).astype(out_dtype)
+    if bound < 2**53:
+        return np.matmul(A_small.astype(np.float64), B_small.astype(np.float64)).astype(out_dtype)
+    if bound < 2**63:
+        return np.matmul(A_small, B_small, dtype=np.int64)
+    return np.matmul(A_small.astype(object), B_small.astype(object))
+
+
+def performance():
+    test_sizes = [64, 128, 256, 512]
+    numpy_bool_times = []
+    russians_times = []
+    russians_np_times = []
+    numpy_int_times = []
+    small_int_times = []
+    header = "size " + STATS_HEADER
+
+    def report(title, size, func, args, store):
+        stats = measure(func, lambda: args)
+        print(f"{title:<22} {size:<4} " + format_stats(stats))
+        store.append(stats["median"])
+
+    print("\n=== BOOLEAN & SMALL-INTEGER MATRIX MULTIPLICATION ===")
+    print(f"{'method':<22} " + header)
+    print("-" * (len(header) + 23))
+
+    for size in test_sizes:
+        A = generate_random_boolean_matrix(size)
+        B = generate_random_boolean_matrix(size)
+        A_np = np.array(A)
+        B_np = np.array(B)
+        expected = matrix_multiply_numpy(A_np, B_np) > 0
+        assert np.array_equal(boolean_multiply_four_russians_numpy(A_np, B_np), expected)
+
+        A_int = np.array(generate_random_matrix(size))
+        B_int = np.array(generate_random_matrix(size))
+
+        report("NumPy (bool as int64)", size, lambda: matrix_multiply_numpy(A_np, B_np) > 0, (),
+               numpy_bool_times)
+        report("Four Russians (int)", size, boolean_multiply_four_russians, (A, B), russians_times)
+        report("Four Russians (uint64)", size, boolean_multiply_four_russians_numpy, (A_np, B_np),
+               russians_np_times)
+        report("NumPy (int64 1-9)", size, matrix_multiply_numpy, (A_int, B_int), numpy_int_times)
+        report("Packed int8 + BLAS", size, small_int_multiply, (A_int, B_int), small_int_times)
+
+    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+
+    axes[0].plot(test_sizes, numpy_bool_times, marker="s", linestyle="-", color="g",
+        label="NumPy (int64)")
+    axes[0].plot(test_sizes, russians_times, marker="o", linestyle="-", color="r",
+        label="Four Russians (Python int rows)")
+    axes[0].plot(test_sizes, russians_np_times, marker="^", linestyle="-", color="b",
+        label="Four Russians (uint64 words)")
+    axes[0].set_yscale("log")
+    axes[0].set_title("Boolean Matrix Multiplication")
+    axes[0].set_xlabel("Matrix Size (n x n)")
+    axes[0].set_ylabel("Execution Time (ms) - Log Scale")
+    axes[0].legend()
+    axes[0].grid(True)
+
+    axes[1].plot(test_sizes, numpy_int_times, marker="s", linestyle="-", color="g",
+        label="NumPy (int64)")
+    axes[1].plot(test_sizes, small_int_times, marker="D", linestyle="-", color="m",
+        label="Packed int8 + exact float BLAS")
+    axes[1].set_title("Small-Integer Matrix Multiplication (entries 1-9)")
+    axes[1].set_xlabel("Matrix Size (n x n)")
+    axes[1].set_ylabel("Execution Time (ms)")
+    axes[1].legend()
+    axes[1].grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
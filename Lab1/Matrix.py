@@ -1,6 +1,6 @@
-import time
 import matplotlib.pyplot as plt
 import numpy as np
+from labtiming import measure, STATS_HEADER, format_stats
 
 def matrix_multiply_naive(A, B):
     n = len(A)
@@ -25,41 +25,25 @@ def generate_random_matrix(n):
     return [[np.random.randint(1, 10) for _ in range(n)] for _ in range(n)]
 def performance():
     test_sizes = [64, 128, 256, 512]
-    repeats = 3
     naive_times = []
     numpy_times = []
-    header = "size  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
+    header = "size " + STATS_HEADER
     print(header)
     print("-" * len(header))
     
     for size in test_sizes:
-        naive_execs = []
-        numpy_execs = []
-        for _ in range(repeats):
-            # Generate random matrices
-            A = generate_random_matrix(size)
-            B = generate_random_matrix(size)
-            A_np = np.array(A)
-            B_np = np.array(B)
-            
-            # Test naive method
-            start = time.perf_counter()
-            matrix_multiply_naive(A, B)
-            end = time.perf_counter()
-            naive_execs.append((end - start) * 1000)
-            
-            # Test NumPy method
-            start = time.perf_counter()
-            matrix_multiply_numpy(A_np, B_np)
-            end = time.perf_counter()
-            numpy_execs.append((end - start) * 1000)
+        # Generate random matrices
+        A = generate_random_matrix(size)
+        B = generate_random_matrix(size)
+        A_np = np.array(A)
+        B_np = np.array(B)
         
-        avg_time = sum(naive_execs) / repeats
-        row = f"{size:<4} " + "  ".join(f"{t:>8.3f}" for t in naive_execs) + f"  {avg_time:>8.3f}"
-        print(row)
+        naive = measure(matrix_multiply_naive, lambda: (A, B))
+        numpy_stats = measure(matrix_multiply_numpy, lambda: (A_np, B_np))
+        print(f"{size:<4} " + format_stats(naive))
         
-        naive_times.append(avg_time)
-        numpy_times.append(sum(numpy_execs) / repeats)
+        naive_times.append(naive["median"])
+        numpy_times.append(numpy_stats["median"])
     
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
     
@@ -79,7 +63,7 @@ def performance():
         color="g",
         label="NumPy Optimized",
     )
-    axes[0].set_title("Matrix Multiplication Performance (Average of 3 runs)")
+    axes[0].set_title("Matrix Multiplication Performance (median)")
     axes[0].set_xlabel("Matrix Size (n x n)")
     axes[0].set_ylabel("Execution Time (ms)")
     axes[0].legend()
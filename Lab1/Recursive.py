@@ -1,5 +1,5 @@
-import time
 import matplotlib.pyplot as plt
+from labtiming import measure, STATS_HEADER, format_stats
 
 CALL_COUNT = 0
 def fibonacci_naive(n):
@@ -19,42 +19,26 @@ def fibonacci_memo(n, memo):
 
 def performance():
     test_numbers = [5, 10, 15, 20, 25, 30]
-    repeats = 3
     naive_times = []
     naive_calls = []
     memo_times = []
 
-    header = "n  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
+    header = "n  " + STATS_HEADER
     print(header)
     print("-" * len(header))
 
     for number in test_numbers:
-        naive_execs = []
-        memo_execs = []
-        calls_for_n = 0
+        global CALL_COUNT
+        CALL_COUNT = 0
+        fibonacci_naive(number)
+        naive_calls.append(CALL_COUNT)
 
-        for _ in range(repeats):
-            global CALL_COUNT
-            CALL_COUNT = 0
-            start = time.perf_counter()
-            fibonacci_naive(number)
-            end = time.perf_counter()
-            naive_execs.append((end - start) * 1000)
-            calls_for_n = CALL_COUNT
+        naive = measure(fibonacci_naive, lambda: (number,))
+        memo = measure(fibonacci_memo, lambda: (number, {0: 1, 1: 1}))
+        print(f"{number:<2} " + format_stats(naive))
 
-            memo = {0: 1, 1: 1}
-            start = time.perf_counter()
-            fibonacci_memo(number, memo)
-            end = time.perf_counter()
-            memo_execs.append((end - start) * 1000)
-
-        avg_time = sum(naive_execs) / repeats
-        row = f"{number:<2} " + "  ".join(f"{t:>8.3f}" for t in naive_execs) + f"  {avg_time:>8.3f}"
-        print(row)
-
-        naive_times.append(avg_time)
-        naive_calls.append(calls_for_n)
-        memo_times.append(sum(memo_execs) / repeats)
+        naive_times.append(naive["median"])
+        memo_times.append(memo["median"])
 
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
@@ -74,7 +58,7 @@ def performance():
         color="g",
         label="Memoized Recursion",
     )
-    axes[0].set_title("Execution Time (Average of 3 runs)")
+    axes[0].set_title("Execution Time (median)")
     axes[0].set_xlabel("Fibonacci Number Index")
     axes[0].set_ylabel("Execution Time (ms)")
     axes[0].legend()
@@ -1,6 +1,6 @@
 import matplotlib.pyplot as plt
 import numpy as np
-import time
+from labtiming import measure_ms
 
 def binets_formula(n):
     """Calculate Fibonacci using Binet's formula"""
@@ -72,10 +72,7 @@ results = {name: [] for name in algorithms}
 
 for n in n_values:
     for name, func in algorithms.items():
-        start = time.perf_counter()
-        func(n)
-        elapsed = time.perf_counter() - start
-        results[name].append(elapsed)
+        results[name].append(measure_ms(func, lambda: (n,)))
 
 # Create plot
 plt.figure(figsize=(12, 7))
@@ -85,7 +82,7 @@ for (name, times), color in zip(results.items(), colors):
     plt.plot(n_values, times, marker='o', label=name, linewidth=2, color=color, markersize=4)
 
 plt.xlabel('Fibonacci Number (n)', fontsize=12)
-plt.ylabel('Execution Time (seconds)', fontsize=12)
+plt.ylabel('Execution Time (ms, median)', fontsize=12)
 plt.title('Performance Comparison of Fibonacci Algorithms', fontsize=14, fontweight='bold')
 plt.legend(loc='best', fontsize=10)
 plt.grid(True, alpha=0.3)
@@ -0,0 +1,12 @@
+"""
+The shared timing engine (timing.py at the repository root) for the scripts of this lab.
+They run from their own directory, so the root is put on sys.path here, once per process.
+"""
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from timing import measure, measure_ms, fresh_copies, STATS_HEADER, format_stats
@@ -0,0 +1,217 @@
+import matplotlib.pyplot as plt
+from bisect import bisect_left, bisect_right
+from mergeSort import mergeSort, mergeSortOptimized
+from keySort import sort_by_key
+from smallSort import binary_insertion_sort
+from labtiming import measure_ms, fresh_copies
+
+MIN_GALLOP = 7
+
+
+def min_run_length(n):
+    """Minimum run length: n itself below 64, otherwise a value in [32, 64] so n / minrun is close to a power of two"""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def count_run(arr, lo, hi):
+    """Length of the run starting at lo; a strictly descending run is reversed in place"""
+    if lo + 1 >= hi:
+        return hi - lo
+    i = lo + 1
+    if arr[i] < arr[lo]:
+        while i + 1 < hi and arr[i + 1] < arr[i]:
+            i += 1
+        arr[lo:i + 1] = arr[lo:i + 1][::-1]
+    else:
+        while i + 1 < hi and not arr[i + 1] < arr[i]:
+            i += 1
+    return i + 1 - lo
+
+
+def gallop_right(a, x, lo, hi):
+    """First index in a[lo:hi] with a[idx] > x, probing lo, lo+1, lo+3, lo+7, ... before bisecting"""
+    ofs = 0
+    last = lo
+    while lo + ofs < hi and not x < a[lo + ofs]:
+        last = lo + ofs + 1
+        ofs = (ofs << 1) + 1
+    return bisect_right(a, x, last, min(lo + ofs, hi))
+
+
+def gallop_left(a, x, lo, hi):
+    """First index in a[lo:hi] with a[idx] >= x, probing like gallop_right"""
+    ofs = 0
+    last = lo
+    while lo + ofs < hi and a[lo + ofs] < x:
+        last = lo + ofs + 1
+        ofs = (ofs << 1) + 1
+    return bisect_left(a, x, last, min(lo + ofs, hi))
+
+
+def merge_runs(arr, lo, mid, hi, state):
+    """
+    Stable merge of arr[lo:mid] and arr[mid:hi].
+    Elements already in their final place at either end are skipped by binary search,
+    and once one side wins MIN_GALLOP times in a row the merge switches to galloping,
+    copying whole blocks with slices. state[0] holds the adaptive gallop threshold.
+    """
+    lo = bisect_right(arr, arr[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect_left(arr, arr[mid - 1], mid, hi)
+    if mid == hi:
+        return
+
+    left = arr[lo:mid]
+    n1 = mid - lo
+    i = 0
+    j = mid
+    k = lo
+    min_gallop = state[0]
+    while i < n1 and j < hi:
+        count_l = count_r = 0
+        while i < n1 and j < hi:
+            if arr[j] < left[i]:
+                arr[k] = arr[j]
+                j += 1
+                count_r += 1
+                count_l = 0
+            else:
+                arr[k] = left[i]
+                i += 1
+                count_l += 1
+                count_r = 0
+            k += 1
+            if count_l >= min_gallop or count_r >= min_gallop:
+                break
+
+        while i < n1 and j < hi:
+            end = gallop_right(left, arr[j], i, n1)
+            count_l = end - i
+            if count_l:
+                arr[k:k + count_l] = left[i:end]
+                k += count_l
+                i = end
+                if i == n1:
+                    break
+            end = gallop_left(arr, left[i], j, hi)
+            count_r = end - j
+            if count_r:
+                arr[k:k + count_r] = arr[j:end]
+                k += count_r
+                j = end
+                if j == hi:
+                    break
+            if count_l < MIN_GALLOP and count_r < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    if i < n1:
+        arr[k:hi] = left[i:n1]
+    state[0] = min_gallop
+
+
+def merge_at(arr, runs, idx, state):
+    start, length = runs[idx]
+    length2 = runs[idx + 1][1]
+    merge_runs(arr, start, start + length, start + length + length2, state)
+    runs[idx] = [start, length + length2]
+    del runs[idx + 1]
+
+
+def merge_collapse(arr, runs, state):
+    """Merge until the stack lengths satisfy the run-stack invariants (balanced merges)"""
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+           (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        merge_at(arr, runs, n, state)
+
+
+def adaptiveMergeSort(arr, key=None, reverse=False):
+    """
+    Natural merge sort: O(n) on sorted or reversed input, close to O(n) on nearly sorted input,
+    O(n log n) worst case. Stable.
+    """
+    if key is not None or reverse:
+        sort_by_key(adaptiveMergeSort, arr, 0, len(arr) - 1, key, reverse)
+        return
+    n = len(arr)
+    if n < 2:
+        return
+    minrun = min_run_length(n)
+    runs = []
+    state = [MIN_GALLOP]
+    lo = 0
+    while lo < n:
+        run_len = count_run(arr, lo, n)
+        if run_len < minrun:
+            forced = min(minrun, n - lo)
+            binary_insertion_sort(arr, lo, lo + forced - 1, lo + run_len)
+            run_len = forced
+        runs.append([lo, run_len])
+        merge_collapse(arr, runs, state)
+        lo += run_len
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        merge_at(arr, runs, n, state)
+
+
+def performance():
+    from comparison import INPUT_TYPES
+
+    test_sizes = [10, 50, 100, 500, 1000, 2000, 5000, 10000]
+    input_names = ["Random Integers", "Sorted Ascending", "Sorted Descending", "Nearly Sorted"]
+    repeats = 3
+    algorithms = {
+        "Merge Sort": lambda arr: mergeSort(arr, 0, len(arr) - 1),
+        "Merge Sort Optimized": lambda arr: mergeSortOptimized(arr, 0, len(arr) - 1),
+        "Adaptive Merge Sort": adaptiveMergeSort,
+    }
+    results = {name: {} for name in input_names}
+
+    header = "n  " + "  ".join(f"{name:>22}" for name in algorithms)
+    for input_name in input_names:
+        generator = INPUT_TYPES[input_name]
+        print(f"\n=== {input_name.upper()} (median, ms) ===")
+        print(header)
+        print("-" * len(header))
+        times = {name: [] for name in algorithms}
+        for size in test_sizes:
+            datasets = [generator(size) for _ in range(repeats)]
+            for algo_name, algo in algorithms.items():
+                times[algo_name].append(measure_ms(algo, fresh_copies(datasets)))
+            print(f"{size:<6} " + "  ".join(f"{times[name][-1]:>22.3f}" for name in algorithms))
+        results[input_name] = times
+
+    fig, axes = plt.subplots(1, len(input_names), figsize=(20, 5))
+    styles = {"Merge Sort": ("s", "-", "blue"), "Merge Sort Optimized": ("^", "--", "cyan"),
+              "Adaptive Merge Sort": ("P", "-", "teal")}
+    for ax, input_name in zip(axes, input_names):
+        for algo_name, times in results[input_name].items():
+            marker, linestyle, color = styles[algo_name]
+            ax.plot(test_sizes, times, marker=marker, linestyle=linestyle, color=color,
+                label=algo_name, linewidth=2, markersize=6)
+        ax.set_title(input_name)
+        ax.set_xlabel("Array Size (n)")
+        ax.set_ylabel("Execution Time (ms)")
+        ax.legend()
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
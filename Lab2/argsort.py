@@ -0,0 +1,158 @@
+import random
+import numpy as np
+import matplotlib.pyplot as plt
+from radixSort import argsort_keys
+from mergeSort import mergeSortBottomUp
+from quickSort import introSort
+from labtiming import measure_ms, fresh_copies
+
+
+def numeric_column(column):
+    """column as a NumPy int/float array, or None if its values are not all numbers"""
+    values = np.asarray(column)
+    if values.dtype.kind == "b":
+        return values.astype(np.int8)
+    if values.dtype.kind in "iuf" and values.ndim == 1:
+        return values
+    return None
+
+
+def rank_codes(column):
+    """
+    Dense int ranks of the values of a non-numeric column (equal values share a rank).
+    Only the distinct values are sorted (introSort), so heavily repeated keys are cheap.
+    None if the values are not hashable.
+    """
+    try:
+        distinct = list(set(column))
+    except TypeError:
+        return None
+    introSort(distinct, 0, len(distinct) - 1)
+    rank = {v: i for i, v in enumerate(distinct)}
+    return np.array([rank[v] for v in column], dtype=np.int64)
+
+
+def stable_pass(column, perm, descending):
+    """
+    Reorder perm by column[perm[i]], keeping the current order of equal keys.
+    Numeric columns (or the rank codes of hashable ones) use the stable radix argsort;
+    anything else goes through mergeSortBottomUp with key=, stable also when descending.
+    """
+    values = numeric_column(column)
+    if isinstance(column, np.ndarray) and values is None:
+        column = column.tolist()
+    if values is None:
+        values = rank_codes(column)
+    if values is not None:
+        order = argsort_keys(values[perm], descending)
+        return perm[order]
+    items = perm.tolist()
+    mergeSortBottomUp(items, key=column.__getitem__, reverse=descending)
+    return np.array(items, dtype=np.int64)
+
+
+def argsort(columns, descending=False):
+    """
+    Permutation that sorts the records (columns[0][i], columns[1][i], ...) lexicographically.
+    descending is one flag for every column or one flag per column.
+    LSD order: one stable pass per column, least significant column first,
+    so no tuples are built and no records are moved. Returns a list of indices.
+    """
+    columns = list(columns)
+    if not columns:
+        raise ValueError("at least one column is required")
+    n = len(columns[0])
+    if any(len(column) != n for column in columns):
+        raise ValueError("all columns must have the same length")
+    if isinstance(descending, bool):
+        descending = [descending] * len(columns)
+    elif len(descending) != len(columns):
+        raise ValueError("descending needs one flag per column")
+
+    perm = np.arange(n, dtype=np.int64)
+    if n < 2:
+        return perm.tolist()
+    for column, desc in zip(reversed(columns), reversed(list(descending))):
+        perm = stable_pass(column, perm, desc)
+    return perm.tolist()
+
+
+def apply_permutation(column, perm):
+    """column reordered by perm, as the same container type"""
+    if isinstance(column, np.ndarray):
+        return column[perm]
+    return [column[i] for i in perm]
+
+
+# ── baselines: build one tuple per record and sort the tuples ─────────────────
+def record_tuples(columns, descending):
+    """(key0, key1, ..., index) tuples; descending numeric keys are negated"""
+    keyed = []
+    for column, desc in zip(columns, descending):
+        column = column.tolist() if isinstance(column, np.ndarray) else column
+        keyed.append([-v for v in column] if desc else column)
+    return list(zip(*keyed, range(len(columns[0]))))
+
+
+def tuple_argsort(columns, descending, sort_func):
+    records = record_tuples(columns, descending)
+    sort_func(records)
+    return [record[-1] for record in records]
+
+
+def gen_records(n):
+    """Three columns: department (small int range), salary (float), name (string)"""
+    departments = [random.randint(0, 20) for _ in range(n)]
+    salaries = [round(random.uniform(1000, 9000), 2) for _ in range(n)]
+    names = ["".join(random.choices("abcdefghij", k=6)) for _ in range(n)]
+    return departments, salaries, names
+
+
+def performance():
+    test_sizes = [1000, 5000, 10000, 50000]
+    repeats = 3
+    layouts = {
+        "numeric (list)": (lambda cols: [cols[0], cols[1]], [False, True]),
+        "numeric (NumPy)": (lambda cols: [np.array(cols[0]), np.array(cols[1])], [False, True]),
+        "numeric + string": (lambda cols: [cols[0], cols[1], cols[2]], [False, True, False]),
+    }
+    methods = {
+        "argsort (LSD)": lambda cols, desc: argsort(cols, desc),
+        "tuples + mergeSortBottomUp": lambda cols, desc: tuple_argsort(cols, desc, mergeSortBottomUp),
+        "tuples + introSort": lambda cols, desc: tuple_argsort(
+            cols, desc, lambda a: introSort(a, 0, len(a) - 1)),
+    }
+    results = {}
+
+    for layout_name, (make_columns, descending) in layouts.items():
+        header = "n       " + "  ".join(f"{name:>27}" for name in methods)
+        print(f"\n=== MULTI-COLUMN ARGSORT: {layout_name.upper()} (median, ms) ===")
+        print(header)
+        print("-" * len(header))
+        times = {name: [] for name in methods}
+        for size in test_sizes:
+            datasets = [make_columns(gen_records(size)) for _ in range(repeats)]
+            expected = tuple_argsort(datasets[0], descending, lambda a: a.sort())
+            for name, method in methods.items():
+                times[name].append(measure_ms(lambda columns: method(columns, descending), fresh_copies(datasets)))
+                if method(datasets[0], descending) != expected:
+                    print(f"  !! {name} disagrees with sorted tuples")
+            print(f"{size:<7} " + "  ".join(f"{times[name][-1]:>27.3f}" for name in methods))
+        results[layout_name] = times
+
+    fig, axes = plt.subplots(1, len(layouts), figsize=(20, 5))
+    for ax, (layout_name, times) in zip(axes, results.items()):
+        for (name, method_times), marker in zip(times.items(), ["o", "s", "^"]):
+            ax.plot(test_sizes, method_times, marker=marker, label=name, linewidth=2, markersize=7)
+        ax.set_title(f"Argsort: {layout_name}")
+        ax.set_xlabel("Records (n)")
+        ax.set_ylabel("Execution Time (ms)")
+        ax.legend()
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
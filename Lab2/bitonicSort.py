@@ -0,0 +1,124 @@
+import random
+import numpy as np
+import matplotlib.pyplot as plt
+from radixSort import write_back, sort_by_numeric_key, radixSortLSD, UnsupportedKeyError
+from quickSort import quickSortOptimized
+from heapSort import heapSortOptimized
+from labtiming import measure_ms, fresh_copies
+
+
+def pad_value(dtype):
+    """Value that sorts after every element of dtype, used to fill up to a power of two"""
+    if dtype.kind == "f":
+        return np.inf
+    return np.iinfo(dtype).max
+
+
+def bitonic_sorted(values):
+    """
+    Sorted copy of a 1-D int/float array by a bitonic sorting network whose compare-exchange
+    stages run as whole-array np.minimum / np.maximum on strided views: O(n log^2 n) work
+    in O(log^2 n) NumPy calls, with no per-element Python control flow.
+    The input is padded up to the next power of two m with a value larger than everything.
+    Every comparator sorts ascending: the first step of the merge of blocks of size k compares
+    element t of a block with element k-1-t (a reversed view), the remaining steps are
+    half-cleaners comparing t with t + j inside blocks of size 2j.
+    """
+    n = len(values)
+    m = 1 << max(0, (n - 1).bit_length())
+    a = np.full(m, pad_value(values.dtype), dtype=values.dtype)
+    a[:n] = values
+    buf = np.empty(m // 2, dtype=values.dtype)
+
+    k = 2
+    while k <= m:
+        blocks = a.reshape(m // k, k)
+        compare_exchange(blocks[:, :k // 2], blocks[:, k // 2:][:, ::-1], buf)
+        j = k // 4
+        while j >= 1:
+            pairs = a.reshape(m // (2 * j), 2, j)
+            compare_exchange(pairs[:, 0, :], pairs[:, 1, :], buf)
+            j //= 2
+        k *= 2
+    return a[:n]
+
+
+def compare_exchange(lo, hi, buf):
+    """Element-wise lo, hi = min(lo, hi), max(lo, hi) on two same-shape views"""
+    low = buf[:lo.size].reshape(lo.shape)
+    np.minimum(lo, hi, out=low)
+    np.maximum(lo, hi, out=hi)
+    lo[...] = low
+
+
+def bitonicSort(arr, key=None, reverse=False):
+    """
+    Vectorized bitonic network sort of int or float values; lists and NumPy arrays in place.
+    Not stable, so key= goes through the stable radix argsort instead.
+    """
+    if len(arr) < 2:
+        return
+    if key is not None:
+        sort_by_numeric_key(arr, key, reverse)
+        return
+    values = np.asarray(arr)
+    if values.dtype.kind not in "iuf" or values.ndim != 1:
+        raise UnsupportedKeyError("bitonicSort needs int or float keys")
+    if values.dtype.kind == "f" and np.isnan(values).any():
+        raise UnsupportedKeyError("bitonicSort cannot order NaN")
+    ordered = bitonic_sorted(values)
+    write_back(arr, ordered[::-1] if reverse else ordered)
+
+
+def performance():
+    test_sizes = [1000, 4096, 4097, 10000, 65536, 100000, 1_000_000]
+    python_max = 100000
+    repeats = 3
+    algorithms = {
+        "Bitonic (NumPy network)": ("array", bitonicSort),
+        "np.sort": ("array", lambda arr: arr.sort()),
+        "Radix Sort (LSD)": ("array", radixSortLSD),
+        "Quick Sort Optimized": ("list", lambda arr: quickSortOptimized(arr, 0, len(arr) - 1)),
+        "Heap Sort Optimized": ("list", heapSortOptimized),
+    }
+    styles = {"Bitonic (NumPy network)": ("o", "-", "red"), "np.sort": ("s", "--", "black"),
+              "Radix Sort (LSD)": ("*", "-", "darkorange"), "Quick Sort Optimized": ("^", "--", "green"),
+              "Heap Sort Optimized": ("D", "--", "purple")}
+    times = {name: [] for name in algorithms}
+
+    header = "n          " + "  ".join(f"{name:>23}" for name in algorithms)
+    print("\n=== VECTORIZED BITONIC SORT (random int64, median, ms) ===")
+    print(header)
+    print("-" * len(header))
+    for size in test_sizes:
+        datasets = {"array": [np.array([random.randint(-10**9, 10**9) for _ in range(size)], dtype=np.int64)
+                              for _ in range(repeats)]}
+        datasets["list"] = [data.tolist() for data in datasets["array"]]
+        for name, (layout, algo) in algorithms.items():
+            if layout == "list" and size > python_max:
+                times[name].append(None)
+                continue
+            times[name].append(measure_ms(algo, fresh_copies(datasets[layout])))
+        print(f"{size:<10} " + "  ".join(f"{t:>23.3f}" if t is not None else f"{'-':>23}"
+                                         for t in (times[name][-1] for name in algorithms)))
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    for name, series in times.items():
+        valid = [(s, t) for s, t in zip(test_sizes, series) if t is not None]
+        vs, vt = zip(*valid)
+        marker, linestyle, color = styles[name]
+        ax.plot(vs, vt, marker=marker, linestyle=linestyle, color=color, label=name,
+                linewidth=2, markersize=7)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_title("Vectorized Bitonic Network vs Python Sorts and np.sort (random int64)")
+    ax.set_xlabel("Array Size (n)")
+    ax.set_ylabel("Execution Time (ms)")
+    ax.legend()
+    ax.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
@@ -0,0 +1,163 @@
+from array import array
+
+NATIVE_FORMATS = "bBhHiIlLqQfd"
+
+
+def typed_view(buf):
+    """
+    1-D typed memoryview over any writable buffer: array.array, bytearray, NumPy array, memoryview.
+    Explicit byte-order prefixes (NumPy exports '<q', '<d', ...) are dropped by recasting.
+    """
+    view = buf if isinstance(buf, memoryview) else memoryview(buf)
+    if view.readonly:
+        raise ValueError("buffer is read-only")
+    if not view.c_contiguous:
+        raise ValueError("buffer must be contiguous")
+    fmt = view.format[-1:]
+    if fmt not in NATIVE_FORMATS or len(view.format) > 2:
+        raise ValueError(f"unsupported buffer format {view.format!r}")
+    if view.format != fmt or view.ndim != 1:
+        view = view.cast("B").cast(fmt)
+    return view
+
+
+def insertion_sort_view(view, low, high):
+    for i in range(low + 1, high + 1):
+        key = view[i]
+        j = i - 1
+        while j >= low and view[j] > key:
+            view[j + 1] = view[j]
+            j -= 1
+        view[j + 1] = key
+
+
+# ── heap sort ─────────────────────────────────────────────────────────────────
+def heapify_view(view, n, i):
+    temp = view[i]
+    while True:
+        l = 2 * i + 1
+        if l >= n:
+            break
+        child = l
+        if l + 1 < n and view[l + 1] > view[l]:
+            child = l + 1
+        if view[child] <= temp:
+            break
+        view[i] = view[child]
+        i = child
+    view[i] = temp
+
+
+def heapSortBuffer(buf):
+    """heapSortOptimized on a typed buffer, in place, O(1) extra memory"""
+    view = typed_view(buf)
+    n = len(view)
+    for i in range(n // 2 - 1, -1, -1):
+        heapify_view(view, n, i)
+    for i in range(n - 1, 0, -1):
+        view[0], view[i] = view[i], view[0]
+        heapify_view(view, i, 0)
+
+
+# ── merge sort ────────────────────────────────────────────────────────────────
+def mergeSortBuffer(buf, run=16):
+    """
+    Bottom-up merge sort on a typed buffer. The single auxiliary buffer is an
+    array of the same typecode; blocks move between the two with memoryview slice copies.
+    """
+    view = typed_view(buf)
+    n = len(view)
+    if n < 2:
+        return
+    for low in range(0, n, run):
+        insertion_sort_view(view, low, min(low + run, n) - 1)
+    if n <= run:
+        return
+
+    aux = array(view.format)
+    aux.frombytes(view.cast("B"))
+    src, dst = view, memoryview(aux)
+    width = run
+    while width < n:
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            if mid >= right or src[mid - 1] <= src[mid]:
+                dst[left:right] = src[left:right]
+                continue
+            i, j, k = left, mid, left
+            while i < mid and j < right:
+                a = src[i]
+                b = src[j]
+                if a <= b:
+                    dst[k] = a
+                    i += 1
+                else:
+                    dst[k] = b
+                    j += 1
+                k += 1
+            if i < mid:
+                dst[k:right] = src[i:mid]
+            else:
+                dst[k:right] = src[j:right]
+        src, dst = dst, src
+        width *= 2
+    if src is not view:
+        view[:] = src
+
+
+# ── quick sort ────────────────────────────────────────────────────────────────
+def median_index_view(view, a, b, c):
+    if view[a] < view[b]:
+        if view[b] < view[c]:
+            return b
+        return c if view[a] < view[c] else a
+    if view[a] < view[c]:
+        return a
+    return c if view[b] < view[c] else b
+
+
+def partition3_view(view, low, high, pivot):
+    lt = i = low
+    gt = high
+    while i <= gt:
+        v = view[i]
+        if v < pivot:
+            view[i] = view[lt]
+            view[lt] = v
+            lt += 1
+            i += 1
+        elif pivot < v:
+            view[i] = view[gt]
+            view[gt] = v
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def quickSortBuffer(buf, threshold=16):
+    """
+    introSort on a typed buffer: 3-way partitioning, median-of-three pivots,
+    heap sort of the sub-view past the depth limit, insertion sort below threshold.
+    """
+    view = typed_view(buf)
+    n = len(view)
+    stack = [(0, n - 1, 2 * n.bit_length())]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low + 1 > threshold:
+            if depth == 0:
+                heapSortBuffer(view[low:high + 1])
+                break
+            depth -= 1
+            p = median_index_view(view, low, (low + high) // 2, high)
+            lt, gt = partition3_view(view, low, high, view[p])
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, depth))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1, depth))
+                low = gt + 1
+        else:
+            insertion_sort_view(view, low, high)
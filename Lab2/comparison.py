@@ -1,12 +1,26 @@
-import time
 import matplotlib.pyplot as plt
+import os
 import random
 import sys
+import tracemalloc
+import multiprocessing
+from itertools import cycle
+from concurrent.futures import ProcessPoolExecutor
+from array import array
 from pathlib import Path
-from heapSort import heapSort as heap_sort
-from mergeSort import mergeSort as merge_sort_func
-from quickSort import quickSort as quick_sort_func
+import numpy as np
+from heapSort import heapSort as heap_sort, heapSortOptimized, heapSortFloyd, heapSort4ary
+from mergeSort import mergeSort as merge_sort_func, mergeSortBottomUp, mergeSortOptimized
+from quickSort import quickSort as quick_sort_func, quickSortOptimized, introSort as intro_sort_func
 from slowSort import slowsort
+from adaptiveMergeSort import adaptiveMergeSort
+from parallelSort import speedup_curve
+from radixSort import countingSort, radixSortLSD, linearSort, UnsupportedKeyError
+from bufferSort import heapSortBuffer, mergeSortBuffer, quickSortBuffer
+from counters import count_operations
+from smartSort import smart_sort, plan, TINY_N
+from stringSort import msdRadixSort, multikeyQuickSort
+from labtiming import measure_ms, fresh_copies
 
 sys.setrecursionlimit(50000)
 
@@ -21,6 +35,9 @@ def mergeSort(arr):
 def quickSort(arr):
     quick_sort_func(arr, 0, len(arr) - 1)
 
+def introSort(arr):
+    intro_sort_func(arr, 0, len(arr) - 1)
+
 def slowSort(arr):
     slowsort(arr, 0, len(arr) - 1)
 
@@ -59,6 +76,17 @@ def gen_nearly_sorted(n):
 def gen_many_duplicates(n):
     return [random.randint(1, 10) for _ in range(n)]
 
+def gen_random_strings(n):
+    return ["".join(random.choices(STRING_ALPHABET, k=random.randint(5, 15))) for _ in range(n)]
+
+def gen_shared_prefix_urls(n):
+    return [f"https://www.example.com/{random.choice(URL_SECTIONS)}/"
+            f"{random.choice(URL_SECTIONS)}/item?id={random.randint(0, 1_000_000)}" for _ in range(n)]
+
+def gen_duplicate_strings(n):
+    words = ["".join(random.choices(STRING_ALPHABET, k=8)) for _ in range(20)]
+    return [random.choice(words) for _ in range(n)]
+
 
 INPUT_TYPES = {
     "Random Integers":      gen_random_integers,
@@ -71,74 +99,182 @@ INPUT_TYPES = {
     "Many Duplicates":      gen_many_duplicates,
 }
 
+STRING_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+URL_SECTIONS = ["products", "products-archive", "blog", "blog-drafts", "docs", "support"]
+
+STRING_INPUT_TYPES = {
+    "Random Strings":       gen_random_strings,
+    "Shared-Prefix URLs":   gen_shared_prefix_urls,
+    "Duplicate Strings":    gen_duplicate_strings,
+}
+
 EFFICIENT_ALGOS = {
     "Heap Sort":  heapSort,
     "Merge Sort": mergeSort,
     "Quick Sort": quickSort,
+    "Bottom-Up Merge Sort": mergeSortBottomUp,
+    "Adaptive Merge Sort": adaptiveMergeSort,
+    "Introsort": introSort,
+    "Counting Sort": countingSort,
+    "Radix Sort": radixSortLSD,
+    "Linear Dispatch": linearSort,
+    "Floyd Heap Sort": heapSortFloyd,
+    "4-ary Heap Sort": heapSort4ary,
+    "Smart Sort": smart_sort,
 }
 
 COLORS  = {"Heap Sort": "purple", "Merge Sort": "blue",
-           "Quick Sort": "green",  "Slow Sort": "red"}
+           "Quick Sort": "green",  "Slow Sort": "red",
+           "Bottom-Up Merge Sort": "navy", "Adaptive Merge Sort": "teal",
+           "Introsort": "darkgreen", "Counting Sort": "crimson",
+           "Radix Sort": "darkorange", "Linear Dispatch": "black",
+           "Floyd Heap Sort": "brown", "4-ary Heap Sort": "olive",
+           "Smart Sort": "magenta"}
 MARKERS = {"Heap Sort": "o", "Merge Sort": "s",
-           "Quick Sort": "^", "Slow Sort": "v"}
+           "Quick Sort": "^", "Slow Sort": "v",
+           "Bottom-Up Merge Sort": "D", "Adaptive Merge Sort": "P",
+           "Introsort": "X", "Counting Sort": "h",
+           "Radix Sort": "*", "Linear Dispatch": "d",
+           "Floyd Heap Sort": "<", "4-ary Heap Sort": ">",
+           "Smart Sort": "p"}
 
 
 # ── benchmarking ──────────────────────────────────────────────────────────────
 def benchmark(algo_func, generator, sizes, repeats=3):
-    """Return list of avg times (ms) per size. None if RecursionError."""
+    """Return list of median times (ms) per size, over repeats generated inputs.
+    None on RecursionError, or UnsupportedKeyError from a backend that does not accept
+    the input's key type; any other exception is a bug and propagates."""
     times = []
     for size in sizes:
-        execs = []
-        for _ in range(repeats):
-            arr = generator(size)
-            try:
-                start = time.perf_counter()
-                algo_func(arr.copy())
-                end = time.perf_counter()
-                execs.append((end - start) * 1000)
-            except RecursionError:
-                execs.append(None)
-        valid = [e for e in execs if e is not None]
-        times.append(sum(valid) / len(valid) if valid else None)
+        datasets = [generator(size) for _ in range(repeats)]
+        try:
+            times.append(measure_ms(algo_func, fresh_copies(datasets)))
+        except (RecursionError, UnsupportedKeyError):
+            times.append(None)
     return times
 
 
-def comprehensive_comparison():
+def print_row(name, times):
+    print(f"  {name:<22}  " +
+          "  ".join(f"{t:>8.3f}" if t is not None else "   ERROR" for t in times))
+
+
+def physical_cores():
+    """
+    One logical CPU per physical core among the CPUs this process may run on,
+    from the sysfs topology (hyper-thread siblings share package and core id).
+    Falls back to every allowed CPU where the topology is not readable.
+    """
+    allowed = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") \
+        else list(range(os.cpu_count() or 1))
+    cores = {}
+    for cpu in allowed:
+        topology = Path(f"/sys/devices/system/cpu/cpu{cpu}/topology")
+        try:
+            core = ((topology / "physical_package_id").read_text().strip(),
+                    (topology / "core_id").read_text().strip())
+        except OSError:
+            return allowed
+        cores.setdefault(core, cpu)
+    return sorted(cores.values())
+
+
+def pin_worker(core_queue):
+    """Pool initializer: pin this worker to its own core and give it its own random stream"""
+    core = core_queue.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {core})
+    random.seed()
+
+
+def benchmark_cell(input_name, algo_name, size, repeats):
+    """One (input, algorithm, size) cell of the comparison, run inside a pool worker"""
+    algo_func = slowSort if algo_name == "Slow Sort" else EFFICIENT_ALGOS[algo_name]
+    return benchmark(algo_func, INPUT_TYPES[input_name], [size], repeats)[0]
+
+
+def submission_order(cells):
+    """
+    (input, algorithm, size) cells, most expensive first: the exponential Slow Sort cells
+    by decreasing size, then the efficient sorts by decreasing size.
+    """
+    return sorted(cells, key=lambda cell: (cell[1] == "Slow Sort", cell[2]), reverse=True)
+
+
+def parallel_results(algo_sizes, repeats, workers):
+    """
+    Run every (input, algorithm, size) cell as its own job on a process pool, one pinned
+    worker per physical core, and merge the times into {input_name: {algo_name: (sizes, times)}}.
+    The most expensive cells are submitted first (submission_order) so long cells do not end up last.
+    """
+    cores = physical_cores()[:workers]
+    cells = submission_order([(input_name, algo_name, size)
+                              for input_name in INPUT_TYPES
+                              for algo_name, sizes in algo_sizes.items()
+                              for size in sizes])
+    if "Slow Sort" in algo_sizes:
+        assert cells[0][1:] == ("Slow Sort", max(algo_sizes["Slow Sort"])), "longest cell must go first"
+
+    with multiprocessing.Manager() as manager:
+        core_queue = manager.Queue()
+        for core in cores:
+            core_queue.put(core)
+        with ProcessPoolExecutor(max_workers=len(cores), initializer=pin_worker,
+                                 initargs=(core_queue,)) as executor:
+            futures = {cell: executor.submit(benchmark_cell, *cell, repeats) for cell in cells}
+            times = {cell: future.result() for cell, future in futures.items()}
+
+    return {input_name: {algo_name: (sizes, [times[(input_name, algo_name, size)] for size in sizes])
+                         for algo_name, sizes in algo_sizes.items()}
+            for input_name in INPUT_TYPES}
+
+
+def comprehensive_comparison(workers=None):
+    """
+    Every algorithm on every input type. workers=None uses one process per physical core
+    (see parallel_results); workers=1 runs the cells in sequence in this process.
+    """
     efficient_sizes = [10, 50, 100, 500, 1000, 2000, 5000, 10000]
     slow_sizes      = [5, 10, 15, 20, 25, 30]
     repeats = 3
-
-    all_results = {}   # {input_name: {algo_name: (sizes, times)}}
+    algo_sizes = {algo_name: efficient_sizes for algo_name in EFFICIENT_ALGOS}
+    algo_sizes["Slow Sort"] = slow_sizes
+    cores = len(physical_cores())
+    workers = min(workers or cores, cores)
 
     print("\n" + "=" * 80)
     print("COMPREHENSIVE SORTING ALGORITHMS COMPARISON")
     print("=" * 80)
 
-    for input_name, generator in INPUT_TYPES.items():
-        print(f"\n{'─' * 60}")
-        print(f"  INPUT: {input_name}")
-        print(f"{'─' * 60}")
-        input_results = {}
-
-        # efficient algorithms
-        for algo_name, algo_func in EFFICIENT_ALGOS.items():
-            times = benchmark(algo_func, generator, efficient_sizes, repeats)
-            input_results[algo_name] = (efficient_sizes, times)
-            print(f"  {algo_name:<12}  " +
-                  "  ".join(f"{t:>8.3f}" if t is not None else "   ERROR"
-                            for t in times))
-
-        # slow sort
-        times = benchmark(slowSort, generator, slow_sizes, repeats)
-        input_results["Slow Sort"] = (slow_sizes, times)
-        print(f"  {'Slow Sort':<12}  " +
-              "  ".join(f"{t:>8.3f}" if t is not None else "   ERROR"
-                        for t in times))
-
-        all_results[input_name] = input_results
-
-    # ── plots ─────────────────────────────────────────────────────────────────
-
+    if workers > 1:
+        print(f"  ({workers} pinned worker processes, one per physical core)")
+        all_results = parallel_results(algo_sizes, repeats, workers)
+        for input_name, input_results in all_results.items():
+            print(f"\n{'─' * 60}")
+            print(f"  INPUT: {input_name}")
+            print(f"{'─' * 60}")
+            for algo_name, (_, times) in input_results.items():
+                print_row(algo_name, times)
+    else:
+        all_results = {}   # {input_name: {algo_name: (sizes, times)}}
+        for input_name, generator in INPUT_TYPES.items():
+            print(f"\n{'─' * 60}")
+            print(f"  INPUT: {input_name}")
+            print(f"{'─' * 60}")
+            input_results = {}
+            for algo_name, sizes in algo_sizes.items():
+                algo_func = slowSort if algo_name == "Slow Sort" else EFFICIENT_ALGOS[algo_name]
+                times = benchmark(algo_func, generator, sizes, repeats)
+                input_results[algo_name] = (sizes, times)
+                print_row(algo_name, times)
+            all_results[input_name] = input_results
+
+    plot_comparison(all_results)
+    return all_results
+
+
+def plot_comparison(all_results):
+    """The three comprehensive_comparison figures from {input_name: {algo_name: (sizes, times)}}"""
     # Figure 1: Efficient algorithms – one subplot per input type (2 × 4)
     fig1, axes1 = plt.subplots(2, 4, figsize=(22, 10))
     fig1.suptitle("Efficient Sorting Algorithms – Performance by Input Type",
@@ -146,7 +282,7 @@ def comprehensive_comparison():
 
     for idx, (input_name, input_results) in enumerate(all_results.items()):
         ax = axes1[idx // 4][idx % 4]
-        for algo_name in ["Heap Sort", "Merge Sort", "Quick Sort"]:
+        for algo_name in EFFICIENT_ALGOS:
             sizes, times = input_results[algo_name]
             valid = [(s, t) for s, t in zip(sizes, times) if t is not None]
             if valid:
@@ -212,5 +348,364 @@ def comprehensive_comparison():
     print("\n✓ Plots saved to", IMAGE_DIR)
 
 
+def smart_sort_summary(all_results):
+    """
+    How smart_sort did in comprehensive_comparison: per input type, the fraction of sizes
+    where it was within 10% of the fastest other efficient algorithm, its time relative
+    to that best, and the share of its time spent sampling the input (plan).
+    """
+    print("\n" + "=" * 80)
+    print("SMART SORT  (vs fastest other efficient algorithm per cell)")
+    print("=" * 80)
+    print(f"  {'input':<22} {'wins':>6}  {'mean smart/best':>15}  {'plan share':>10}")
+    summary = {}
+    for input_name, input_results in all_results.items():
+        sizes, smart_times = input_results["Smart Sort"]
+        wins, ratios, shares = 0, [], []
+        for i, size in enumerate(sizes):
+            others = [input_results[name][1][i] for name in EFFICIENT_ALGOS
+                      if name != "Smart Sort" and input_results[name][1][i] is not None]
+            if smart_times[i] is None or not others:
+                continue
+            best = min(others)
+            wins += smart_times[i] <= 1.1 * best
+            ratios.append(smart_times[i] / best)
+            if size > TINY_N:
+                arr = INPUT_TYPES[input_name](size)
+                plan_ms = measure_ms(plan, lambda: (arr,))
+                shares.append(min(1.0, plan_ms / smart_times[i]))
+            else:
+                shares.append(0.0)
+        if not ratios:   # every cell failed: nothing to compare on this input type
+            continue
+        summary[input_name] = (wins / len(ratios), sum(ratios) / len(ratios), sum(shares) / len(shares))
+        win_rate, mean_ratio, share = summary[input_name]
+        print(f"  {input_name:<22} {win_rate:>6.0%}  {mean_ratio:>15.2f}  {share:>10.1%}")
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 5))
+    names = list(summary)
+    axes[0].bar(names, [summary[name][0] * 100 for name in names], color="magenta")
+    axes[0].set_title("Smart Sort Win Rate (within 10% of best)", fontsize=12, fontweight="bold")
+    axes[0].set_ylabel("Sizes won (%)")
+    axes[1].bar(names, [summary[name][2] * 100 for name in names], color="gray")
+    axes[1].set_title("Smart Sort Sampling Overhead", fontsize=12, fontweight="bold")
+    axes[1].set_ylabel("Share of smart_sort time in plan() (%)")
+    for ax in axes:
+        ax.tick_params(axis="x", rotation=35)
+        ax.grid(True, axis="y", alpha=0.3)
+    plt.tight_layout()
+    fig.savefig(str(IMAGE_DIR / "smart_sort.png"), dpi=300, bbox_inches="tight")
+    plt.show()
+    return summary
+
+
+COUNT_ALGOS = {
+    "Heap Sort": heapSort,
+    "Heap Sort Optimized": heapSortOptimized,
+    "Merge Sort": mergeSort,
+    "Merge Sort Optimized": lambda arr: mergeSortOptimized(arr, 0, len(arr) - 1),
+    "Quick Sort": quickSort,
+    "Quick Sort Optimized": lambda arr: quickSortOptimized(arr, 0, len(arr) - 1),
+    "Introsort": introSort,
+}
+# sorts whose element traffic all lands in the input list; the merge sorts move most of theirs
+# through temporary buffers that CountingList cannot see, so they get no writes/swaps column
+INPUT_WRITE_ALGOS = {"Heap Sort", "Heap Sort Optimized", "Quick Sort", "Quick Sort Optimized", "Introsort"}
+COUNT_METRICS = [("comparisons", "Comparisons"), ("writes", "Writes to input (solid) / swaps (dashed)"),
+                 ("aux_bytes", "Aux memory (KB)"), ("depth", "Max recursion depth")]
+
+
+def operation_counts(sizes=(100, 250, 500, 1000), repeats=3):
+    """
+    Counting mode next to wall time: comparisons, swaps, writes to input, auxiliary memory and
+    recursion depth for the base and optimized sorts on every input type.
+    Writes and swaps are left out for the merge sorts (see INPUT_WRITE_ALGOS).
+    """
+    all_counts = {}   # {input_name: {algo_name: (times, [counts dict per size])}}
+
+    print("\n" + "=" * 80)
+    print("OPERATION COUNTS  (counting mode, one array per size)")
+    print("=" * 80)
+    for input_name, generator in INPUT_TYPES.items():
+        print(f"\n  INPUT: {input_name}")
+        print(f"  {'algorithm':<22} {'n':>6}  {'time(ms)':>9}  {'cmps':>9}  {'swaps':>8}"
+              f"  {'writes':>9}  {'aux(KB)':>8}  {'depth':>6}")
+        input_counts = {}
+        for algo_name, algo_func in COUNT_ALGOS.items():
+            times = benchmark(algo_func, generator, sizes, repeats)
+            counts = []
+            for size, t in zip(sizes, times):
+                c = count_operations(algo_func, generator(size))
+                counts.append(c)
+                t_str = f"{t:>9.3f}" if t is not None else "    ERROR"
+                if algo_name in INPUT_WRITE_ALGOS:
+                    swaps, writes = f"{c['swaps']:>8}", f"{c['writes']:>9}"
+                else:
+                    swaps, writes = f"{'-':>8}", f"{'-':>9}"
+                print(f"  {algo_name:<22} {size:>6}  {t_str}  {c['comparisons']:>9}  {swaps}"
+                      f"  {writes}  {c['aux_bytes'] / 1024:>8.1f}  {c['depth']:>6}")
+            input_counts[algo_name] = (times, counts)
+        all_counts[input_name] = input_counts
+
+    cmap = plt.get_cmap("tab10")
+    styles = {algo_name: cmap(i) for i, algo_name in enumerate(COUNT_ALGOS)}
+    fig, axes = plt.subplots(len(INPUT_TYPES), 1 + len(COUNT_METRICS),
+                             figsize=(24, 4 * len(INPUT_TYPES)))
+    fig.suptitle("Wall Time and Operation Counts by Input Type",
+                 fontsize=16, fontweight="bold", y=1.0)
+    for row, (input_name, input_counts) in enumerate(all_counts.items()):
+        for algo_name, (times, counts) in input_counts.items():
+            color = styles[algo_name]
+            valid = [(s, t) for s, t in zip(sizes, times) if t is not None]
+            if valid:
+                vs, vt = zip(*valid)
+                axes[row][0].plot(vs, vt, marker="o", color=color, label=algo_name, linewidth=1.8)
+            for col, (metric, _) in enumerate(COUNT_METRICS, start=1):
+                if metric == "writes" and algo_name not in INPUT_WRITE_ALGOS:
+                    continue
+                scale = 1024 if metric == "aux_bytes" else 1
+                axes[row][col].plot(sizes, [c[metric] / scale for c in counts],
+                                    marker="o", color=color, label=algo_name, linewidth=1.8)
+                if metric == "writes":
+                    axes[row][col].plot(sizes, [c["swaps"] for c in counts],
+                                        linestyle="--", color=color, linewidth=1.2)
+        axes[row][0].set_ylabel(f"{input_name}\nTime (ms)", fontsize=10, fontweight="bold")
+        for col, title in enumerate(["Time (ms)"] + [title for _, title in COUNT_METRICS]):
+            ax = axes[row][col]
+            if row == 0:
+                ax.set_title(title, fontsize=11, fontweight="bold")
+            ax.set_xlabel("Array size (n)", fontsize=9)
+            ax.grid(True, alpha=0.3)
+    axes[0][0].legend(fontsize=7, loc="upper left")
+
+    plt.tight_layout()
+    fig.savefig(str(IMAGE_DIR / "operation_counts.png"), dpi=150, bbox_inches="tight")
+    plt.show()
+    return all_counts
+
+
+class KeyCompare:
+    """Wrapper that calls key inside every comparison - the naive way to sort by a key"""
+    calls = 0
+
+    def __init__(self, value, key):
+        self.value = value
+        self.key = key
+
+    def k(self):
+        KeyCompare.calls += 1
+        return self.key(self.value)
+
+    def __lt__(self, other):
+        return self.k() < other.k()
+
+    def __le__(self, other):
+        return self.k() <= other.k()
+
+    def __gt__(self, other):
+        return self.k() > other.k()
+
+
+def key_sort_comparison(sizes=(100, 1000, 5000, 10000), repeats=3):
+    """Sort complex numbers by magnitude: key= (decorate-sort-undecorate) vs key inside every comparison"""
+    algorithms = {
+        "Heap Sort": lambda arr, **kw: heapSortOptimized(arr, **kw),
+        "Merge Sort": lambda arr, **kw: mergeSortOptimized(arr, 0, len(arr) - 1, **kw),
+        "Introsort": lambda arr, **kw: intro_sort_func(arr, 0, len(arr) - 1, **kw),
+        "Adaptive Merge Sort": lambda arr, **kw: adaptiveMergeSort(arr, **kw),
+    }
+    results = {}
+
+    print("\n" + "=" * 80)
+    print("KEY SORTING  (complex numbers by abs, median ms / key evaluations)")
+    print("=" * 80)
+    print(f"  {'algorithm':<22} {'n':>6}  {'key= (ms)':>10}  {'calls':>7}  {'wrapper (ms)':>12}  {'calls':>9}")
+    for algo_name, algo in algorithms.items():
+        dsu_times, wrapper_times = [], []
+        for size in sizes:
+            datasets = [[complex(random.uniform(-100, 100), random.uniform(-100, 100))
+                         for _ in range(size)] for _ in range(repeats)]
+            source = cycle(datasets)
+            dsu_times.append(measure_ms(lambda arr: algo(arr, key=abs), fresh_copies(datasets)))
+            wrapper_times.append(measure_ms(algo, lambda: ([KeyCompare(z, abs) for z in next(source)],)))
+
+            # key evaluations of one run each
+            calls = [0]
+
+            def counted_abs(z):
+                calls[0] += 1
+                return abs(z)
+
+            algo(datasets[0].copy(), key=counted_abs)
+            dsu_calls = calls[0]
+            KeyCompare.calls = 0
+            algo([KeyCompare(z, abs) for z in datasets[0]])
+            print(f"  {algo_name:<22} {size:>6}  {dsu_times[-1]:>10.3f}  {dsu_calls:>7}"
+                  f"  {wrapper_times[-1]:>12.3f}  {KeyCompare.calls:>9}")
+        results[algo_name] = (dsu_times, wrapper_times)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    for algo_name, (dsu_times, wrapper_times) in results.items():
+        color = COLORS.get(algo_name, "gray")
+        ax.plot(sizes, dsu_times, marker="o", color=color, linewidth=2,
+                label=f"{algo_name} (key=)")
+        ax.plot(sizes, wrapper_times, marker="x", linestyle="--", color=color, linewidth=1.5,
+                label=f"{algo_name} (key per comparison)")
+    ax.set_title("Sorting by Key: Decorate-Sort-Undecorate vs Key per Comparison",
+                 fontsize=14, fontweight="bold")
+    ax.set_xlabel("Array Size (n)", fontsize=12)
+    ax.set_ylabel("Execution Time (ms)", fontsize=12)
+    ax.legend(fontsize=9)
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    fig.savefig(str(IMAGE_DIR / "key_sorting.png"), dpi=300, bbox_inches="tight")
+    plt.show()
+
+
+def string_comparison(sizes=(1000, 5000, 10000, 50000), repeats=3):
+    """String-specialized sorts vs the comparison sorts on STRING_INPUT_TYPES"""
+    algorithms = {
+        "MSD Radix Sort": msdRadixSort,
+        "Multikey Quicksort": multikeyQuickSort,
+        "Quick Sort Optimized": lambda arr: quickSortOptimized(arr, 0, len(arr) - 1),
+        "Merge Sort Optimized": lambda arr: mergeSortOptimized(arr, 0, len(arr) - 1),
+    }
+    styles = {"MSD Radix Sort": ("o", "-", "crimson"), "Multikey Quicksort": ("D", "-", "darkorange"),
+              "Quick Sort Optimized": ("^", "--", "green"), "Merge Sort Optimized": ("s", "--", "blue")}
+    results = {}
+
+    print("\n" + "=" * 80)
+    print("STRING SORTING  (median, ms)")
+    print("=" * 80)
+    for input_name, generator in STRING_INPUT_TYPES.items():
+        results[input_name] = {}
+        print(f"\n  {input_name}")
+        print(f"  {'algorithm':<22}" + "".join(f"{n:>10}" for n in sizes))
+        for algo_name, algo in algorithms.items():
+            results[input_name][algo_name] = benchmark(algo, generator, sizes, repeats)
+            print(f"  {algo_name:<22}" + "".join(f"{t:>10.2f}" if t is not None else f"{'ERROR':>10}"
+                                                 for t in results[input_name][algo_name]))
+
+    fig, axes = plt.subplots(1, len(STRING_INPUT_TYPES), figsize=(20, 6))
+    for ax, (input_name, by_algo) in zip(axes, results.items()):
+        for algo_name, times in by_algo.items():
+            valid = [(s, t) for s, t in zip(sizes, times) if t is not None]
+            if not valid:
+                continue
+            vs, vt = zip(*valid)
+            marker, linestyle, color = styles[algo_name]
+            ax.plot(vs, vt, marker=marker, linestyle=linestyle, color=color,
+                    label=algo_name, linewidth=2, markersize=7)
+        ax.set_title(input_name, fontsize=13, fontweight="bold")
+        ax.set_xlabel("Array Size (n)", fontsize=12)
+        ax.set_ylabel("Execution Time (ms)", fontsize=12)
+        ax.set_yscale("log")
+        ax.legend(fontsize=9)
+        ax.grid(True, alpha=0.3)
+    fig.suptitle("String Sorting: MSD Radix / Multikey Quicksort vs Comparison Sorts",
+                 fontsize=15, fontweight="bold")
+    plt.tight_layout()
+    fig.savefig(str(IMAGE_DIR / "string_sorting.png"), dpi=300, bbox_inches="tight")
+    plt.show()
+
+
+def list_footprint(arr):
+    """Bytes held by a list of boxed numbers: the pointer array plus every distinct object"""
+    return sys.getsizeof(arr) + sum(sys.getsizeof(v) for v in {id(v): v for v in arr}.values())
+
+
+def buffer_comparison(sizes=(1000, 5000, 10000, 50000), repeats=3):
+    """Boxed-list sorts vs the same algorithms on array('q') and NumPy int64 memory, in place"""
+    families = {
+        "Heap Sort": (heapSortOptimized, heapSortBuffer),
+        "Merge Sort": (mergeSortBottomUp, mergeSortBuffer),
+        "Quick Sort": (introSort, quickSortBuffer),
+    }
+    containers = {
+        "list": lambda data: list(data),
+        "array('q')": lambda data: array("q", data),
+        "numpy int64": lambda data: np.array(data, dtype=np.int64),
+    }
+    results = {}
+
+    print("\n" + "=" * 80)
+    print("TYPED-BUFFER SORTS  (throughput in M items/s, memory = data + peak extra)")
+    print("=" * 80)
+    print(f"  {'algorithm':<11} {'container':<12} {'n':>6}  {'time(ms)':>9}  {'Mitem/s':>8}"
+          f"  {'data(KB)':>9}  {'extra(KB)':>9}")
+    for family, (list_sort, buffer_sort) in families.items():
+        for container_name, make in containers.items():
+            sort_func = list_sort if container_name == "list" else buffer_sort
+            times = []
+            for size in sizes:
+                datasets = [[random.randint(1, 10_000) for _ in range(size)] for _ in range(repeats)]
+                source = cycle(datasets)
+                median_ms = measure_ms(sort_func, lambda: (make(next(source)),))
+
+                buf = make(datasets[0])
+                data_bytes = list_footprint(buf) if container_name == "list" else buf.nbytes \
+                    if hasattr(buf, "nbytes") else buf.itemsize * len(buf)
+                tracemalloc.start()
+                sort_func(buf)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                times.append(median_ms)
+                print(f"  {family:<11} {container_name:<12} {size:>6}  {median_ms:>9.3f}"
+                      f"  {size / median_ms / 1000:>8.3f}  {data_bytes / 1024:>9.1f}  {peak / 1024:>9.1f}")
+            results[(family, container_name)] = times
+
+    fig, axes = plt.subplots(1, len(families), figsize=(18, 5))
+    for ax, family in zip(axes, families):
+        for container_name, linestyle in zip(containers, ["-", "--", ":"]):
+            times = results[(family, container_name)]
+            ax.plot(sizes, [size / t / 1000 for size, t in zip(sizes, times)],
+                    marker="o", linestyle=linestyle, linewidth=2, label=container_name)
+        ax.set_title(family, fontsize=12, fontweight="bold")
+        ax.set_xlabel("Array size (n)")
+        ax.set_ylabel("Throughput (M items/s)")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    fig.savefig(str(IMAGE_DIR / "buffer_sorts.png"), dpi=300, bbox_inches="tight")
+    plt.show()
+
+
+def parallel_speedup(n=200_000, repeats=3):
+    """Speedup of the multi-process sort over single-process introsort, by core count and chunk size"""
+    chunk_factors = (1, 2, 4)
+    baseline, curves = speedup_curve(n, chunk_factors=chunk_factors, repeats=repeats)
+
+    print("\n" + "=" * 80)
+    print(f"PARALLEL SORT SPEEDUP  (n = {n}, single-process introsort = {baseline:.3f} ms)")
+    print("=" * 80)
+    for factor in chunk_factors:
+        print(f"\n  chunks = {factor} x cores")
+        print(f"  {'cores':>5}  {'time(ms)':>10}  {'speedup':>8}")
+        for cores, t, speedup in curves[factor]:
+            print(f"  {cores:>5}  {t:>10.3f}  {speedup:>7.2f}x")
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for factor, marker in zip(chunk_factors, ["o", "s", "^"]):
+        cores, _, speedups = zip(*curves[factor])
+        ax.plot(cores, speedups, marker=marker, linewidth=2, markersize=7,
+                label=f"{factor} chunk(s) per core")
+    ax.plot(cores, cores, linestyle="--", color="gray", label="Ideal (linear)")
+    ax.set_title(f"Parallel Sort Speedup (n = {n})", fontsize=14, fontweight="bold")
+    ax.set_xlabel("Worker processes", fontsize=12)
+    ax.set_ylabel("Speedup vs single-process introsort", fontsize=12)
+    ax.legend(fontsize=10)
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    fig.savefig(str(IMAGE_DIR / "parallel_speedup.png"), dpi=300, bbox_inches="tight")
+    plt.show()
+
+
 if __name__ == "__main__":
-    comprehensive_comparison()
+    results = comprehensive_comparison()
+    smart_sort_summary(results)
+    operation_counts()
+    key_sort_comparison()
+    string_comparison()
+    buffer_comparison()
+    parallel_speedup()
@@ -0,0 +1,142 @@
+import sys
+import tracemalloc
+
+
+class Counted:
+    """Element wrapper that counts every comparison made between wrapped values"""
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        Counted.comparisons += 1
+        return self.value >= other.value
+
+
+def count_comparisons(sort_func, arr):
+    """Run sort_func on a wrapped copy of arr and return the number of element comparisons"""
+    wrapped = [Counted(v) for v in arr]
+    Counted.comparisons = 0
+    sort_func(wrapped)
+    return Counted.comparisons
+
+
+class CountingList(list):
+    """
+    List that counts the writes into itself that change a slot, for element and slice
+    assignment alike: writing back the object a slot already holds (a slice write-back of a
+    sorting network, a self-swap) is not counted. Writes into temporary buffers that the sort
+    allocates itself are not seen, so for merge-based sorts this is not their total data movement.
+    A swap is two consecutive writes that exchange the values of two slots,
+    e.g. arr[i], arr[j] = arr[j], arr[i]; it counts as one swap and two writes.
+    Detection compares object identity, so elements should be distinct objects (Counted).
+    """
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.writes = 0
+        self.swaps = 0
+        self.last_write = None   # (index, value overwritten, value written)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            old = list.__getitem__(self, index)
+            self.writes += sum(1 for a, b in zip(old, value) if a is not b) + max(0, len(value) - len(old))
+            self.last_write = None
+            super().__setitem__(index, value)
+            return
+        if index < 0:
+            index += len(self)
+        old = list.__getitem__(self, index)
+        if value is old:
+            return
+        last = self.last_write
+        if last is not None and last[0] != index and last[2] is old and value is last[1]:
+            self.swaps += 1
+            self.last_write = None
+        else:
+            self.last_write = (index, old, value)
+        self.writes += 1
+        super().__setitem__(index, value)
+
+
+def max_call_depth(sort_func, arr):
+    """
+    Recursion depth of sort_func(arr): the largest number of frames of one function active
+    at the same time. Helpers called from a loop (swap, partition, heapify, wrappers) count
+    as depth 1 instead of adding to the sort's own nesting, so an iterative sort reports 1.
+    Uses sys.setprofile; calls into this module (the counting wrappers) are not counted.
+    """
+    own_file = __file__
+    active = {}
+    deepest = 0
+
+    def profiler(frame, event, arg):
+        nonlocal deepest
+        code = frame.f_code
+        if code.co_filename == own_file:
+            return
+        if event == "call":
+            depth = active.get(code, 0) + 1
+            active[code] = depth
+            if depth > deepest:
+                deepest = depth
+        elif event == "return":
+            active[code] -= 1
+
+    sys.setprofile(profiler)
+    try:
+        sort_func(arr)
+    finally:
+        sys.setprofile(None)
+    return deepest
+
+
+def aux_memory(sort_func, arr):
+    """Peak bytes allocated by sort_func(arr) beyond what was live when it started (tracemalloc)"""
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        sort_func(arr)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - base)
+
+
+def count_operations(sort_func, arr):
+    """
+    Counting mode: run sort_func on instrumented copies of arr and report
+    comparisons, swaps, writes (slot-changing writes into the input list), aux_bytes and depth.
+    The sorts themselves are untouched, so normal runs pay nothing for this.
+    Aux memory is measured on a plain copy so the wrappers do not inflate it;
+    the other counts come from one run on a CountingList of Counted values.
+    """
+    aux_bytes = aux_memory(sort_func, list(arr))
+
+    wrapped = CountingList(Counted(v) for v in arr)
+    Counted.comparisons = 0
+    depth = max_call_depth(sort_func, wrapped)
+    return {
+        "comparisons": Counted.comparisons,
+        "swaps": wrapped.swaps,
+        "writes": wrapped.writes,
+        "aux_bytes": aux_bytes,
+        "depth": depth,
+    }
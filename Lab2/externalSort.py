@@ -0,0 +1,196 @@
+import os
+import time
+import random
+import tempfile
+import matplotlib.pyplot as plt
+from array import array
+from heapSort import heapify_iterative
+from quickSort import introSort
+
+# a boxed int/float in a list costs ~8 bytes of pointer + ~24-32 bytes of object
+BYTES_PER_ITEM_IN_MEMORY = 40
+
+
+def write_dataset(path, values, typecode="q"):
+    with open(path, "wb") as f:
+        array(typecode, values).tofile(f)
+
+
+def read_dataset(path, typecode="q"):
+    data = array(typecode)
+    with open(path, "rb") as f:
+        data.frombytes(f.read())
+    return data
+
+
+def read_blocks(f, typecode, buffer_items, stats):
+    """Read a binary file in blocks of buffer_items values"""
+    itemsize = array(typecode).itemsize
+    while True:
+        raw = f.read(buffer_items * itemsize)
+        if not raw:
+            return
+        stats["bytes_read"] += len(raw)
+        yield array(typecode, raw)
+
+
+def buffered_reader(path, typecode, buffer_items, stats):
+    with open(path, "rb") as f:
+        for block in read_blocks(f, typecode, buffer_items, stats):
+            yield from block
+
+
+def write_block(f, block, typecode, stats):
+    data = array(typecode, block)
+    data.tofile(f)
+    stats["bytes_written"] += len(data) * data.itemsize
+
+
+def default_sort(arr):
+    introSort(arr, 0, len(arr) - 1)
+
+
+def create_runs(in_path, tmp_dir, typecode, chunk_items, sort_func, stats):
+    """Pass 0: sort memory-sized chunks and write each one as a binary run file"""
+    runs = []
+    with open(in_path, "rb") as f:
+        for block in read_blocks(f, typecode, chunk_items, stats):
+            chunk = block.tolist()
+            sort_func(chunk)
+            run_path = os.path.join(tmp_dir, f"run_0_{len(runs)}.bin")
+            with open(run_path, "wb") as out:
+                write_block(out, chunk, typecode, stats)
+            runs.append(run_path)
+    stats["passes"] += 1
+    stats["runs"] = len(runs)
+    return runs
+
+
+def merge_runs(run_paths, out_path, typecode, buffer_items, stats):
+    """
+    K-way merge of sorted run files into out_path.
+    The heap is the max-heap of heapify_iterative holding (-value, run) pairs,
+    so its root is always the smallest pending value.
+    """
+    readers = [buffered_reader(path, typecode, buffer_items, stats) for path in run_paths]
+    heap = []
+    for idx, reader in enumerate(readers):
+        for value in reader:
+            heap.append((-value, idx))
+            break
+    size = len(heap)
+    for i in range(size // 2 - 1, -1, -1):
+        heapify_iterative(heap, size, i)
+
+    out_buffer = []
+    with open(out_path, "wb") as out:
+        while size:
+            neg_value, idx = heap[0]
+            out_buffer.append(-neg_value)
+            if len(out_buffer) >= buffer_items:
+                write_block(out, out_buffer, typecode, stats)
+                out_buffer = []
+            nxt = next(readers[idx], None)
+            if nxt is None:
+                size -= 1
+                heap[0] = heap[size]
+                heap.pop()
+                if not size:
+                    break
+            else:
+                heap[0] = (-nxt, idx)
+            heapify_iterative(heap, size, 0)
+        if out_buffer:
+            write_block(out, out_buffer, typecode, stats)
+
+
+def externalSort(in_path, out_path, typecode="q", memory_budget=64 * 1024 * 1024,
+                 sort_func=default_sort, tmp_dir=None):
+    """
+    Sort a binary file of fixed-width numbers (array typecode) that may not fit in memory.
+    Runs of memory_budget size are sorted in memory, then merged k ways per pass, with
+    the fan-in bounded so that all read buffers plus the write buffer fit in the budget.
+    Returns statistics: passes, runs, bytes moved and throughput.
+    """
+    itemsize = array(typecode).itemsize
+    chunk_items = max(1, memory_budget // BYTES_PER_ITEM_IN_MEMORY)
+    buffer_items = max(1, min(chunk_items // 16, 1 << 16))
+    fan_in = max(2, chunk_items // buffer_items - 1)
+    stats = {"passes": 0, "runs": 0, "bytes_read": 0, "bytes_written": 0}
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        runs = create_runs(in_path, work_dir, typecode, chunk_items, sort_func, stats)
+        if not runs:
+            open(out_path, "wb").close()
+        level = 1
+        while len(runs) > fan_in:
+            merged = []
+            for g in range(0, len(runs), fan_in):
+                group = runs[g:g + fan_in]
+                run_path = os.path.join(work_dir, f"run_{level}_{len(merged)}.bin")
+                merge_runs(group, run_path, typecode, buffer_items, stats)
+                for path in group:
+                    os.remove(path)
+                merged.append(run_path)
+            runs = merged
+            stats["passes"] += 1
+            level += 1
+        if runs:
+            merge_runs(runs, out_path, typecode, buffer_items, stats)
+            stats["passes"] += 1
+    elapsed = time.perf_counter() - start
+
+    file_bytes = os.path.getsize(out_path)
+    stats["items"] = file_bytes // itemsize
+    stats["seconds"] = elapsed
+    stats["bytes_moved"] = stats["bytes_read"] + stats["bytes_written"]
+    stats["throughput_mb_s"] = file_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+    return stats
+
+
+def performance():
+    test_sizes = [50_000, 100_000, 250_000, 500_000]
+    memory_budget = 1024 * 1024   # small on purpose so every size spills to disk
+    results = []
+    header = f"{'n':<8} {'runs':>5} {'passes':>6} {'moved(MB)':>10} {'time(ms)':>10} {'MB/s':>8}"
+    print(f"\n=== EXTERNAL SORT (memory budget {memory_budget // 1024} KB) ===")
+    print(header)
+    print("-" * len(header))
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in test_sizes:
+            in_path = os.path.join(work_dir, f"input_{size}.bin")
+            out_path = os.path.join(work_dir, f"sorted_{size}.bin")
+            values = [random.randint(-10**12, 10**12) for _ in range(size)]
+            write_dataset(in_path, values)
+            stats = externalSort(in_path, out_path, memory_budget=memory_budget)
+            assert read_dataset(out_path).tolist() == sorted(values)
+            print(f"{size:<8} {stats['runs']:>5} {stats['passes']:>6} "
+                  f"{stats['bytes_moved'] / 2**20:>10.2f} {stats['seconds'] * 1000:>10.3f} "
+                  f"{stats['throughput_mb_s']:>8.2f}")
+            results.append(stats)
+
+    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    axes[0].plot(test_sizes, [s["seconds"] * 1000 for s in results], marker="o",
+        linestyle="-", color="brown", label="External Sort", linewidth=2, markersize=8)
+    axes[0].set_title("External Sort: Time")
+    axes[0].set_xlabel("Items on disk (n)")
+    axes[0].set_ylabel("Execution Time (ms)")
+    axes[0].legend()
+    axes[0].grid(True)
+
+    axes[1].plot(test_sizes, [s["throughput_mb_s"] for s in results], marker="s",
+        linestyle="-", color="darkorange", label="Throughput", linewidth=2, markersize=8)
+    axes[1].set_title("External Sort: Throughput")
+    axes[1].set_xlabel("Items on disk (n)")
+    axes[1].set_ylabel("MB/s")
+    axes[1].legend()
+    axes[1].grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
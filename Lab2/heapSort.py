@@ -1,6 +1,8 @@
-import time
 import matplotlib.pyplot as plt
 import random
+from keySort import sort_by_key
+from counters import count_comparisons
+from labtiming import measure, fresh_copies, STATS_HEADER, format_stats
 
 def heapify(arr, n, i):
     largest = i
@@ -14,7 +16,10 @@ def heapify(arr, n, i):
         arr[i], arr[largest] = arr[largest], arr[i]
         heapify(arr, n, largest)
 
-def heapSort(arr):
+def heapSort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(heapSort, arr, 0, len(arr) - 1, key, reverse)
+        return
     n = len(arr)
     for i in range(n // 2 - 1, -1, -1):
         heapify(arr, n, i)
@@ -22,15 +27,6 @@ def heapSort(arr):
         arr[0], arr[i] = arr[i], arr[0]
         heapify(arr, i, 0)
 
-def insertion_sort(arr, left, right):
-    for i in range(left + 1, right + 1):
-        key = arr[i]
-        j = i - 1
-        while j >= left and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
-
 def heapify_iterative(arr, n, i):
     temp = arr[i]
     while True:
@@ -47,7 +43,10 @@ def heapify_iterative(arr, n, i):
         i = child
     arr[i] = temp
 
-def heapSortOptimized(arr):
+def heapSortOptimized(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(heapSortOptimized, arr, 0, len(arr) - 1, key, reverse)
+        return
     n = len(arr)
     for i in range(n // 2 - 1, -1, -1):
         heapify_iterative(arr, n, i)
@@ -55,69 +54,134 @@ def heapSortOptimized(arr):
         arr[0], arr[i] = arr[i], arr[0]
         heapify_iterative(arr, i, 0)
 
+def sift_floyd(arr, n, i):
+    """Floyd's "bounce": sink the hole to a leaf along the larger child, then sift the value back up"""
+    temp = arr[i]
+    start = i
+    child = 2 * i + 1
+    while child < n:
+        if child + 1 < n and arr[child + 1] > arr[child]:
+            child += 1
+        arr[i] = arr[child]
+        i = child
+        child = 2 * i + 1
+    while i > start:
+        parent = (i - 1) // 2
+        if not temp > arr[parent]:
+            break
+        arr[i] = arr[parent]
+        i = parent
+    arr[i] = temp
+
+def heapSortFloyd(arr, key=None, reverse=False):
+    """Bottom-up heapsort: about n log n comparisons instead of 2 n log n"""
+    if key is not None or reverse:
+        sort_by_key(heapSortFloyd, arr, 0, len(arr) - 1, key, reverse)
+        return
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        heapify_iterative(arr, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        sift_floyd(arr, i, 0)
+
+def heapify_4ary(arr, n, i):
+    temp = arr[i]
+    while True:
+        first = 4 * i + 1
+        if first >= n:
+            break
+        child = first
+        largest = arr[first]
+        if first + 3 < n:
+            v = arr[first + 1]
+            if v > largest:
+                child, largest = first + 1, v
+            v = arr[first + 2]
+            if v > largest:
+                child, largest = first + 2, v
+            v = arr[first + 3]
+            if v > largest:
+                child, largest = first + 3, v
+        else:
+            for c in range(first + 1, n):
+                if arr[c] > largest:
+                    child, largest = c, arr[c]
+        if not largest > temp:
+            break
+        arr[i] = largest
+        i = child
+    arr[i] = temp
+
+def heapSort4ary(arr, key=None, reverse=False):
+    """Heapsort on a 4-ary heap: half the depth of the binary heap, up to 4 comparisons per level"""
+    if key is not None or reverse:
+        sort_by_key(heapSort4ary, arr, 0, len(arr) - 1, key, reverse)
+        return
+    n = len(arr)
+    for i in range((n - 2) // 4, -1, -1):
+        heapify_4ary(arr, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        heapify_4ary(arr, i, 0)
+
 
 def performance():
     test_sizes = [10, 50, 100, 500, 1000, 2000, 5000, 10000]
     repeats = 3
-    heap_times = []
-    heap_times_opt = []
-    header = "n  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
-    print("\n=== HEAP SORT PERFORMANCE - ORIGINAL O(n log n) ===")
-    print(header)
-    print("-" * len(header))
+    variants = [
+        ("ORIGINAL O(n log n)", "Original Heap Sort", heapSort),
+        ("OPTIMIZED (Iterative Heapify)", "Optimized (Iterative)", heapSortOptimized),
+        ("FLOYD BOTTOM-UP (Bounce)", "Floyd Bottom-Up", heapSortFloyd),
+        ("4-ARY HEAP", "4-ary Heap", heapSort4ary),
+    ]
+    times = {label: [] for _, label, _ in variants}
+    comparisons = {label: [] for _, label, _ in variants}
+    header = "n      " + STATS_HEADER + "  comparisons"
     datasets = {
         size: [[random.randint(1, 10000) for _ in range(size)] for _ in range(repeats)]
         for size in test_sizes
     }
-    for size in test_sizes:
-        heap_execs = []
-        for run in range(repeats):
-            arr = datasets[size][run].copy()
-            start = time.perf_counter()
-            heapSort(arr)
-            end = time.perf_counter()
-            heap_execs.append((end - start) * 1000)
-        avg_time = sum(heap_execs) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in heap_execs) + f"  {avg_time:>10.3f}"
-        print(row)
-        heap_times.append(avg_time)
-    print("\n=== HEAP SORT PERFORMANCE - OPTIMIZED (Iterative Heapify) ===")
-    print(header)
-    print("-" * len(header))
-    
-    for size in test_sizes:
-        heap_execs_opt = []
-        for run in range(repeats):
-            arr = datasets[size][run].copy()
-            start = time.perf_counter()
-            heapSortOptimized(arr)
-            end = time.perf_counter()
-            heap_execs_opt.append((end - start) * 1000)
-        
-        avg_time = sum(heap_execs_opt) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in heap_execs_opt) + f"  {avg_time:>10.3f}"
-        print(row)
-        heap_times_opt.append(avg_time)
-    
-    fig, ax = plt.subplots(figsize=(8, 5))
+    for title, label, sort_func in variants:
+        print(f"\n=== HEAP SORT PERFORMANCE - {title} ===")
+        print(header)
+        print("-" * len(header))
+        for size in test_sizes:
+            stats = measure(sort_func, fresh_copies(datasets[size]))
+            cmps = count_comparisons(sort_func, datasets[size][0])
+            print(f"{size:<6} " + format_stats(stats) + f"  {cmps:>11}")
+            times[label].append(stats["median"])
+            comparisons[label].append(cmps)
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    styles = {"Original Heap Sort": ("o", "-", "purple"), "Optimized (Iterative)": ("s", "--", "orange"),
+              "Floyd Bottom-Up": ("^", "-.", "brown"), "4-ary Heap": ("D", ":", "olive")}
+    for label in times:
+        marker, linestyle, color = styles[label]
+        axes[0].plot(test_sizes, times[label], marker=marker, linestyle=linestyle, color=color,
+            label=label, linewidth=2, markersize=8)
+        axes[1].plot(test_sizes, comparisons[label], marker=marker, linestyle=linestyle, color=color,
+            label=label, linewidth=2, markersize=8)
+    axes[0].set_title("Heap Sort: Linear Scale")
+    axes[0].set_xlabel("Array Size (n)")
+    axes[0].set_ylabel("Execution Time (ms)")
+    axes[0].legend()
+    axes[0].grid(True)
+    axes[1].set_title("Heap Sort: Element Comparisons")
+    axes[1].set_xlabel("Array Size (n)")
+    axes[1].set_ylabel("Comparisons")
+    axes[1].legend()
+    axes[1].grid(True)
 
-    ax.plot(test_sizes, heap_times, marker="o", linestyle="-", color="purple", 
-        label="Original Heap Sort", linewidth=2, markersize=8)
-    ax.plot(test_sizes, heap_times_opt, marker="s", linestyle="--", color="orange",
-        label="Optimized (Iterative)", linewidth=2, markersize=8)
-    ax.set_title("Heap Sort: Linear Scale")
-    ax.set_xlabel("Array Size (n)")
-    ax.set_ylabel("Execution Time (ms)")
-    ax.legend()
-    ax.grid(True)
-    
     plt.tight_layout()
     plt.show()
-    
-    print("\n=== OPTIMIZATION IMPROVEMENT ===")
+
+    print("\n=== OPTIMIZATION IMPROVEMENT (vs original) ===")
+    heap_times = times["Original Heap Sort"]
     for i, size in enumerate(test_sizes):
-        improvement = ((heap_times[i] - heap_times_opt[i]) / heap_times[i]) * 100
-        print(f"Size {size}: {improvement:+.2f}% improvement")
+        print(f"Size {size}: " + ", ".join(
+            f"{label} {((heap_times[i] - times[label][i]) / heap_times[i]) * 100:+.2f}%"
+            for label in list(times)[1:]))
 
 
 if __name__ == "__main__":
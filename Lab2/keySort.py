@@ -0,0 +1,21 @@
+def sort_by_key(sort_func, arr, left, right, key=None, reverse=False, keys=None):
+    """
+    Decorate-sort-undecorate for arr[left..right].
+    key is evaluated exactly once per element into (key, index) pairs and sort_func sorts the pairs;
+    a caller that already has the keys of arr[left..right] passes them as keys instead.
+    The index tie-break keeps equal keys in input order (also with reverse=True),
+    so the result is stable whatever sort_func is.
+    """
+    items = arr[left:right + 1]
+    if keys is None:
+        keys = items if key is None else [key(v) for v in items]
+    if reverse:
+        decorated = [(k, -i) for i, k in enumerate(keys)]
+    else:
+        decorated = list(zip(keys, range(len(items))))
+    sort_func(decorated)
+    if reverse:
+        decorated.reverse()
+        arr[left:right + 1] = [items[-i] for _, i in decorated]
+    else:
+        arr[left:right + 1] = [items[i] for _, i in decorated]
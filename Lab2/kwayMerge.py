@@ -0,0 +1,257 @@
+import heapq
+import random
+from bisect import bisect_left, bisect_right
+import matplotlib.pyplot as plt
+from mergeSort import mergeOptimized
+from adaptiveMergeSort import MIN_GALLOP
+from counters import Counted
+from labtiming import measure_ms, fresh_copies
+
+
+# head of a source that ran dry; it loses every match
+EXHAUSTED = object()
+
+
+def build_loser_tree(heads):
+    """
+    Tournament tree over k sources, given the current head of each.
+    Leaves sit at nodes k..2k-1; internal node i keeps the loser of the match played there
+    and loser[0] holds the overall winner. Ties go to the lower source index (stability).
+    """
+    k = len(heads)
+    loser = [0] * k
+    winner = [0] * (2 * k)
+    for i in range(k):
+        winner[k + i] = i
+    for node in range(k - 1, 0, -1):
+        a, b = winner[2 * node], winner[2 * node + 1]
+        x, y = heads[a], heads[b]
+        if y is not EXHAUSTED and (x is EXHAUSTED or (not x < y if b < a else y < x)):
+            a, b = b, a
+        winner[node], loser[node] = a, b
+    loser[0] = winner[1] if k > 1 else 0
+    return loser
+
+
+def merge_k(iterables):
+    """
+    Lazily merge any number of sorted iterables into one sorted stream, stable
+    (equal values come out in source order). Each output element replays only the
+    matches on its source's leaf-to-root path: ceil(log2 k) comparisons.
+    If every input is a list or tuple the bulk path (merge_k_lists) is used instead.
+    """
+    sources = list(iterables)
+    if sources and all(isinstance(s, (list, tuple)) for s in sources):
+        yield from merge_k_lists(sources)
+        return
+
+    iters = [iter(s) for s in sources]
+    k = len(iters)
+    if k == 0:
+        return
+    heads = [next(it, EXHAUSTED) for it in iters]
+    if k == 1:
+        if heads[0] is not EXHAUSTED:
+            yield heads[0]
+            yield from iters[0]
+        return
+
+    loser = build_loser_tree(heads)
+    while True:
+        w = loser[0]
+        value = heads[w]
+        if value is EXHAUSTED:
+            return
+        yield value
+        value = heads[w] = next(iters[w], EXHAUSTED)
+        node = (w + k) >> 1
+        while node:
+            c = loser[node]
+            other = heads[c]
+            if other is not EXHAUSTED and (value is EXHAUSTED
+                                           or (not value < other if c < w else other < value)):
+                loser[node] = w
+                w, value = c, other
+            node >>= 1
+        loser[0] = w
+
+
+def merge_k_lists(lists):
+    """
+    Bulk path of merge_k for in-memory sources, returned as one list.
+    Sources are read by index instead of next(). Once the same source has won
+    MIN_GALLOP times in a row, the runner-up's head (the best loser on the winner's path)
+    is bisected into it and the whole block below that bound is copied as one slice,
+    so sources that follow each other merge at memcpy speed.
+    """
+    lists = [s for s in lists if s]
+    k = len(lists)
+    if k == 0:
+        return []
+    if k == 1:
+        return list(lists[0])
+    out = []
+    append = out.append
+    pos = [0] * k
+    lens = [len(s) for s in lists]
+    heads = [s[0] for s in lists]
+    loser = build_loser_tree(heads)
+    last = streak = 0
+    while True:
+        w = loser[0]
+        if w == last:
+            streak += 1
+        else:
+            last, streak = w, 1
+        src = lists[w]
+        i = pos[w]
+        if streak < MIN_GALLOP:
+            append(heads[w])
+            i += 1
+        else:
+            node = (w + k) >> 1
+            r = loser[node]
+            while node:
+                c = loser[node]
+                other, best = heads[c], heads[r]
+                if other is not EXHAUSTED and (best is EXHAUSTED
+                                               or (not best < other if c < r else other < best)):
+                    r = c
+                node >>= 1
+            bound = heads[r]
+            if bound is EXHAUSTED:
+                end = lens[w]
+            elif w < r:  # equal values from the lower-indexed source come first
+                end = bisect_right(src, bound, i)
+            else:
+                end = bisect_left(src, bound, i)
+            end = max(end, i + 1)
+            out.extend(src[i:end])
+            i = end
+            streak = 0
+        pos[w] = i
+        value = heads[w] = src[i] if i < lens[w] else EXHAUSTED
+        node = (w + k) >> 1
+        while node:
+            c = loser[node]
+            other = heads[c]
+            if other is not EXHAUSTED and (value is EXHAUSTED
+                                           or (not value < other if c < w else other < value)):
+                loser[node] = w
+                w, value = c, other
+            node >>= 1
+        loser[0] = w
+        if value is EXHAUSTED:
+            break
+    return out
+
+
+def pairwise_merge(lists):
+    """Baseline: rounds of two-way mergeOptimized until one list is left"""
+    lists = [list(s) for s in lists]
+    if not lists:
+        return []
+    while len(lists) > 1:
+        merged = []
+        for j in range(0, len(lists) - 1, 2):
+            a, b = lists[j], lists[j + 1]
+            combined = a + b
+            if a and b:
+                mergeOptimized(combined, 0, len(a) - 1, len(combined) - 1)
+            merged.append(combined)
+        if len(lists) % 2:
+            merged.append(lists[-1])
+        lists = merged
+    return lists[0]
+
+
+def gen_random_sources(k, total):
+    """k sorted lists of interleaved random values"""
+    return [sorted(random.randint(0, 1_000_000) for _ in range(total // k)) for _ in range(k)]
+
+
+def gen_clustered_sources(k, total):
+    """k sorted shards whose ranges mostly follow each other (log segments by time)"""
+    size = total // k
+    sources = []
+    for s in range(k):
+        base = s * size
+        sources.append(sorted(base + random.randint(-size // 10, size) for _ in range(size)))
+    return sources
+
+
+def performance():
+    total = 200_000
+    ks = [2, 8, 32, 128]
+    repeats = 3
+    scenarios = {"Random interleaved": gen_random_sources, "Clustered shards": gen_clustered_sources}
+    methods = {
+        "merge_k (iterators)": lambda lists: list(merge_k(iter(s) for s in lists)),
+        "merge_k (lists, bulk)": merge_k_lists,
+        "heapq.merge": lambda lists: list(heapq.merge(*lists)),
+        "pairwise mergeOptimized": pairwise_merge,
+    }
+    styles = {"merge_k (iterators)": ("o", "-", "red"), "merge_k (lists, bulk)": ("D", "-", "darkred"),
+              "heapq.merge": ("s", "--", "black"), "pairwise mergeOptimized": ("^", "--", "blue")}
+    results = {}
+
+    for scenario, generator in scenarios.items():
+        header = "k      " + "  ".join(f"{name:>24}" for name in methods)
+        print(f"\n=== K-WAY MERGE: {scenario.upper()} (n = {total}, median, ms) ===")
+        print(header)
+        print("-" * len(header))
+        times = {name: [] for name in methods}
+        for k in ks:
+            datasets = [generator(k, total) for _ in range(repeats)]
+            for name, method in methods.items():
+                times[name].append(measure_ms(method, fresh_copies(datasets)))
+            print(f"{k:<6} " + "  ".join(f"{times[name][-1]:>24.3f}" for name in methods))
+        results[scenario] = times
+
+    # comparisons per output element on random sources (what expensive keys pay for)
+    count_total = 20_000
+    counted_methods = {name: methods[name] for name in
+                       ("merge_k (iterators)", "heapq.merge", "pairwise mergeOptimized")}
+    print(f"\n=== COMPARISONS PER OUTPUT ELEMENT (random sources, n = {count_total}) ===")
+    header = "k      " + "  ".join(f"{name:>24}" for name in counted_methods)
+    print(header)
+    print("-" * len(header))
+    per_element = {name: [] for name in counted_methods}
+    for k in ks:
+        lists = [[Counted(v) for v in source] for source in gen_random_sources(k, count_total)]
+        n = sum(map(len, lists))
+        for name, method in counted_methods.items():
+            Counted.comparisons = 0
+            method(lists)
+            per_element[name].append(Counted.comparisons / n)
+        print(f"{k:<6} " + "  ".join(f"{per_element[name][-1]:>24.2f}" for name in counted_methods))
+
+    fig, axes = plt.subplots(1, len(scenarios) + 1, figsize=(22, 5))
+    for name, series in per_element.items():
+        marker, linestyle, color = styles[name]
+        axes[-1].plot(ks, series, marker=marker, linestyle=linestyle, color=color,
+                      label=name, linewidth=2, markersize=7)
+    axes[-1].set_xscale("log", base=2)
+    axes[-1].set_title("Comparisons per Output Element (random sources)")
+    axes[-1].set_xlabel("Number of sources (k)")
+    axes[-1].set_ylabel("Comparisons")
+    axes[-1].legend()
+    axes[-1].grid(True)
+    for ax, (scenario, times) in zip(axes, results.items()):
+        for name, method_times in times.items():
+            marker, linestyle, color = styles[name]
+            ax.plot(ks, method_times, marker=marker, linestyle=linestyle, color=color,
+                label=name, linewidth=2, markersize=7)
+        ax.set_xscale("log", base=2)
+        ax.set_title(f"K-Way Merge: {scenario} (n = {total})")
+        ax.set_xlabel("Number of sources (k)")
+        ax.set_ylabel("Execution Time (ms)")
+        ax.legend()
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
@@ -1,6 +1,10 @@
-import time
 import matplotlib.pyplot as plt
 import random
+import tracemalloc
+from math import isqrt
+from keySort import sort_by_key
+from smallSort import binary_insertion_sort, MERGE_THRESHOLD
+from labtiming import measure, STATS_HEADER, format_stats
 
 def merge(arr, left, mid, right):
     n1 = mid - left + 1
@@ -38,22 +42,16 @@ def merge(arr, left, mid, right):
         k += 1
 
 
-def mergeSort(arr, left, right):
+def mergeSort(arr, left, right, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(lambda a: mergeSort(a, 0, len(a) - 1), arr, left, right, key, reverse)
+        return
     if left < right:
         mid = (left + right) // 2
         mergeSort(arr, left, mid)
         mergeSort(arr, mid + 1, right)
         merge(arr, left, mid, right)
 
-def insertion_sort(arr, left, right):
-    for i in range(left + 1, right + 1):
-        key = arr[i]
-        j = i - 1
-        while j >= left and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
-
 def mergeOptimized(arr, left, mid, right):
     n1 = mid - left + 1
     n2 = right - mid
@@ -82,62 +80,259 @@ def mergeOptimized(arr, left, mid, right):
         j += 1
         k += 1
 
-def mergeSortOptimized(arr, left, right, threshold=10):
+def mergeSortOptimized(arr, left, right, threshold=MERGE_THRESHOLD, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(lambda a: mergeSortOptimized(a, 0, len(a) - 1, threshold),
+                    arr, left, right, key, reverse)
+        return
     if right - left + 1 <= threshold:
-        insertion_sort(arr, left, right)
+        binary_insertion_sort(arr, left, right)
     elif left < right:
         mid = (left + right) // 2
         mergeSortOptimized(arr, left, mid, threshold)
         mergeSortOptimized(arr, mid + 1, right, threshold)
         mergeOptimized(arr, left, mid, right)
 
+def mergeSortBottomUp(arr, key=None, reverse=False):
+    """Iterative merge sort: one auxiliary buffer, source/destination swap every pass"""
+    if key is not None or reverse:
+        sort_by_key(mergeSortBottomUp, arr, 0, len(arr) - 1, key, reverse)
+        return
+    n = len(arr)
+    if n < 2:
+        return
+    src = arr
+    dst = [0] * n
+    width = 1
+    while width < n:
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            if mid >= right or src[mid - 1] <= src[mid]:
+                dst[left:right] = src[left:right]
+                continue
+            i, j, k = left, mid, left
+            while i < mid and j < right:
+                if src[i] <= src[j]:
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                k += 1
+            if i < mid:
+                dst[k:right] = src[i:mid]
+            else:
+                dst[k:right] = src[j:right]
+        src, dst = dst, src
+        width *= 2
+    if src is not arr:
+        arr[:] = src
+
+# block swaps move at most this many elements through a temporary slice
+SWAP_CHUNK = 64
+INPLACE_BLOCK = 20
+
+def swap_ranges(arr, a, b, n):
+    """Exchange arr[a:a+n] and arr[b:b+n] (non-overlapping) in slices of at most SWAP_CHUNK"""
+    for off in range(0, n, SWAP_CHUNK):
+        step = min(SWAP_CHUNK, n - off)
+        i, j = a + off, b + off
+        arr[i:i + step], arr[j:j + step] = arr[j:j + step], arr[i:i + step]
+
+def rotate(arr, a, m, b):
+    """Rotate arr[a:b] so that arr[m] comes first, by block swaps (Gries-Mills), O(1) memory"""
+    i = m - a
+    j = b - m
+    while i != j:
+        if i > j:
+            swap_ranges(arr, m - i, m, j)
+            i -= j
+        else:
+            swap_ranges(arr, m - i, m + j - i, i)
+            j -= i
+    swap_ranges(arr, m - i, m, i)
+
+def merge_with_small_buffer(arr, a, m, b):
+    """Stable merge of arr[a:m] and arr[m:b] copying out only the shorter run"""
+    if m - a <= b - m:
+        left = arr[a:m]
+        i, j, k = 0, m, a
+        n1 = len(left)
+        while i < n1 and j < b:
+            if arr[j] < left[i]:
+                arr[k] = arr[j]
+                j += 1
+            else:
+                arr[k] = left[i]
+                i += 1
+            k += 1
+        if i < n1:
+            arr[k:k + n1 - i] = left[i:]
+    else:
+        right = arr[m:b]
+        i, j, k = m - 1, len(right) - 1, b - 1
+        while i >= a and j >= 0:
+            if right[j] < arr[i]:
+                arr[k] = arr[i]
+                i -= 1
+            else:
+                arr[k] = right[j]
+                j -= 1
+            k -= 1
+        if j >= 0:
+            arr[a:a + j + 1] = right[:j + 1]
+
+def sym_merge(arr, a, m, b, buffer_limit=0):
+    """
+    Stable in-place merge of sorted arr[a:m] and arr[m:b] (Kim & Kutzner's SymMerge).
+    Binary-search a symmetric split, rotate the middle, recurse on both halves.
+    O(log n) stack; runs of at most buffer_limit elements are merged through a copy instead.
+    """
+    if min(m - a, b - m) <= buffer_limit:
+        merge_with_small_buffer(arr, a, m, b)
+        return
+    if m - a == 1:
+        # first element of the right run that is not smaller than arr[a]
+        lo, hi = m, b
+        while lo < hi:
+            h = (lo + hi) // 2
+            if arr[h] < arr[a]:
+                lo = h + 1
+            else:
+                hi = h
+        if lo > m:
+            rotate(arr, a, m, lo)
+        return
+    if b - m == 1:
+        # first element of the left run that is larger than arr[m]
+        lo, hi = a, m
+        while lo < hi:
+            h = (lo + hi) // 2
+            if not arr[m] < arr[h]:
+                lo = h + 1
+            else:
+                hi = h
+        if lo < m:
+            rotate(arr, lo, m, b)
+        return
+
+    mid = (a + b) // 2
+    n = mid + m
+    if m > mid:
+        start, r = n - b, mid
+    else:
+        start, r = a, m
+    p = n - 1
+    while start < r:
+        c = (start + r) // 2
+        if not arr[p - c] < arr[c]:
+            start = c + 1
+        else:
+            r = c
+    end = n - start
+    if start < m < end:
+        rotate(arr, start, m, end)
+    if a < start < mid:
+        sym_merge(arr, a, start, mid, buffer_limit)
+    if mid < end < b:
+        sym_merge(arr, mid, end, b, buffer_limit)
+
+def mergeSortInPlace(arr, buffered=True, key=None, reverse=False):
+    """
+    Stable merge sort with no O(n) buffer: binary insertion sort on blocks of
+    INPLACE_BLOCK, then bottom-up passes of sym_merge. O(n log^2 n) moves.
+    buffered=True lets sym_merge copy out runs of up to isqrt(n) elements (O(sqrt n) memory);
+    buffered=False is pure SymMerge with O(1) extra memory.
+    With key/reverse the decorated copy costs O(n) like every other sort here.
+    """
+    if key is not None or reverse:
+        sort_by_key(lambda a: mergeSortInPlace(a, buffered), arr, 0, len(arr) - 1, key, reverse)
+        return
+    n = len(arr)
+    buffer_limit = isqrt(n) if buffered else 0
+    for low in range(0, n, INPLACE_BLOCK):
+        binary_insertion_sort(arr, low, min(low + INPLACE_BLOCK, n) - 1)
+    width = INPLACE_BLOCK
+    while width < n:
+        for a in range(0, n - width, 2 * width):
+            m = a + width
+            b = min(a + 2 * width, n)
+            if arr[m] < arr[m - 1]:
+                sym_merge(arr, a, m, b, buffer_limit)
+        width *= 2
+
 
 def performance():
     """Performance testing for Merge Sort - Original vs Optimized"""
     test_sizes = [10, 50, 100, 500, 1000, 2000, 5000, 10000]
-    repeats = 3
     
     merge_times = []
     merge_times_opt = []
+    merge_times_bu = []
+    merge_times_ip = []
     
-    header = "n  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
+    header = "n      " + STATS_HEADER
     print("\n=== MERGE SORT PERFORMANCE - ORIGINAL O(n log n) ===")
     print(header)
     print("-" * len(header))
     
     for size in test_sizes:
-        merge_execs = []
-        for _ in range(repeats):
-            arr = [random.randint(1, 10000) for _ in range(size)]
-            start = time.perf_counter()
-            mergeSort(arr, 0, len(arr) - 1)
-            end = time.perf_counter()
-            merge_execs.append((end - start) * 1000)
-        
-        avg_time = sum(merge_execs) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in merge_execs) + f"  {avg_time:>10.3f}"
-        print(row)
-        merge_times.append(avg_time)
+        stats = measure(lambda arr: mergeSort(arr, 0, len(arr) - 1), lambda: ([random.randint(1, 10000) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        merge_times.append(stats["median"])
     
     print("\n=== MERGE SORT PERFORMANCE - OPTIMIZED (Adaptive + Insertion Sort) ===")
     print(header)
     print("-" * len(header))
     
     for size in test_sizes:
-        merge_execs_opt = []
-        for _ in range(repeats):
-            arr = [random.randint(1, 10000) for _ in range(size)]
-            start = time.perf_counter()
-            mergeSortOptimized(arr, 0, len(arr) - 1)
-            end = time.perf_counter()
-            merge_execs_opt.append((end - start) * 1000)
-        
-        avg_time = sum(merge_execs_opt) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in merge_execs_opt) + f"  {avg_time:>10.3f}"
-        print(row)
-        merge_times_opt.append(avg_time)
+        stats = measure(lambda arr: mergeSortOptimized(arr, 0, len(arr) - 1), lambda: ([random.randint(1, 10000) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        merge_times_opt.append(stats["median"])
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    print("\n=== MERGE SORT PERFORMANCE - BOTTOM-UP (Ping-Pong Buffer) ===")
+    print(header)
+    print("-" * len(header))
+
+    for size in test_sizes:
+        stats = measure(mergeSortBottomUp, lambda: ([random.randint(1, 10000) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        merge_times_bu.append(stats["median"])
+
+    print("\n=== MERGE SORT PERFORMANCE - IN-PLACE (SymMerge + sqrt(n) Buffer) ===")
+    print(header)
+    print("-" * len(header))
+
+    for size in test_sizes:
+        stats = measure(mergeSortInPlace, lambda: ([random.randint(1, 10000) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        merge_times_ip.append(stats["median"])
+
+    memory_variants = {
+        "Optimized": lambda a: mergeSortOptimized(a, 0, len(a) - 1),
+        "Bottom-Up": mergeSortBottomUp,
+        "In-Place sqrt(n)": mergeSortInPlace,
+        "In-Place O(1)": lambda a: mergeSortInPlace(a, buffered=False),
+    }
+    memory_sizes = [1000, 10000, 50000]
+    memory_peaks = {name: [] for name in memory_variants}
+    mem_header = "n       " + "  ".join(f"{name:>17}" for name in memory_variants)
+    print("\n=== MERGE SORT PEAK EXTRA MEMORY (tracemalloc, KB) ===")
+    print(mem_header)
+    print("-" * len(mem_header))
+    for size in memory_sizes:
+        data = [random.randint(1, 10000) for _ in range(size)]
+        for name, sort_func in memory_variants.items():
+            arr = data.copy()
+            tracemalloc.start()
+            sort_func(arr)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            memory_peaks[name].append(peak / 1024)
+        print(f"{size:<7} " + "  ".join(f"{memory_peaks[name][-1]:>17.1f}" for name in memory_variants))
+
+    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
 
     axes[0].plot(test_sizes, merge_times, marker="s", linestyle="-", color="blue",
         label="Original Merge Sort", linewidth=2, markersize=8)
@@ -151,19 +346,36 @@ def performance():
         label="Original Merge Sort", linewidth=2, markersize=8)
     axes[1].plot(test_sizes, merge_times_opt, marker="^", linestyle="--", color="cyan",
         label="Optimized (Adaptive)", linewidth=2, markersize=8)
+    axes[1].plot(test_sizes, merge_times_bu, marker="o", linestyle=":", color="navy",
+        label="Bottom-Up (Ping-Pong)", linewidth=2, markersize=8)
+    axes[1].plot(test_sizes, merge_times_ip, marker="D", linestyle="-.", color="darkred",
+        label="In-Place (SymMerge)", linewidth=2, markersize=8)
     axes[1].set_title("Merge Sort: Original vs Optimized")
     axes[1].set_xlabel("Array Size (n)")
     axes[1].set_ylabel("Execution Time (ms)")
     axes[1].legend()
     axes[1].grid(True)
 
+    for name, marker in zip(memory_variants, ["^", "o", "D", "x"]):
+        axes[2].plot(memory_sizes, memory_peaks[name], marker=marker, label=name, linewidth=2, markersize=8)
+    axes[2].set_xscale("log")
+    axes[2].set_yscale("log")
+    axes[2].set_title("Merge Sort: Peak Extra Memory")
+    axes[2].set_xlabel("Array Size (n)")
+    axes[2].set_ylabel("Peak Memory (KB)")
+    axes[2].legend()
+    axes[2].grid(True)
+
     plt.tight_layout()
     plt.show()
     
     print("\n=== OPTIMIZATION IMPROVEMENT ===")
     for i, size in enumerate(test_sizes):
         improvement = ((merge_times[i] - merge_times_opt[i]) / merge_times[i]) * 100
-        print(f"Size {size}: {improvement:+.2f}% improvement")
+        improvement_bu = ((merge_times[i] - merge_times_bu[i]) / merge_times[i]) * 100
+        improvement_ip = ((merge_times[i] - merge_times_ip[i]) / merge_times[i]) * 100
+        print(f"Size {size}: {improvement:+.2f}% improvement, bottom-up {improvement_bu:+.2f}%,"
+              f" in-place {improvement_ip:+.2f}%")
 
 
 if __name__ == "__main__":
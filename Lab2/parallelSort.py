@@ -0,0 +1,130 @@
+import os
+import heapq
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from quickSort import introSort
+from keySort import sort_by_key
+from labtiming import measure_ms, fresh_copies
+
+
+def buffer_typecode(arr):
+    """
+    'q' if every value is an int (not a bool) in int64 range, 'd' if every value is a float,
+    None if the values need pickled lists. Mixed ints and floats are not packed as 'd':
+    that would turn the ints into floats and round those above 2**53.
+    """
+    if all(type(v) is int for v in arr):
+        if not arr or (-2**63 <= min(arr) and max(arr) < 2**63):
+            return "q"
+        return None
+    if all(type(v) is float for v in arr):
+        return "d"
+    return None
+
+
+def chunk_bounds(n, chunks):
+    chunks = max(1, min(chunks, n))
+    step, extra = divmod(n, chunks)
+    bounds = []
+    start = 0
+    for c in range(chunks):
+        end = start + step + (1 if c < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def sort_shared_chunk(shm_name, typecode, start, end):
+    """
+    Worker: sort one slice of the shared buffer. The slice is copied into a list, sorted with
+    introSort and copied back (introSort's slice write-backs need a list, not a typed view).
+    The view is released before close() even when sorting fails, so the worker's own
+    exception is what reaches the caller.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf.cast(typecode) as view:
+            chunk = view[start:end].tolist()
+            introSort(chunk, 0, len(chunk) - 1)
+            view[start:end] = array(typecode, chunk)
+    finally:
+        shm.close()
+
+
+def sort_list_chunk(chunk):
+    """Worker fallback for values that have no fixed-width representation"""
+    introSort(chunk, 0, len(chunk) - 1)
+    return chunk
+
+
+def parallelSort(arr, workers=None, chunks=None, executor=None, key=None, reverse=False):
+    """
+    Sort arr in place across processes: introSort on chunks, then a k-way heap merge.
+    int64/float data is exchanged through one shared-memory buffer instead of pickled lists.
+    Pass an existing ProcessPoolExecutor to avoid paying pool start-up on every call.
+    With key/reverse the (key, index) pairs travel as pickled lists.
+    """
+    if key is not None or reverse:
+        sort_by_key(lambda a: parallelSort(a, workers, chunks, executor),
+                    arr, 0, len(arr) - 1, key, reverse)
+        return
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or workers
+    if n < 2:
+        return
+    bounds = chunk_bounds(n, chunks)
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        typecode = buffer_typecode(arr)
+        if typecode is None:
+            futures = [executor.submit(sort_list_chunk, arr[start:end]) for start, end in bounds]
+            runs = [f.result() for f in futures]
+        else:
+            data = array(typecode, arr)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+            try:
+                with shm.buf.cast(typecode) as view:
+                    view[:n] = data
+                    futures = [executor.submit(sort_shared_chunk, shm.name, typecode, start, end)
+                               for start, end in bounds]
+                    for f in futures:
+                        f.result()
+                    runs = [view[start:end].tolist() for start, end in bounds]
+            finally:
+                shm.close()
+                shm.unlink()
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    arr[:] = list(heapq.merge(*runs))
+
+
+def speedup_curve(n=200_000, core_counts=None, chunk_factors=(1, 2, 4), repeats=3):
+    """
+    Time parallelSort against a single-process introSort for every (cores, chunks) pair.
+    Returns (baseline_ms, {chunk_factor: [(cores, ms, speedup), ...]}).
+    """
+    max_cores = os.cpu_count() or 1
+    if core_counts is None:
+        core_counts = sorted({1, 2, 4, 8, 16, max_cores} & set(range(1, max_cores + 1)))
+    datasets = [[random.randint(1, 10_000_000) for _ in range(n)] for _ in range(repeats)]
+
+    baseline = measure_ms(lambda arr: introSort(arr, 0, len(arr) - 1), fresh_copies(datasets))
+
+    curves = {factor: [] for factor in chunk_factors}
+    for cores in core_counts:
+        with ProcessPoolExecutor(max_workers=cores) as executor:
+            parallelSort([3, 1, 2], workers=cores, executor=executor)  # warm up the workers
+            for factor in chunk_factors:
+                median_ms = measure_ms(
+                    lambda arr: parallelSort(arr, workers=cores, chunks=cores * factor, executor=executor),
+                    fresh_copies(datasets))
+                curves[factor].append((cores, median_ms, baseline / median_ms))
+    return baseline, curves
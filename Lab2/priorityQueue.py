@@ -0,0 +1,265 @@
+import heapq
+import random
+from itertools import count
+import matplotlib.pyplot as plt
+from labtiming import measure_ms, fresh_copies
+
+
+class DaryHeap:
+    """
+    Array-backed d-ary min-heap of (priority, item) pairs.
+    Priorities and items live in two flat parallel lists so only priorities are compared.
+    Sifting moves a hole instead of swapping, as heapify_iterative does.
+    With indexed=True a position index item -> slot is kept up to date,
+    which enables decrease_key (items must then be unique and hashable).
+    """
+
+    def __init__(self, d=4, pairs=None, indexed=False):
+        if d < 2:
+            raise ValueError("arity d must be at least 2")
+        self.d = d
+        self.keys = []
+        self.items = []
+        self.pos = {} if indexed else None
+        if pairs:
+            self.heapify(pairs)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def peek(self):
+        return self.keys[0], self.items[0]
+
+    def heapify(self, pairs):
+        """Bulk build in O(n) from (priority, item) pairs, replacing the current contents"""
+        self.keys = [p for p, _ in pairs]
+        self.items = [item for _, item in pairs]
+        if self.pos is not None:
+            self.pos = {item: i for i, item in enumerate(self.items)}
+        for i in range((len(self.keys) - 2) // self.d, -1, -1):
+            self.sift_down(i)
+
+    def push(self, priority, item=None):
+        self.keys.append(priority)
+        self.items.append(item)
+        if self.pos is not None:
+            self.pos[item] = len(self.keys) - 1
+        self.sift_up(len(self.keys) - 1)
+
+    def pop(self):
+        keys, items = self.keys, self.items
+        last_key = keys.pop()
+        last_item = items.pop()
+        if not keys:
+            if self.pos is not None:
+                del self.pos[last_item]
+            return last_key, last_item
+        top = keys[0], items[0]
+        keys[0] = last_key
+        items[0] = last_item
+        if self.pos is not None:
+            del self.pos[top[1]]
+            self.pos[last_item] = 0
+        self.sift_down(0)
+        return top
+
+    def pushpop(self, priority, item=None):
+        """Push then pop, in a single sift; returns the new pair if it is the smallest"""
+        keys = self.keys
+        if not keys or not keys[0] < priority:
+            return priority, item
+        return self.replace(priority, item)
+
+    def replace(self, priority, item=None):
+        """Pop then push, in a single sift; the heap must not be empty"""
+        top = self.keys[0], self.items[0]
+        self.keys[0] = priority
+        self.items[0] = item
+        if self.pos is not None:
+            del self.pos[top[1]]
+            self.pos[item] = 0
+        self.sift_down(0)
+        return top
+
+    def decrease_key(self, item, priority):
+        i = self.pos[item]
+        if self.keys[i] < priority:
+            raise ValueError("new priority is larger than the current one")
+        self.keys[i] = priority
+        self.sift_up(i)
+
+    def sift_up(self, i):
+        keys, items, pos, d = self.keys, self.items, self.pos, self.d
+        key = keys[i]
+        item = items[i]
+        while i > 0:
+            parent = (i - 1) // d
+            parent_key = keys[parent]
+            if not key < parent_key:
+                break
+            keys[i] = parent_key
+            items[i] = items[parent]
+            if pos is not None:
+                pos[items[i]] = i
+            i = parent
+        keys[i] = key
+        items[i] = item
+        if pos is not None:
+            pos[item] = i
+
+    def sift_down(self, i):
+        keys, items, pos, d = self.keys, self.items, self.pos, self.d
+        n = len(keys)
+        key = keys[i]
+        item = items[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            child = first
+            child_key = keys[first]
+            for c in range(first + 1, min(first + d, n)):
+                if keys[c] < child_key:
+                    child = c
+                    child_key = keys[c]
+            if not child_key < key:
+                break
+            keys[i] = child_key
+            items[i] = items[child]
+            if pos is not None:
+                pos[items[i]] = i
+            i = child
+        keys[i] = key
+        items[i] = item
+        if pos is not None:
+            pos[item] = i
+
+
+# ── workloads: each returns nothing, runs one full scenario ─────────────────
+def workload_fill_drain(make_heap, priorities):
+    heap = make_heap()
+    for p in priorities:
+        heap.push(p)
+    while len(heap):
+        heap.pop()
+
+
+def workload_mixed(make_heap, priorities):
+    heap = make_heap()
+    for idx, p in enumerate(priorities):
+        heap.push(p)
+        if idx % 3 == 2:
+            heap.pop()
+            heap.pop()
+
+
+def workload_top_k(make_heap, priorities):
+    k = max(1, len(priorities) // 100)
+    heap = make_heap()
+    heap.heapify([(p, None) for p in priorities[:k]])
+    for p in priorities[k:]:
+        heap.pushpop(p)
+
+
+def workload_decrease_key(make_heap, priorities):
+    heap = make_heap(indexed=True)
+    heap.heapify([(p, idx) for idx, p in enumerate(priorities)])
+    for idx in range(0, len(priorities), 2):
+        heap.decrease_key(idx, priorities[idx] - 5000)
+    while len(heap):
+        heap.pop()
+
+
+class HeapqAdapter:
+    """heapq behind the DaryHeap interface; decrease_key pushes a new entry and skips stale ones (lazy deletion)"""
+
+    def __init__(self, indexed=False):
+        self.heap = []
+        self.best = {} if indexed else None
+        self.live = 0
+        self.tiebreak = count()
+
+    def __len__(self):
+        return self.live
+
+    def heapify(self, pairs):
+        self.heap = [(p, next(self.tiebreak), item) for p, item in pairs]
+        heapq.heapify(self.heap)
+        self.live = len(self.heap)
+        if self.best is not None:
+            self.best = {item: p for p, item in pairs}
+
+    def push(self, priority, item=None):
+        heapq.heappush(self.heap, (priority, next(self.tiebreak), item))
+        self.live += 1
+
+    def pop(self):
+        while True:
+            priority, _, item = heapq.heappop(self.heap)
+            if self.best is None or self.best.get(item) == priority:
+                if self.best is not None:
+                    del self.best[item]
+                self.live -= 1
+                return priority, item
+
+    def pushpop(self, priority, item=None):
+        priority, _, item = heapq.heappushpop(self.heap, (priority, next(self.tiebreak), item))
+        return priority, item
+
+    def decrease_key(self, item, priority):
+        self.best[item] = priority
+        heapq.heappush(self.heap, (priority, next(self.tiebreak), item))
+
+
+WORKLOADS = {
+    "Fill + Drain": workload_fill_drain,
+    "Mixed push/pop": workload_mixed,
+    "Streaming Top-k": workload_top_k,
+    "Decrease-Key": workload_decrease_key,
+}
+
+
+def performance():
+    test_sizes = [1000, 5000, 10000, 50000]
+    arities = [2, 4, 8]
+    repeats = 3
+    contenders = {"heapq": lambda indexed=False: HeapqAdapter(indexed)}
+    for d in arities:
+        contenders[f"{d}-ary"] = lambda indexed=False, d=d: DaryHeap(d, indexed=indexed)
+    results = {}
+
+    for workload_name, workload in WORKLOADS.items():
+        header = "n       " + "  ".join(f"{name:>10}" for name in contenders) + "   best d"
+        print(f"\n=== {workload_name.upper()} (median, ms) ===")
+        print(header)
+        print("-" * len(header))
+        times = {name: [] for name in contenders}
+        for size in test_sizes:
+            datasets = [[random.randint(1, 1_000_000) for _ in range(size)] for _ in range(repeats)]
+            for name, make_heap in contenders.items():
+                times[name].append(measure_ms(lambda data: workload(make_heap, data), fresh_copies(datasets)))
+            best_d = min(arities, key=lambda d: times[f"{d}-ary"][-1])
+            print(f"{size:<7} " + "  ".join(f"{times[name][-1]:>10.3f}" for name in contenders)
+                  + f"   {best_d:>6}")
+        results[workload_name] = times
+
+    fig, axes = plt.subplots(1, len(WORKLOADS), figsize=(22, 5))
+    styles = {"heapq": ("o", "-", "black"), "2-ary": ("s", "--", "purple"),
+              "4-ary": ("^", "--", "orange"), "8-ary": ("D", "--", "teal")}
+    for ax, (workload_name, times) in zip(axes, results.items()):
+        for name, algo_times in times.items():
+            marker, linestyle, color = styles[name]
+            ax.plot(test_sizes, algo_times, marker=marker, linestyle=linestyle, color=color,
+                label=name, linewidth=2, markersize=6)
+        ax.set_title(workload_name)
+        ax.set_xlabel("Operations (n)")
+        ax.set_ylabel("Execution Time (ms)")
+        ax.legend()
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
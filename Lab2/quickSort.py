@@ -1,6 +1,9 @@
-import time
 import matplotlib.pyplot as plt
 import random
+from heapSort import heapSortOptimized
+from keySort import sort_by_key
+from smallSort import small_sort, QUICK_THRESHOLD
+from labtiming import measure, STATS_HEADER, format_stats
 
 def partition(arr, low, high):
     pivot = arr[high]
@@ -17,21 +20,15 @@ def partition(arr, low, high):
 def swap(arr, i, j):
     arr[i], arr[j] = arr[j], arr[i]
 
-def quickSort(arr, low, high):
+def quickSort(arr, low, high, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(lambda a: quickSort(a, 0, len(a) - 1), arr, low, high, key, reverse)
+        return
     if low < high:
         pi = partition(arr, low, high)
         quickSort(arr, low, pi - 1)
         quickSort(arr, pi + 1, high)
 
-def insertion_sort(arr, low, high):
-    for i in range(low + 1, high + 1):
-        key = arr[i]
-        j = i - 1
-        while j >= low and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
-
 def median_of_three(arr, low, high):
     mid = (low + high) // 2
     if arr[low] > arr[mid]:
@@ -56,10 +53,14 @@ def partitionOptimized(arr, low, high):
     swap(arr, i + 1, high)
     return i + 1
 
-def quickSortOptimized(arr, low, high, threshold=16):
+def quickSortOptimized(arr, low, high, threshold=QUICK_THRESHOLD, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(lambda a: quickSortOptimized(a, 0, len(a) - 1, threshold),
+                    arr, low, high, key, reverse)
+        return
     while low < high:
         if high - low + 1 <= threshold:
-            insertion_sort(arr, low, high)
+            small_sort(arr, low, high)
             break
         
         pi = partitionOptimized(arr, low, high)
@@ -71,54 +72,121 @@ def quickSortOptimized(arr, low, high, threshold=16):
             quickSortOptimized(arr, pi + 1, high, threshold)
             high = pi - 1
 
+def median_index(arr, a, b, c):
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+def ninther(arr, low, high):
+    """Tukey's ninther: median of the medians of three evenly spaced triples"""
+    step = (high - low + 1) // 8
+    mid = (low + high) // 2
+    return median_index(arr,
+        median_index(arr, low, low + step, low + 2 * step),
+        median_index(arr, mid - step, mid, mid + step),
+        median_index(arr, high - 2 * step, high - step, high))
+
+def partition3(arr, low, high, pivot):
+    """
+    Dutch national flag partition around pivot.
+    Returns (lt, gt): arr[low:lt] < pivot, arr[lt:gt + 1] == pivot, arr[gt + 1:high + 1] > pivot
+    """
+    lt = i = low
+    gt = high
+    while i <= gt:
+        v = arr[i]
+        if v < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = v
+            lt += 1
+            i += 1
+        elif pivot < v:
+            arr[i] = arr[gt]
+            arr[gt] = v
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def heap_sort_range(arr, low, high):
+    part = arr[low:high + 1]
+    heapSortOptimized(part)
+    arr[low:high + 1] = part
+
+def introsort_loop(arr, low, high, depth, threshold):
+    while high - low + 1 > threshold:
+        if depth == 0:
+            heap_sort_range(arr, low, high)
+            return
+        depth -= 1
+        if high - low + 1 >= 40:
+            p = ninther(arr, low, high)
+        else:
+            p = median_index(arr, low, (low + high) // 2, high)
+        lt, gt = partition3(arr, low, high, arr[p])
+
+        if lt - low < high - gt:
+            introsort_loop(arr, low, lt - 1, depth, threshold)
+            low = gt + 1
+        else:
+            introsort_loop(arr, gt + 1, high, depth, threshold)
+            high = lt - 1
+    small_sort(arr, low, high)
+
+def introSort(arr, low, high, threshold=16, key=None, reverse=False):
+    """
+    Introsort: 3-way quicksort with ninther pivots, switching to heapSortOptimized
+    once the recursion depth passes 2*log2(n). O(n log n) on every input, O(n) on all-equal keys.
+    """
+    if key is not None or reverse:
+        sort_by_key(lambda a: introSort(a, 0, len(a) - 1, threshold), arr, low, high, key, reverse)
+        return
+    if low < high:
+        depth_limit = 2 * (high - low + 1).bit_length()
+        introsort_loop(arr, low, high, depth_limit, threshold)
+
 
 def performance():
     test_sizes = [10, 50, 100, 500, 1000, 2000, 5000, 10000]
-    repeats = 3
     
     quick_times = []
     quick_times_opt = []
+    intro_times = []
     
-    header = "n  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
+    header = "n      " + STATS_HEADER
     print("\n=== QUICK SORT PERFORMANCE - ORIGINAL O(n log n) average ===")
     print(header)
     print("-" * len(header))
     
     for size in test_sizes:
-        quick_execs = []
-        
-        for i in range(repeats):
-            arr = [random.randint(1, 10000) for _ in range(size)]
-            
-            start = time.perf_counter()
-            quickSort(arr, 0, len(arr) - 1)
-            end = time.perf_counter()
-            quick_execs.append((end - start) * 1000)
-        
-        avg_time = sum(quick_execs) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in quick_execs) + f"  {avg_time:>10.3f}"
-        print(row)
-        quick_times.append(avg_time)
+        stats = measure(lambda arr: quickSort(arr, 0, len(arr) - 1),
+                        lambda: ([random.randint(1, 10000) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        quick_times.append(stats["median"])
     
     print("\n=== QUICK SORT PERFORMANCE - OPTIMIZED (Median-of-Three + Insertion Sort) ===")
     print(header)
     print("-" * len(header))
     
     for size in test_sizes:
-        quick_execs_opt = []
-        
-        for i in range(repeats):
-            arr = [random.randint(1, 10000) for _ in range(size)]
-            
-            start = time.perf_counter()
-            quickSortOptimized(arr, 0, len(arr) - 1)
-            end = time.perf_counter()
-            quick_execs_opt.append((end - start) * 1000)
-        
-        avg_time = sum(quick_execs_opt) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in quick_execs_opt) + f"  {avg_time:>10.3f}"
-        print(row)
-        quick_times_opt.append(avg_time)
+        stats = measure(lambda arr: quickSortOptimized(arr, 0, len(arr) - 1),
+                        lambda: ([random.randint(1, 10000) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        quick_times_opt.append(stats["median"])
+
+    print("\n=== QUICK SORT PERFORMANCE - INTROSORT (3-Way + Ninther + Heap Sort Fallback) ===")
+    print(header)
+    print("-" * len(header))
+
+    for size in test_sizes:
+        stats = measure(lambda arr: introSort(arr, 0, len(arr) - 1),
+                        lambda: ([random.randint(1, 10000) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        intro_times.append(stats["median"])
 
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
@@ -134,6 +202,8 @@ def performance():
         label="Original Quick Sort", linewidth=2, markersize=8)
     axes[1].plot(test_sizes, quick_times_opt, marker="D", linestyle="--", color="lime",
         label="Optimized (Median-of-Three)", linewidth=2, markersize=8)
+    axes[1].plot(test_sizes, intro_times, marker="o", linestyle=":", color="darkgreen",
+        label="Introsort (3-Way + Ninther)", linewidth=2, markersize=8)
     axes[1].set_title("Quick Sort: Original vs Optimized")
     axes[1].set_xlabel("Array Size (n)")
     axes[1].set_ylabel("Execution Time (ms)")
@@ -146,7 +216,8 @@ def performance():
     print("\n=== OPTIMIZATION IMPROVEMENT ===")
     for i, size in enumerate(test_sizes):
         improvement = ((quick_times[i] - quick_times_opt[i]) / quick_times[i]) * 100
-        print(f"Size {size}: {improvement:+.2f}% improvement")
+        improvement_intro = ((quick_times[i] - intro_times[i]) / quick_times[i]) * 100
+        print(f"Size {size}: {improvement:+.2f}% improvement, introsort {improvement_intro:+.2f}%")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,209 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from quickSort import introSort
+from keySort import sort_by_key
+from labtiming import measure_ms, fresh_copies
+
+RADIX_BITS = 16
+SIGN_BIT = np.uint64(1 << 63)
+# below this size converting to NumPy costs more than a comparison sort
+SMALL_N = 128
+# counting sort wins while the key range stays within a small multiple of n
+COUNTING_RANGE_FACTOR = 4
+COUNTING_MIN_RANGE = 1 << 12
+
+
+class UnsupportedKeyError(ValueError):
+    """The keys cannot be ordered by a numeric backend (non-numeric, out of int64 range, NaN)"""
+
+
+def write_back(arr, ordered):
+    if isinstance(arr, np.ndarray):
+        arr[...] = ordered
+    else:
+        arr[:] = ordered.tolist()
+
+
+def counting_sorted(values, lo, hi):
+    counts = np.bincount(values - lo, minlength=hi - lo + 1)
+    return np.repeat(np.arange(lo, hi + 1, dtype=values.dtype), counts)
+
+
+def counting_range_ok(lo, hi, n):
+    """True while max - min stays small enough next to n for counting sort's O(n + k) table"""
+    return hi - lo <= max(COUNTING_RANGE_FACTOR * n, COUNTING_MIN_RANGE)
+
+
+def countingSort(arr, key=None, reverse=False):
+    """
+    Counting sort for integer keys - O(n + k) with k = max - min + 1.
+    A range out of proportion to n (counting_range_ok) is radix sorted instead of allocating k counters.
+    """
+    if len(arr) < 2:
+        return
+    if key is not None or reverse:
+        sort_by_numeric_key(arr, key, reverse, "iu")
+        return
+    values = np.asarray(arr)
+    if values.dtype.kind not in "iu":
+        raise UnsupportedKeyError("countingSort needs integer keys")
+    lo, hi = int(values.min()), int(values.max())
+    if counting_range_ok(lo, hi, len(values)):
+        write_back(arr, counting_sorted(values, lo, hi))
+    else:
+        write_back(arr, values[radix_argsort(values)])
+
+
+def to_ordered_bits(values):
+    """
+    Map int64/float64 values to uint64 keys whose unsigned order equals the numeric order.
+    Ints flip the sign bit; floats flip the sign bit of positives and every bit of negatives.
+    """
+    if values.dtype.kind == "f":
+        bits = values.astype(np.float64).view(np.uint64)
+        negative = (bits & SIGN_BIT) != 0
+        return np.where(negative, ~bits, bits | SIGN_BIT)
+    if values.dtype.kind == "u":
+        return values.astype(np.uint64)
+    return values.astype(np.int64).view(np.uint64) ^ SIGN_BIT
+
+
+def radix_argsort(values):
+    """
+    Stable permutation sorting values, by LSD radix over RADIX_BITS-bit digits of the ordered keys.
+    Each digit pass is a stable counting pass (NumPy's stable sort on uint16 is a radix pass);
+    digits that are equal for every element are skipped, so narrow key ranges need few passes.
+    """
+    keys = to_ordered_bits(np.asarray(values))
+    perm = np.arange(len(keys))
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    for shift in range(0, 64, RADIX_BITS):
+        digits = ((keys >> np.uint64(shift)) & mask).astype(np.uint16)
+        if digits.min() == digits.max():
+            continue
+        order = np.argsort(digits, kind="stable")
+        keys = keys[order]
+        perm = perm[order]
+    return perm
+
+
+def argsort_keys(keys, reverse=False):
+    """Stable radix argsort; with reverse the order is descending but equal keys keep input order"""
+    if reverse:
+        return len(keys) - 1 - radix_argsort(keys[::-1])[::-1]
+    return radix_argsort(keys)
+
+
+def sort_by_numeric_key(arr, key, reverse, kinds="iuf", keys=None):
+    """Evaluate key once per element (unless keys are given), argsort the key array and permute arr"""
+    if keys is None:
+        keys = arr if key is None else [key(v) for v in arr]
+    keys = np.asarray(keys)
+    if keys.dtype.kind not in kinds:
+        raise UnsupportedKeyError("numeric keys required")
+    perm = argsort_keys(keys, reverse)
+    if isinstance(arr, np.ndarray):
+        arr[...] = arr[perm]
+    else:
+        arr[:] = [arr[i] for i in perm.tolist()]
+
+
+def radixSortLSD(arr, key=None, reverse=False):
+    """LSD radix sort of int64 or float values; works on lists and NumPy arrays in place"""
+    if len(arr) < 2:
+        return
+    if key is not None or reverse:
+        sort_by_numeric_key(arr, key, reverse)
+        return
+    values = np.asarray(arr)
+    if values.dtype.kind not in "iuf":
+        raise UnsupportedKeyError("radixSortLSD needs int64 or float keys")
+    write_back(arr, values[radix_argsort(values)])
+
+
+def linearSort(arr, key=None, reverse=False):
+    """
+    Pick a backend from the detected keys: counting sort for small integer ranges,
+    radix sort for other int64/float keys, introSort for small or non-numeric inputs.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    if n < SMALL_N:
+        introSort(arr, 0, n - 1, key=key, reverse=reverse)
+        return
+    if key is not None or reverse:
+        keys = [key(v) for v in arr] if key is not None else arr
+        if np.asarray(keys).dtype.kind in "iuf":
+            sort_by_numeric_key(arr, key, reverse, keys=keys)
+        else:
+            sort_by_key(lambda a: introSort(a, 0, len(a) - 1), arr, 0, n - 1, key, reverse, keys)
+        return
+    values = np.asarray(arr)
+    kind = values.dtype.kind
+    if kind in "iu":
+        lo, hi = int(values.min()), int(values.max())
+        if counting_range_ok(lo, hi, n):
+            write_back(arr, counting_sorted(values, lo, hi))
+        else:
+            write_back(arr, values[radix_argsort(values)])
+    elif kind == "f":
+        write_back(arr, values[radix_argsort(values)])
+    else:
+        introSort(arr, 0, n - 1)
+
+
+def performance():
+    from comparison import INPUT_TYPES
+
+    test_sizes = [10, 50, 100, 500, 1000, 2000, 5000, 10000]
+    repeats = 3
+    algorithms = {
+        "Introsort": lambda arr: introSort(arr, 0, len(arr) - 1),
+        "Counting Sort": countingSort,
+        "Radix Sort (LSD)": radixSortLSD,
+        "Linear Dispatch": linearSort,
+    }
+    styles = {"Introsort": ("X", "-", "darkgreen"), "Counting Sort": ("o", "-", "crimson"),
+              "Radix Sort (LSD)": ("s", "-", "darkorange"), "Linear Dispatch": ("^", "--", "black")}
+    results = {}
+
+    header = "n  " + "  ".join(f"{name:>18}" for name in algorithms)
+    for input_name, generator in INPUT_TYPES.items():
+        print(f"\n=== {input_name.upper()} (median, ms) ===")
+        print(header)
+        print("-" * len(header))
+        times = {name: [] for name in algorithms}
+        for size in test_sizes:
+            datasets = [generator(size) for _ in range(repeats)]
+            for algo_name, algo in algorithms.items():
+                try:
+                    times[algo_name].append(measure_ms(algo, fresh_copies(datasets)))
+                except UnsupportedKeyError:
+                    times[algo_name].append(None)
+            print(f"{size:<6} " + "  ".join(f"{times[name][-1]:>18.3f}" if times[name][-1] is not None
+                                             else f"{'N/A':>18}" for name in algorithms))
+        results[input_name] = times
+
+    fig, axes = plt.subplots(2, 4, figsize=(22, 10))
+    for idx, (input_name, times) in enumerate(results.items()):
+        ax = axes[idx // 4][idx % 4]
+        for algo_name, algo_times in times.items():
+            valid = [(s, t) for s, t in zip(test_sizes, algo_times) if t is not None]
+            if valid:
+                vs, vt = zip(*valid)
+                marker, linestyle, color = styles[algo_name]
+                ax.plot(vs, vt, marker=marker, linestyle=linestyle, color=color,
+                    label=algo_name, linewidth=1.8, markersize=5)
+        ax.set_title(input_name)
+        ax.set_xlabel("Array Size (n)")
+        ax.set_ylabel("Execution Time (ms)")
+        ax.legend(fontsize=7)
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
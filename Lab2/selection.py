@@ -0,0 +1,177 @@
+import random
+import matplotlib.pyplot as plt
+from heapSort import heapify_iterative
+from quickSort import partitionOptimized, partition3, quickSortOptimized
+from priorityQueue import DaryHeap
+from smallSort import small_sort
+from labtiming import measure_ms, fresh_copies
+
+# quickselect may touch this many times n elements before switching to median of medians
+WORK_FACTOR = 4
+
+
+def median_of_medians(arr, low, high):
+    """Pivot value guaranteed to have at least ~30% of arr[low..high] on each side"""
+    medians = []
+    for start in range(low, high + 1, 5):
+        group = arr[start:min(start + 5, high + 1)]
+        small_sort(group, 0, len(group) - 1)
+        medians.append(group[(len(group) - 1) // 2])
+    if len(medians) <= 5:
+        small_sort(medians, 0, len(medians) - 1)
+        return medians[(len(medians) - 1) // 2]
+    return nth_element(medians, (len(medians) - 1) // 2)
+
+
+def nth_element(arr, k, low=0, high=None):
+    """
+    Introselect: place the k-th smallest of arr[low..high] at index k,
+    with smaller-or-equal values before it and larger-or-equal after. Returns arr[k].
+    Quickselect on partitionOptimized while the partitions shrink fast enough,
+    then median-of-medians pivots with a 3-way partition - O(n) worst case.
+    """
+    if high is None:
+        high = len(arr) - 1
+    if not low <= k <= high:
+        raise IndexError("k is outside arr[low..high]")
+    budget = WORK_FACTOR * (high - low + 1)
+    while low < high:
+        if budget > 0:
+            budget -= high - low + 1
+            p = partitionOptimized(arr, low, high)
+            if k == p:
+                return arr[k]
+            if k < p:
+                high = p - 1
+            else:
+                low = p + 1
+        else:
+            pivot = median_of_medians(arr, low, high)
+            lt, gt = partition3(arr, low, high, pivot)
+            if k < lt:
+                high = lt - 1
+            elif k > gt:
+                low = gt + 1
+            else:
+                return arr[k]
+    return arr[k]
+
+
+def select(arr, k):
+    """k-th smallest value (0-based) without modifying arr"""
+    return nth_element(list(arr), k)
+
+
+def median(arr):
+    return select(arr, (len(arr) - 1) // 2)
+
+
+def partial_sort(arr, k):
+    """
+    Put the k smallest values of arr, sorted, in arr[:k]; the rest of arr is left in no particular order.
+    A max-heap of the first k (heapify_iterative) keeps the best candidates - O(n log k).
+    """
+    n = len(arr)
+    k = min(k, n)
+    if k <= 0:
+        return
+    for i in range(k // 2 - 1, -1, -1):
+        heapify_iterative(arr, k, i)
+    for i in range(k, n):
+        if arr[i] < arr[0]:
+            arr[0], arr[i] = arr[i], arr[0]
+            heapify_iterative(arr, k, 0)
+    for i in range(k - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        heapify_iterative(arr, i, 0)
+
+
+def top_k_stream(iterable, k, largest=False):
+    """
+    The k smallest (or largest) values of any iterable, sorted, in O(k) memory.
+    Smallest: max-heap maintained with heapify_iterative. Largest: a 4-ary DaryHeap min-heap.
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    if largest:
+        heap = DaryHeap(4)
+        for value in it:
+            if len(heap) < k:
+                heap.push(value)
+            else:
+                heap.pushpop(value)
+        out = [heap.pop()[0] for _ in range(len(heap))]
+        out.reverse()
+        return out
+
+    heap = []
+    for value in it:
+        heap.append(value)
+        if len(heap) == k:
+            break
+    size = len(heap)
+    for i in range(size // 2 - 1, -1, -1):
+        heapify_iterative(heap, size, i)
+    for value in it:
+        if value < heap[0]:
+            heap[0] = value
+            heapify_iterative(heap, size, 0)
+    for i in range(size - 1, 0, -1):
+        heap[0], heap[i] = heap[i], heap[0]
+        heapify_iterative(heap, i, 0)
+    return heap
+
+
+def performance():
+    test_sizes = [10000, 50000]
+    ratios = [0.001, 0.01, 0.1, 0.5]
+    repeats = 3
+
+    def full_sort(arr, k):
+        quickSortOptimized(arr, 0, len(arr) - 1)
+        return arr[:k]
+
+    operations = {
+        "Full quickSortOptimized": full_sort,
+        "nth_element (k-th)": lambda arr, k: nth_element(arr, k - 1),
+        "partial_sort (k smallest)": partial_sort,
+        "top_k_stream": lambda arr, k: top_k_stream(iter(arr), k),
+    }
+    styles = {"Full quickSortOptimized": ("o", "-", "green"), "nth_element (k-th)": ("s", "--", "blue"),
+              "partial_sort (k smallest)": ("^", "--", "purple"), "top_k_stream": ("D", "--", "orange")}
+    results = {}
+
+    for size in test_sizes:
+        header = "k/n     " + "  ".join(f"{name:>26}" for name in operations)
+        print(f"\n=== SELECTION n = {size} (median, ms) ===")
+        print(header)
+        print("-" * len(header))
+        datasets = [[random.randint(1, 1_000_000) for _ in range(size)] for _ in range(repeats)]
+        times = {name: [] for name in operations}
+        for ratio in ratios:
+            k = max(1, int(size * ratio))
+            for name, op in operations.items():
+                times[name].append(measure_ms(lambda arr: op(arr, k), fresh_copies(datasets)))
+            print(f"{ratio:<7} " + "  ".join(f"{times[name][-1]:>26.3f}" for name in operations))
+        results[size] = times
+
+    fig, axes = plt.subplots(1, len(test_sizes), figsize=(14, 5))
+    for ax, size in zip(axes, test_sizes):
+        for name, op_times in results[size].items():
+            marker, linestyle, color = styles[name]
+            ax.plot(ratios, op_times, marker=marker, linestyle=linestyle, color=color,
+                label=name, linewidth=2, markersize=7)
+        ax.set_xscale("log")
+        ax.set_title(f"Selection vs Full Sort (n = {size})")
+        ax.set_xlabel("k / n")
+        ax.set_ylabel("Execution Time (ms)")
+        ax.legend()
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
@@ -1,8 +1,12 @@
-import time
 import matplotlib.pyplot as plt
 import random
+from keySort import sort_by_key
+from labtiming import measure, STATS_HEADER, format_stats
 
-def slowsort(arr, i, j):
+def slowsort(arr, i, j, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(lambda a: slowsort(a, 0, len(a) - 1), arr, i, j, key, reverse)
+        return
     if i >= j:
         return
 
@@ -21,7 +25,10 @@ def is_sorted(arr, i, j):
             return False
     return True
 
-def slowsortOptimized(arr, i, j):
+def slowsortOptimized(arr, i, j, key=None, reverse=False):
+    if key is not None or reverse:
+        sort_by_key(lambda a: slowsortOptimized(a, 0, len(a) - 1), arr, i, j, key, reverse)
+        return
     if i >= j:
         return
     
@@ -37,54 +44,104 @@ def slowsortOptimized(arr, i, j):
 
     slowsortOptimized(arr, i, j - 1)
 
+def fenwick_add(tree, k, delta):
+    k += 1
+    while k < len(tree):
+        tree[k] += delta
+        k += k & -k
+
+def fenwick_prefix(tree, k):
+    """Sum of the first k entries"""
+    total = 0
+    while k > 0:
+        total += tree[k]
+        k -= k & -k
+    return total
+
+def build_descents(arr):
+    """descents[k] = 1 where arr[k] > arr[k + 1], plus a Fenwick tree over them"""
+    descents = [1 if arr[k] > arr[k + 1] else 0 for k in range(len(arr) - 1)]
+    tree = [0] * (len(descents) + 1)
+    for k, d in enumerate(descents):
+        if d:
+            fenwick_add(tree, k, d)
+    return descents, tree
+
+def update_descents(arr, descents, tree, k):
+    if 0 <= k < len(descents):
+        d = 1 if arr[k] > arr[k + 1] else 0
+        if d != descents[k]:
+            fenwick_add(tree, k, d - descents[k])
+            descents[k] = d
+
+def slowsort_tracked(arr, i, j, descents, tree):
+    if i >= j:
+        return
+
+    if fenwick_prefix(tree, j) == fenwick_prefix(tree, i):
+        return
+
+    mid = (i + j) // 2
+    slowsort_tracked(arr, i, mid, descents, tree)
+    slowsort_tracked(arr, mid + 1, j, descents, tree)
+
+    if arr[mid] > arr[j]:
+        arr[mid], arr[j] = arr[j], arr[mid]
+        for k in (mid - 1, mid, j - 1, j):
+            update_descents(arr, descents, tree, k)
+
+    slowsort_tracked(arr, i, j - 1, descents, tree)
+
+def slowsortTracked(arr, i, j, key=None, reverse=False):
+    """
+    slowsortOptimized with the is_sorted scan replaced by a Fenwick tree of descents:
+    arr[i..j] is sorted iff it holds no descent, an O(log n) range-sum query,
+    and each swap updates the four descents it can change.
+    """
+    if key is not None or reverse:
+        sort_by_key(lambda a: slowsortTracked(a, 0, len(a) - 1), arr, i, j, key, reverse)
+        return
+    descents, tree = build_descents(arr)
+    slowsort_tracked(arr, i, j, descents, tree)
+
 def performance():
     test_sizes = [5, 10, 15, 20, 25, 30]
-    repeats = 3
     
     slow_times = []
     slow_times_opt = []
+    slow_times_tracked = []
     
-    header = "n  " + "  ".join(f"run{i + 1}(ms)" for i in range(repeats)) + "  avg(ms)"
+    header = "n      " + STATS_HEADER
     print("\n=== SLOW SORT PERFORMANCE - ORIGINAL (multiply-and-surrender paradigm) ===")
     print("This algorithm is intentionally slow!")
     print(header)
     print("-" * len(header))
     
     for size in test_sizes:
-        slow_execs = []
-        
-        for _ in range(repeats):
-            arr = [random.randint(1, 100) for _ in range(size)]
-            
-            start = time.perf_counter()
-            slowsort(arr, 0, len(arr) - 1)
-            end = time.perf_counter()
-            slow_execs.append((end - start) * 1000)
-        
-        avg_time = sum(slow_execs) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in slow_execs) + f"  {avg_time:>10.3f}"
-        print(row)
-        slow_times.append(avg_time)
+        stats = measure(lambda arr: slowsort(arr, 0, len(arr) - 1),
+                        lambda: ([random.randint(1, 100) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        slow_times.append(stats["median"])
     
     print("\n=== SLOW SORT PERFORMANCE - OPTIMIZED (Early Termination) ===")
     print(header)
     print("-" * len(header))
     
     for size in test_sizes:
-        slow_execs_opt = []
-        
-        for _ in range(repeats):
-            arr = [random.randint(1, 100) for _ in range(size)]
-            
-            start = time.perf_counter()
-            slowsortOptimized(arr, 0, len(arr) - 1)
-            end = time.perf_counter()
-            slow_execs_opt.append((end - start) * 1000)
-        
-        avg_time = sum(slow_execs_opt) / repeats
-        row = f"{size:<6} " + "  ".join(f"{t:>10.3f}" for t in slow_execs_opt) + f"  {avg_time:>10.3f}"
-        print(row)
-        slow_times_opt.append(avg_time)
+        stats = measure(lambda arr: slowsortOptimized(arr, 0, len(arr) - 1),
+                        lambda: ([random.randint(1, 100) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        slow_times_opt.append(stats["median"])
+
+    print("\n=== SLOW SORT PERFORMANCE - TRACKED (Fenwick Tree of Descents) ===")
+    print(header)
+    print("-" * len(header))
+
+    for size in test_sizes:
+        stats = measure(lambda arr: slowsortTracked(arr, 0, len(arr) - 1),
+                        lambda: ([random.randint(1, 100) for _ in range(size)],))
+        print(f"{size:<6} " + format_stats(stats))
+        slow_times_tracked.append(stats["median"])
 
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
@@ -100,6 +157,8 @@ def performance():
         label="Original Slow Sort", linewidth=2, markersize=8)
     axes[1].plot(test_sizes, slow_times_opt, marker="v", linestyle="--", color="darkred",
         label="Optimized (Early Termination)", linewidth=2, markersize=8)
+    axes[1].plot(test_sizes, slow_times_tracked, marker="s", linestyle=":", color="salmon",
+        label="Tracked (Fenwick Descents)", linewidth=2, markersize=8)
     axes[1].set_title("Slow Sort: Original vs Optimized")
     axes[1].set_xlabel("Array Size (n)")
     axes[1].set_ylabel("Execution Time (ms)")
@@ -112,7 +171,8 @@ def performance():
     print("\n=== OPTIMIZATION IMPROVEMENT ===")
     for i, size in enumerate(test_sizes):
         improvement = ((slow_times[i] - slow_times_opt[i]) / slow_times[i]) * 100 if slow_times[i] > 0 else 0
-        print(f"Size {size}: {improvement:+.2f}% improvement")
+        improvement_tracked = ((slow_times[i] - slow_times_tracked[i]) / slow_times[i]) * 100 if slow_times[i] > 0 else 0
+        print(f"Size {size}: {improvement:+.2f}% improvement, tracked {improvement_tracked:+.2f}%")
 
 if __name__ == "__main__":
     performance()
\ No newline at end of file
@@ -0,0 +1,213 @@
+import random
+from bisect import bisect_right
+import matplotlib.pyplot as plt
+from labtiming import measure_ms, fresh_copies
+
+# Comparator lists (i, j), i < j, layer by layer.
+# n <= 11 and n == 16 are the smallest known networks (sizes proven optimal up to 11);
+# 12..15 are Green's 16-input network with the top lines removed, which is one
+# comparator over the best known size for 12 and 13 and matches it for 14 and 15.
+GREEN_16 = [
+    (0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10),
+    (0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (10, 15), (11, 12),
+    (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (14, 15),
+    (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14), (13, 15),
+    (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14),
+    (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14),
+    (2, 4), (3, 6), (9, 12), (11, 13),
+    (3, 5), (6, 8), (7, 9), (10, 12),
+    (3, 4), (5, 6), (7, 8), (9, 10), (11, 12),
+    (6, 7), (8, 9),
+]
+
+NETWORKS = {
+    2: [(0, 1)],
+    3: [(0, 2), (0, 1), (1, 2)],
+    4: [(0, 2), (1, 3), (0, 1), (2, 3), (1, 2)],
+    5: [(0, 3), (1, 4), (0, 2), (1, 3), (0, 1), (2, 4), (1, 2), (3, 4), (2, 3)],
+    6: [(0, 5), (1, 3), (2, 4), (1, 2), (3, 4), (0, 3), (2, 5), (0, 1), (2, 3), (4, 5),
+        (1, 2), (3, 4)],
+    7: [(0, 6), (2, 3), (4, 5), (0, 2), (1, 4), (3, 6), (0, 1), (2, 5), (3, 4), (1, 2),
+        (4, 6), (2, 3), (4, 5), (1, 2), (3, 4), (5, 6)],
+    8: [(0, 2), (1, 3), (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7), (0, 1), (2, 3),
+        (4, 5), (6, 7), (2, 4), (3, 5), (1, 4), (3, 6), (1, 2), (3, 4), (5, 6)],
+    9: [(0, 3), (1, 7), (2, 5), (4, 8), (0, 7), (2, 4), (3, 8), (5, 6), (0, 2), (1, 3),
+        (4, 5), (7, 8), (1, 4), (3, 6), (5, 7), (0, 1), (2, 4), (3, 5), (6, 8), (2, 3),
+        (4, 5), (6, 7), (1, 2), (3, 4), (5, 6)],
+    10: [(0, 8), (1, 9), (2, 7), (3, 5), (4, 6), (0, 2), (1, 4), (5, 8), (7, 9), (0, 3),
+         (2, 4), (5, 7), (6, 9), (0, 1), (3, 6), (8, 9), (1, 5), (2, 3), (4, 8), (6, 7),
+         (1, 2), (3, 5), (4, 6), (7, 8), (2, 3), (4, 5), (6, 7), (3, 4), (5, 6)],
+    11: [(0, 9), (1, 6), (2, 4), (3, 7), (5, 8), (0, 1), (3, 5), (4, 10), (6, 9), (7, 8),
+         (1, 3), (2, 5), (4, 7), (8, 10), (0, 4), (1, 2), (3, 7), (5, 9), (6, 8), (0, 1),
+         (2, 6), (4, 5), (7, 8), (9, 10), (2, 4), (3, 6), (5, 7), (8, 9), (1, 2), (3, 4),
+         (5, 6), (7, 8), (2, 3), (4, 5), (6, 7)],
+    16: GREEN_16,
+}
+for _n in range(12, 16):
+    NETWORKS[_n] = [(i, j) for i, j in GREEN_16 if j < _n]
+
+# leaf sizes picked by threshold_sweep (see performance())
+MERGE_THRESHOLD = 48
+QUICK_THRESHOLD = 16
+
+
+def verify_network(n, comparators=None):
+    """0-1 principle: a network sorts every input iff it sorts all 2**n bit vectors"""
+    comparators = NETWORKS[n] if comparators is None else comparators
+    for bits in range(1 << n):
+        v = [(bits >> i) & 1 for i in range(n)]
+        for i, j in comparators:
+            if v[j] < v[i]:
+                v[i], v[j] = v[j], v[i]
+        if any(v[i + 1] < v[i] for i in range(n - 1)):
+            return False
+    return True
+
+
+def generate_network_sorter(n):
+    """
+    Source of sort{n}(arr, lo): load n values into locals, run the comparators
+    unrolled (only < is used), store them back with one slice assignment.
+    """
+    names = ", ".join(f"a{i}" for i in range(n))
+    lines = [f"def sort{n}(arr, lo):",
+             f"    {names} = arr[lo:lo + {n}]"]
+    for i, j in NETWORKS[n]:
+        lines.append(f"    if a{j} < a{i}: a{i}, a{j} = a{j}, a{i}")
+    lines.append(f"    arr[lo:lo + {n}] = {names}")
+    return "\n".join(lines) + "\n"
+
+
+def build_network_sorters():
+    sorters = [None, None]
+    for n in range(2, 17):
+        namespace = {}
+        exec(generate_network_sorter(n), namespace)
+        sorters.append(namespace[f"sort{n}"])
+    return sorters
+
+
+NETWORK_SORTERS = build_network_sorters()
+
+
+def network_sort(arr, low, high):
+    """Sort arr[low..high] (at most 16 elements) with its sorting network. Not stable."""
+    n = high - low + 1
+    if n > 1:
+        NETWORK_SORTERS[n](arr, low)
+
+
+def binary_insertion_sort(arr, low, high, start=None):
+    """
+    Stable insertion sort of arr[low..high]: bisect_right finds the slot in
+    O(log n) comparisons and one slice assignment shifts the tail.
+    A caller that knows arr[low:start] is already sorted passes start to skip that prefix.
+    """
+    for i in range(low + 1 if start is None else max(start, low + 1), high + 1):
+        x = arr[i]
+        if not x < arr[i - 1]:
+            continue
+        pos = bisect_right(arr, x, low, i)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = x
+
+
+def small_sort(arr, low, high):
+    """Leaf kernel for unstable sorts: network up to 16 elements, binary insertion above"""
+    n = high - low + 1
+    if n <= 16:
+        if n > 1:
+            NETWORK_SORTERS[n](arr, low)
+    else:
+        binary_insertion_sort(arr, low, high)
+
+
+def linear_insertion_sort(arr, low, high):
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def threshold_sweep(sort_func, thresholds, n=20000, repeats=5):
+    """Median ms of sort_func(arr, 0, n - 1, threshold) for every threshold"""
+    datasets = [[random.randint(1, 1_000_000) for _ in range(n)] for _ in range(repeats)]
+    times = []
+    for threshold in thresholds:
+        times.append(measure_ms(lambda arr: sort_func(arr, 0, n - 1, threshold), fresh_copies(datasets)))
+    return times
+
+
+def performance():
+    from mergeSort import mergeSortOptimized
+    from quickSort import quickSortOptimized
+
+    print("\n=== SORTING NETWORKS (0-1 principle) ===")
+    for n in range(2, 17):
+        print(f"n = {n:<3} comparators = {len(NETWORKS[n]):<3} valid = {verify_network(n)}")
+
+    sizes = list(range(2, 17)) + [24, 32, 48, 64]
+    inputs = 200
+    kernels = {"Linear insertion": linear_insertion_sort,
+               "Binary insertion": binary_insertion_sort,
+               "Network / binary": small_sort}
+    kernel_times = {name: [] for name in kernels}
+    header = "n     " + "  ".join(f"{name:>18}" for name in kernels)
+    print(f"\n=== LEAF KERNELS (us per array, median over {inputs} random arrays) ===")
+    print(header)
+    print("-" * len(header))
+    for size in sizes:
+        datasets = [[random.randint(1, 1_000_000) for _ in range(size)] for _ in range(inputs)]
+        for name, kernel in kernels.items():
+            elapsed = measure_ms(lambda arr: kernel(arr, 0, size - 1), fresh_copies(datasets))
+            kernel_times[name].append(elapsed * 1000)
+        print(f"{size:<5} " + "  ".join(f"{kernel_times[name][-1]:>18.3f}" for name in kernels))
+
+    thresholds = [4, 8, 12, 16, 24, 32, 48, 64]
+    sweeps = {
+        "mergeSortOptimized": lambda arr, low, high, t: mergeSortOptimized(arr, low, high, t),
+        "quickSortOptimized": lambda arr, low, high, t: quickSortOptimized(arr, low, high, t),
+    }
+    sweep_times = {}
+    print("\n=== THRESHOLD SWEEP (n = 20000, median, ms) ===")
+    header = "threshold  " + "  ".join(f"{name:>20}" for name in sweeps)
+    print(header)
+    print("-" * len(header))
+    for name, func in sweeps.items():
+        sweep_times[name] = threshold_sweep(func, thresholds)
+    for i, threshold in enumerate(thresholds):
+        print(f"{threshold:<10} " + "  ".join(f"{sweep_times[name][i]:>20.3f}" for name in sweeps))
+    for name, times in sweep_times.items():
+        print(f"best threshold for {name}: {thresholds[times.index(min(times))]}")
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    styles = {"Linear insertion": ("o", "-", "gray"), "Binary insertion": ("s", "--", "blue"),
+              "Network / binary": ("^", "--", "red")}
+    for name, times in kernel_times.items():
+        marker, linestyle, color = styles[name]
+        axes[0].plot(sizes, times, marker=marker, linestyle=linestyle, color=color,
+            label=name, linewidth=2, markersize=6)
+    axes[0].set_title("Leaf Kernels")
+    axes[0].set_xlabel("Array Size (n)")
+    axes[0].set_ylabel("Time per Array (us)")
+    axes[0].legend()
+    axes[0].grid(True)
+
+    for (name, times), color in zip(sweep_times.items(), ["cyan", "green"]):
+        axes[1].plot(thresholds, times, marker="o", linestyle="-", color=color,
+            label=name, linewidth=2, markersize=6)
+    axes[1].set_title("Leaf Threshold Sweep (n = 20000)")
+    axes[1].set_xlabel("Threshold")
+    axes[1].set_ylabel("Execution Time (ms)")
+    axes[1].legend()
+    axes[1].grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
@@ -0,0 +1,174 @@
+import random
+from operator import lt
+import matplotlib.pyplot as plt
+import numpy as np
+from quickSort import introSort, quickSortOptimized
+from adaptiveMergeSort import adaptiveMergeSort
+from radixSort import linearSort, counting_sorted, counting_range_ok, write_back, SMALL_N, COUNTING_MIN_RANGE
+from smallSort import binary_insertion_sort, small_sort
+from keySort import sort_by_key
+from labtiming import measure_ms, fresh_copies
+
+# up to this size a sorting network costs less than taking the sample
+TINY_N = 16
+# from this size NumPy counting sort beats quickSortOptimized on small-range ints
+COUNTING_MIN_N = 64
+# probes per estimate: adjacent pairs for run structure, values for type and range
+SAMPLE_SIZE = 64
+# a sample with at most this fraction of descents (or ascents) counts as presorted
+PRESORTED_RATIO = 0.15
+
+sampler = random.Random(0x5EED)
+
+
+def sample_profile(arr, samples=SAMPLE_SIZE):
+    """
+    Estimate the shape of arr from O(samples) probes, never a full pass.
+    Probes are adjacent pairs taken with a stride of n // samples from a random offset:
+    - descents / ascents: fraction of sampled adjacent pairs that go down / up
+    - lo, hi: sampled key range (a lower bound on the true range)
+    - kind: "int", "float" or "other" from the sampled types
+    """
+    n = len(arr)
+    step = max(1, n // samples)
+    offset = sampler.randrange(step) if step > 1 else 0
+    firsts = arr[offset:n - 1:step]
+    seconds = arr[offset + 1:n:step]
+    descents = sum(map(lt, seconds, firsts))
+    ascents = sum(map(lt, firsts, seconds))
+    pairs = max(1, len(firsts))
+
+    values = firsts
+    types = set(map(type, values))
+    if types <= {int}:
+        kind = "int"
+    elif types <= {int, float}:
+        kind = "float"
+    else:
+        kind = "other"
+    lo = min(values) if values and kind != "other" else None
+    hi = max(values) if values and kind != "other" else None
+
+    return {"n": n, "kind": kind, "descents": descents / pairs, "ascents": ascents / pairs,
+            "lo": lo, "hi": hi}
+
+
+def choose_algorithm(profile):
+    """
+    Decision table, calibrated on comparison.INPUT_TYPES (best-of timings, n = 16..10000):
+      n <= TINY_N                          -> Sorting Network (no sampling at all)
+      numeric, n >= SMALL_N                -> Linear Dispatch (NumPy counting/radix, 5-20x faster)
+      presorted ascending, n < SMALL_N     -> Binary Insertion (n - 1 comparisons when sorted)
+      presorted ascending or descending    -> Adaptive Merge Sort (run detection)
+      int, n >= COUNTING_MIN_N, small range -> Counting Sort
+      otherwise                            -> Introsort (network leaves like quickSortOptimized, but
+                                              3-way partition and a heapsort fallback bound it at
+                                              O(n log n); quickSortOptimized goes quadratic on 10
+                                              distinct keys, and a sample cannot rule duplicates out)
+    """
+    n = profile["n"]
+    if n <= TINY_N:
+        return "Sorting Network"
+    numeric = profile["kind"] != "other"
+    presorted = profile["descents"] <= PRESORTED_RATIO
+    descending = profile["ascents"] <= PRESORTED_RATIO
+    if numeric and n >= SMALL_N:
+        return "Linear Dispatch"
+    if presorted and n < SMALL_N:
+        return "Binary Insertion"
+    if presorted or descending:
+        return "Adaptive Merge Sort"
+    if (profile["kind"] == "int" and n >= COUNTING_MIN_N
+            and profile["hi"] - profile["lo"] <= COUNTING_MIN_RANGE):
+        return "Counting Sort"
+    return "Introsort"
+
+
+def counting_backend(arr):
+    """Counting sort after checking the exact range (the sampled one is only a lower bound)"""
+    values = np.asarray(arr)
+    if values.dtype.kind in "iu":
+        lo, hi = int(values.min()), int(values.max())
+        if counting_range_ok(lo, hi, len(arr)):
+            write_back(arr, counting_sorted(values, lo, hi))
+            return
+    introSort(arr, 0, len(arr) - 1)
+
+
+BACKENDS = {
+    "Sorting Network": lambda arr: small_sort(arr, 0, len(arr) - 1),
+    "Linear Dispatch": linearSort,
+    "Binary Insertion": lambda arr: binary_insertion_sort(arr, 0, len(arr) - 1),
+    "Adaptive Merge Sort": adaptiveMergeSort,
+    "Counting Sort": counting_backend,
+    "Introsort": lambda arr: introSort(arr, 0, len(arr) - 1),
+    "Quick Sort Optimized": lambda arr: quickSortOptimized(arr, 0, len(arr) - 1),
+}
+
+
+def plan(arr):
+    """(backend name, profile) that smart_sort would use for arr"""
+    profile = sample_profile(arr)
+    return choose_algorithm(profile), profile
+
+
+def smart_sort(arr, key=None, reverse=False):
+    """Sort arr in place with the backend chosen from a sublinear sample of the input"""
+    if key is not None or reverse:
+        sort_by_key(smart_sort, arr, 0, len(arr) - 1, key, reverse)
+        return
+    n = len(arr)
+    if n <= TINY_N:
+        small_sort(arr, 0, n - 1)
+        return
+    name, _ = plan(arr)
+    BACKENDS[name](arr)
+
+
+def performance():
+    from comparison import INPUT_TYPES
+    test_sizes = [16, 64, 256, 1000, 10000]
+    repeats = 5
+
+    print("\n=== SMART SORT: CHOICE vs BEST BACKEND (median, ms) ===")
+    header = f"{'input':<20} {'n':>6}  {'choice':<21} {'smart':>8}  {'best':<21} {'best ms':>8}  {'plan %':>6}"
+    print(header)
+    print("-" * len(header))
+    wins = total = 0
+    ratios = {}
+    for input_name, generator in INPUT_TYPES.items():
+        ratios[input_name] = []
+        for size in test_sizes:
+            datasets = [generator(size) for _ in range(repeats)]
+            backend_times = {}
+            for name, backend in BACKENDS.items():
+                if (name == "Binary Insertion" and size > 1000) or (name == "Sorting Network" and size > 16):
+                    continue
+                backend_times[name] = measure_ms(backend, fresh_copies(datasets))
+            plan_ms = measure_ms(plan, fresh_copies(datasets)) if size > TINY_N else 0.0
+            smart_ms = measure_ms(smart_sort, fresh_copies(datasets))
+            choice, _ = plan(datasets[0])
+            best_name = min(backend_times, key=backend_times.get)
+            total += 1
+            wins += choice == best_name or smart_ms <= 1.1 * backend_times[best_name]
+            ratios[input_name].append(smart_ms / backend_times[best_name])
+            print(f"{input_name:<20} {size:>6}  {choice:<21} {smart_ms:>8.3f}  {best_name:<21}"
+                  f" {backend_times[best_name]:>8.3f}  {100 * plan_ms / smart_ms:>5.1f}%")
+    print(f"\nwin rate (choice is fastest, or within 10% of it): {wins}/{total} = {100 * wins / total:.0f}%")
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    for input_name, input_ratios in ratios.items():
+        ax.plot(test_sizes, input_ratios, marker="o", linewidth=2, label=input_name)
+    ax.axhline(1.0, color="gray", linestyle="--")
+    ax.set_xscale("log")
+    ax.set_title("Smart Sort Time / Best Backend Time")
+    ax.set_xlabel("Array Size (n)")
+    ax.set_ylabel("Ratio (1 = optimal choice)")
+    ax.legend()
+    ax.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
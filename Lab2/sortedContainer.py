@@ -0,0 +1,250 @@
+import heapq
+import random
+from bisect import bisect_left, bisect_right, insort
+from itertools import cycle
+import matplotlib.pyplot as plt
+from mergeSort import mergeOptimized, mergeSortOptimized
+from quickSort import quickSortOptimized
+from labtiming import measure_ms
+
+BUFFER_SIZE = 256
+
+
+class LSMSortedList:
+    """
+    Sorted multiset maintained like a log-structured merge tree.
+    New values land in a small unsorted buffer. A full buffer is sorted
+    (quickSortOptimized) into a run, and runs are kept largest-first with
+    every run more than twice the size of the next one: when a new run breaks that,
+    the two youngest runs are merged with mergeOptimized, cascading like a binary counter.
+    Each value is merged O(log n) times; there are O(log n) runs to search.
+    Reads flush the buffer first, so lookups only bisect sorted runs.
+    """
+
+    def __init__(self, values=(), buffer_size=BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.runs = []
+        self.size = 0
+        for v in values:
+            self.add(v)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, value):
+        self.buffer.append(value)
+        self.size += 1
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def update(self, values):
+        for v in values:
+            self.add(v)
+
+    def flush(self):
+        """Sort the buffer into a new run and restore the run-size invariant"""
+        if not self.buffer:
+            return
+        run = self.buffer
+        self.buffer = []
+        quickSortOptimized(run, 0, len(run) - 1)
+        runs = self.runs
+        runs.append(run)
+        while len(runs) > 1 and len(runs[-2]) <= 2 * len(runs[-1]):
+            newer = runs.pop()
+            older = runs.pop()
+            merged = older + newer
+            if older[-1] > newer[0]:
+                mergeOptimized(merged, 0, len(older) - 1, len(merged) - 1)
+            runs.append(merged)
+
+    def compact(self):
+        """Merge everything into a single run (e.g. before a read-heavy phase)"""
+        self.flush()
+        runs = self.runs
+        while len(runs) > 1:
+            newer = runs.pop()
+            older = runs.pop()
+            merged = older + newer
+            if older[-1] > newer[0]:
+                mergeOptimized(merged, 0, len(older) - 1, len(merged) - 1)
+            runs.append(merged)
+
+    # ── lookups: flush first, then one bisect per run ─────────────────────────
+    def __contains__(self, value):
+        self.flush()
+        for run in self.runs:
+            i = bisect_left(run, value)
+            if i < len(run) and run[i] == value:
+                return True
+        return False
+
+    def count(self, value):
+        return self.count_range(value, value)
+
+    def rank(self, value):
+        """Number of stored values strictly smaller than value"""
+        self.flush()
+        total = 0
+        for run in self.runs:
+            total += bisect_left(run, value)
+        return total
+
+    def count_range(self, lo, hi):
+        """Number of stored values v with lo <= v <= hi, without materializing them"""
+        self.flush()
+        total = 0
+        for run in self.runs:
+            total += bisect_right(run, hi) - bisect_left(run, lo)
+        return total
+
+    def irange(self, lo=None, hi=None):
+        """
+        Lazy ascending iterator over lo <= v <= hi (None = unbounded).
+        Each run contributes a lazy iterator over its bisected index range and heapq.merge
+        interleaves them, so a scan costs O(log n + k) and nothing is copied.
+        Do not add values while iterating.
+        """
+        self.flush()
+        sources = []
+        for run in self.runs:
+            start = 0 if lo is None else bisect_left(run, lo)
+            end = len(run) if hi is None else bisect_right(run, hi)
+            if start < end:
+                sources.append(map(run.__getitem__, range(start, end)))
+        if len(sources) == 1:
+            return sources[0]
+        return heapq.merge(*sources)
+
+    def __iter__(self):
+        return self.irange()
+
+
+# ── baselines behind the same small interface ────────────────────────────────
+class ResortList:
+    """Append each batch, then re-run mergeSortOptimized on the whole list"""
+
+    def __init__(self):
+        self.items = []
+
+    def update(self, values):
+        self.items.extend(values)
+        mergeSortOptimized(self.items, 0, len(self.items) - 1)
+
+    def count_range(self, lo, hi):
+        return bisect_right(self.items, hi) - bisect_left(self.items, lo)
+
+    def irange(self, lo, hi):
+        items = self.items
+        return map(items.__getitem__, range(bisect_left(items, lo), bisect_right(items, hi)))
+
+
+class InsortList:
+    """bisect.insort per value: O(log n) search, O(n) memmove per insert"""
+
+    def __init__(self):
+        self.items = []
+
+    def update(self, values):
+        items = self.items
+        for v in values:
+            insort(items, v)
+
+    def count_range(self, lo, hi):
+        return bisect_right(self.items, hi) - bisect_left(self.items, lo)
+
+    def irange(self, lo, hi):
+        items = self.items
+        return map(items.__getitem__, range(bisect_left(items, lo), bisect_right(items, hi)))
+
+
+CONTAINERS = {
+    "LSM sorted list": LSMSortedList,
+    "Re-sort per batch": ResortList,
+    "bisect.insort": InsortList,
+}
+
+
+def workload(container, values, batch, queries_per_batch, span):
+    """Insert values in batches; after each batch run range scans of width span"""
+    for start in range(0, len(values), batch):
+        container.update(values[start:start + batch])
+        for _ in range(queries_per_batch):
+            lo = random.randint(0, 1_000_000 - span)
+            for _ in container.irange(lo, lo + span):
+                pass
+
+
+def performance():
+    test_sizes = [10000, 50000, 100000]
+    batch = 1000
+    repeats = 3
+    styles = {"LSM sorted list": ("o", "-", "red"), "Re-sort per batch": ("s", "--", "blue"),
+              "bisect.insort": ("^", "--", "green")}
+    scenarios = {
+        "Insert only (inserts/s)": dict(queries_per_batch=0, span=0),
+        "Insert + 5 range scans per batch (total ms)": dict(queries_per_batch=5, span=5000),
+    }
+    results = {}
+
+    for scenario, params in scenarios.items():
+        header = "n        " + "  ".join(f"{name:>18}" for name in CONTAINERS)
+        print(f"\n=== {scenario.upper()} (batches of {batch}, median) ===")
+        print(header)
+        print("-" * len(header))
+        values_per_run = {size: [[random.randint(0, 1_000_000) for _ in range(size)]
+                                 for _ in range(repeats)] for size in test_sizes}
+        scenario_results = {name: [] for name in CONTAINERS}
+        for size in test_sizes:
+            for name, make in CONTAINERS.items():
+                source = cycle(values_per_run[size])
+                median_ms = measure_ms(lambda container, values: workload(container, values, batch, **params),
+                                       lambda: (make(), next(source)))
+                if params["queries_per_batch"] == 0:
+                    scenario_results[name].append(size / (median_ms / 1000))
+                else:
+                    scenario_results[name].append(median_ms)
+            print(f"{size:<8} " + "  ".join(f"{scenario_results[name][-1]:>18,.1f}" for name in CONTAINERS))
+        results[scenario] = scenario_results
+
+    # point queries on a fully loaded container
+    size, lookups = 100000, 20000
+    values = [random.randint(0, 1_000_000) for _ in range(size)]
+    probes = [random.randint(0, 1_000_000) for _ in range(lookups)]
+    print(f"\n=== RANGE COUNT QUERIES (n = {size}, {lookups} queries, queries/s) ===")
+    query_rates = {}
+    for name, make in CONTAINERS.items():
+        container = make()
+        container.update(values)
+        container.count_range(0, 1)  # flush the LSM buffer
+        median_ms = measure_ms(lambda: [container.count_range(lo, lo + 1000) for lo in probes])
+        query_rates[name] = lookups / (median_ms / 1000)
+        print(f"  {name:<20} {query_rates[name]:>14,.0f}")
+    lsm = LSMSortedList(values)
+    print(f"  (LSM holds {len(lsm.runs)} runs + {len(lsm.buffer)} buffered values)")
+
+    fig, axes = plt.subplots(1, len(scenarios) + 1, figsize=(20, 5))
+    for ax, (scenario, scenario_results) in zip(axes, results.items()):
+        for name, series in scenario_results.items():
+            marker, linestyle, color = styles[name]
+            ax.plot(test_sizes, series, marker=marker, linestyle=linestyle, color=color,
+                label=name, linewidth=2, markersize=7)
+        ax.set_title(scenario)
+        ax.set_xlabel("Values inserted (n)")
+        ax.legend()
+        ax.grid(True)
+    axes[0].set_ylabel("Inserts per second")
+    axes[1].set_ylabel("Execution Time (ms)")
+    axes[-1].bar(list(query_rates), list(query_rates.values()),
+                 color=[styles[name][2] for name in query_rates])
+    axes[-1].set_title(f"Range Count Queries (n = {size})")
+    axes[-1].set_ylabel("Queries per second")
+    axes[-1].grid(True, axis="y")
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
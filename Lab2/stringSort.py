@@ -0,0 +1,189 @@
+import matplotlib.pyplot as plt
+from os.path import commonprefix
+from quickSort import introSort
+from smallSort import binary_insertion_sort
+from labtiming import measure_ms, fresh_copies
+
+# segments up to this size are finished by binary insertion; the strings in a segment
+# share a d-character prefix, so a full comparison there is one memcmp
+MSD_CUTOFF = 64
+MULTIKEY_CUTOFF = 64
+
+
+def sort_by_string_key(sort_func, arr, key, reverse):
+    """
+    Group arr by key (evaluated once per element), sort the distinct keys with sort_func
+    and concatenate the groups. Groups keep input order, so the result is stable
+    also with reverse=True.
+    """
+    groups = {}
+    for v in arr:
+        k = v if key is None else key(v)
+        group = groups.get(k)
+        if group is None:
+            groups[k] = [v]
+        else:
+            group.append(v)
+    keys = list(groups)
+    sort_func(keys)
+    if reverse:
+        keys.reverse()
+    arr[:] = [v for k in keys for v in groups[k]]
+
+
+def msdRadixSort(arr, key=None, reverse=False):
+    """
+    Stable MSD radix sort for lists of str or bytes.
+    A segment whose strings share their first d characters is split into one bucket per
+    character at position d (strings that end there come first); buckets are written back in
+    character order and every bucket but the ended one is sorted further. A large bucket is
+    pushed with d set to the common prefix of the bucket (found from its min and max, a C
+    speed scan), so shared prefixes such as URL hosts cost one pass instead of one per character.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    if key is not None or reverse:
+        sort_by_string_key(msdRadixSort, arr, key, reverse)
+        return
+    stack = [(0, n, 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= MSD_CUTOFF:
+            binary_insertion_sort(arr, lo, hi - 1)
+            continue
+        buckets = {}
+        for s in arr[lo:hi]:
+            c = s[d:d + 1]
+            bucket = buckets.get(c)
+            if bucket is None:
+                buckets[c] = [s]
+            else:
+                bucket.append(s)
+        if len(buckets) == 1:
+            if next(iter(buckets)):
+                segment = arr[lo:hi]
+                stack.append((lo, hi, len(commonprefix([min(segment), max(segment)]))))
+            continue
+        chars = list(buckets)
+        introSort(chars, 0, len(chars) - 1)
+        for c in chars:
+            bucket = buckets[c]
+            end = lo + len(bucket)
+            arr[lo:end] = bucket
+            if c and len(bucket) > MSD_CUTOFF:
+                stack.append((lo, end, len(commonprefix([min(bucket), max(bucket)]))))
+            elif c and len(bucket) > 1:
+                binary_insertion_sort(arr, lo, end - 1)
+            lo = end
+
+
+def multikeyQuickSort(arr, key=None, reverse=False):
+    """
+    Bentley-Sedgewick multikey quicksort (3-way radix quicksort) for lists of str or bytes.
+    Partitions on the d-th character only, around the median of three characters:
+    < pivot and > pivot stay at depth d, = pivot continues past the common prefix of its group
+    (unless the pivot is the end of the string). Equal prefixes are never compared twice.
+    The three groups are collected in one pass and written back as slices, which is several
+    times faster in Python than index swapping and keeps the sort stable.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    if key is not None or reverse:
+        sort_by_string_key(multikeyQuickSort, arr, key, reverse)
+        return
+    stack = [(0, n - 1, 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo < MULTIKEY_CUTOFF:
+            binary_insertion_sort(arr, lo, hi)
+            continue
+        a, b, c = arr[lo][d:d + 1], arr[(lo + hi) // 2][d:d + 1], arr[hi][d:d + 1]
+        if b < a:
+            a, b = b, a
+        pivot = b if b < c else (c if a < c else a)
+
+        less, equal, greater = [], [], []
+        for s in arr[lo:hi + 1]:
+            ch = s[d:d + 1]
+            if ch < pivot:
+                less.append(s)
+            elif pivot < ch:
+                greater.append(s)
+            else:
+                equal.append(s)
+        lt = lo + len(less)
+        gt = lt + len(equal) - 1
+        arr[lo:lt] = less
+        arr[lt:gt + 1] = equal
+        arr[gt + 1:hi + 1] = greater
+
+        if len(less) > 1:
+            stack.append((lo, lt - 1, d))
+        if len(greater) > 1:
+            stack.append((gt + 1, hi, d))
+        if pivot and len(equal) > MULTIKEY_CUTOFF:
+            stack.append((lt, gt, len(commonprefix([min(equal), max(equal)]))))
+        elif pivot and len(equal) > 1:
+            stack.append((lt, gt, d + 1))
+
+
+def cutoff_sweep(sort_func, setter, cutoffs, generator, n=20000, repeats=3):
+    """Median time (ms) of sort_func on generator(n) for each leaf cutoff set through setter"""
+    datasets = [generator(n) for _ in range(repeats)]
+    times = []
+    for cutoff in cutoffs:
+        setter(cutoff)
+        times.append(measure_ms(sort_func, fresh_copies(datasets)))
+    return times
+
+
+def performance():
+    global MSD_CUTOFF, MULTIKEY_CUTOFF
+    from comparison import STRING_INPUT_TYPES
+
+    cutoffs = [8, 16, 32, 64, 128, 256]
+    defaults = MSD_CUTOFF, MULTIKEY_CUTOFF
+
+    def set_msd(cutoff):
+        global MSD_CUTOFF
+        MSD_CUTOFF = cutoff
+
+    def set_multikey(cutoff):
+        global MULTIKEY_CUTOFF
+        MULTIKEY_CUTOFF = cutoff
+
+    sorts = {"MSD Radix Sort": (msdRadixSort, set_msd), "Multikey Quicksort": (multikeyQuickSort, set_multikey)}
+    results = {}
+    header = f"{'input / cutoff':<22}" + "".join(f"{c:>10}" for c in cutoffs)
+    try:
+        for sort_name, (sort_func, setter) in sorts.items():
+            print(f"\n=== {sort_name.upper()}: INSERTION CUTOFF SWEEP (n = 20000, median, ms) ===")
+            print(header)
+            print("-" * len(header))
+            results[sort_name] = {}
+            for input_name, generator in STRING_INPUT_TYPES.items():
+                times = cutoff_sweep(sort_func, setter, cutoffs, generator)
+                results[sort_name][input_name] = times
+                print(f"{input_name:<22}" + "".join(f"{t:>10.2f}" for t in times))
+    finally:
+        MSD_CUTOFF, MULTIKEY_CUTOFF = defaults
+
+    fig, axes = plt.subplots(1, len(sorts), figsize=(16, 5))
+    for ax, (sort_name, by_input) in zip(axes, results.items()):
+        for input_name, times in by_input.items():
+            ax.plot(cutoffs, times, marker="o", linewidth=2, label=input_name)
+        ax.set_xscale("log", base=2)
+        ax.set_title(f"{sort_name}: Insertion Cutoff (n = 20000)")
+        ax.set_xlabel("Cutoff (segment size)")
+        ax.set_ylabel("Execution Time (ms)")
+        ax.legend()
+        ax.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    performance()
@@ -0,0 +1,151 @@
+import gc
+import copy
+import math
+from itertools import cycle
+import statistics
+from time import perf_counter
+
+# a timed batch must last at least this long (s) for timer resolution to be negligible
+MIN_BATCH_TIME = 1e-3
+MAX_NUMBER = 1 << 20
+MIN_RUNS = 3
+MAX_RUNS = 25
+# stop repeating once the 95% CI of the median is within this fraction of it
+REL_CI = 0.05
+# after MIN_RUNS, stop adding runs once a measurement has used this much time (s)
+MAX_TIME = 0.5
+# Tukey fences: samples beyond Q1 - k*IQR or Q3 + k*IQR are rejected as outliers
+OUTLIER_K = 1.5
+Z_95 = 1.96
+
+STATS_HEADER = f"{'median(ms)':>11} {'iqr(ms)':>10} {'runs':>5}"
+
+
+def no_args():
+    return ()
+
+
+def noop(*args):
+    pass
+
+
+def fresh_copies(datasets):
+    """setup for in-place algorithms: every call gets a copy of the next dataset, round robin"""
+    source = cycle(datasets)
+    return lambda: (copy.copy(next(source)),)
+
+
+def time_batch(func, setup, number):
+    """
+    Seconds for number calls of func. Arguments for every call are built by setup()
+    before the clock starts, so in-place algorithms always get a fresh input.
+    """
+    batch = [setup() for _ in range(number)]
+    start = perf_counter()
+    for args in batch:
+        func(*args)
+    return perf_counter() - start
+
+
+def autorange(func, setup):
+    """
+    Smallest number of calls (1, 2, 5, 10, 20, 50, ...) per batch lasting MIN_BATCH_TIME.
+    The probe batches double as warm-up: caches, allocator pools and the specializing
+    interpreter have seen func before the first sample is taken.
+    """
+    number = 1
+    while number < MAX_NUMBER:
+        for factor in (1, 2, 5):
+            if time_batch(func, setup, number * factor) >= MIN_BATCH_TIME:
+                return number * factor
+        number *= 10
+    return MAX_NUMBER
+
+
+def loop_overhead(setup, number, trials=5):
+    """Timer + loop + call cost of one batch, calibrated with a no-op function (best of trials)"""
+    return min(time_batch(noop, setup, number) for _ in range(trials))
+
+
+def reject_outliers(samples):
+    """(kept, rejected count) after Tukey's fences; fewer than 4 samples are all kept"""
+    if len(samples) < 4:
+        return list(samples), 0
+    q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    low, high = q1 - OUTLIER_K * (q3 - q1), q3 + OUTLIER_K * (q3 - q1)
+    kept = [s for s in samples if low <= s <= high]
+    return kept, len(samples) - len(kept)
+
+
+def median_ci(samples):
+    """
+    Half-width of a distribution-free 95% confidence interval of the median,
+    from the order statistics n/2 -+ 1.96 sqrt(n)/2. Infinite below 6 samples.
+    """
+    n = len(samples)
+    if n < 6:
+        return math.inf
+    ordered = sorted(samples)
+    spread = Z_95 * math.sqrt(n) / 2
+    lo = max(0, math.floor(n / 2 - spread))
+    hi = min(n - 1, math.ceil(n / 2 + spread) - 1)
+    return (ordered[hi] - ordered[lo]) / 2
+
+
+def summarize(samples, number):
+    """Statistics of per-call samples (s) in ms"""
+    kept, rejected = reject_outliers(samples)
+    ms = [s * 1000 for s in kept]
+    if len(ms) > 1:
+        q1, median, q3 = statistics.quantiles(ms, n=4, method="inclusive")
+    else:
+        q1 = median = q3 = ms[0]
+    return {"median": median, "iqr": q3 - q1, "ci": median_ci(ms), "runs": len(ms),
+            "rejected": rejected, "number": number, "samples": ms}
+
+
+def measure(func, setup=no_args, min_runs=MIN_RUNS, max_runs=MAX_RUNS, rel_ci=REL_CI,
+            max_time=MAX_TIME):
+    """
+    Time func(*setup()) and return per-call statistics in ms:
+    {"median", "iqr", "ci", "runs", "rejected", "number", "samples"}.
+    - warm-up and autoranging: batches of `number` calls, long enough to time accurately
+    - the loop overhead of a batch is calibrated with a no-op and subtracted
+    - the garbage collector is collected once and disabled while timing
+    - runs are added until the median's 95% CI half-width is within rel_ci of the median,
+      or after min_runs once max_time is used up, or at max_runs
+    - median and IQR are taken after rejecting outliers (Tukey's fences)
+    Exceptions from func propagate (with the collector re-enabled).
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        start = perf_counter()
+        number = autorange(func, setup)
+        overhead = loop_overhead(setup, number)
+        samples = []
+        while len(samples) < max_runs:
+            elapsed = time_batch(func, setup, number) - overhead
+            samples.append(max(elapsed, 0.0) / number)
+            if len(samples) < min_runs:
+                continue
+            kept, _ = reject_outliers(samples)
+            if median_ci(kept) <= rel_ci * statistics.median(kept):
+                break
+            if perf_counter() - start >= max_time:
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return summarize(samples, number)
+
+
+def measure_ms(func, setup=no_args, **options):
+    """Median per-call time of func(*setup()) in ms (see measure)"""
+    return measure(func, setup, **options)["median"]
+
+
+def format_stats(stats):
+    """Table cells matching STATS_HEADER"""
+    return f"{stats['median']:>11.4f} {stats['iqr']:>10.4f} {stats['runs']:>5}"